@@ -15,32 +15,53 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from itertools import product
+from itertools import chain, product
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 try:
     import yaml  # type: ignore
 except ImportError:  # pragma: no cover
     sys.exit("Install PyYAML first: pip install pyyaml")
 
+from utils.yaml_cache import load_yaml
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
-    """Cartesian-product expansion of the parameter grid."""
+def expand_grid(grid: Dict[str, List[Any]]) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the Cartesian-product expansion of the parameter grid."""
     if not grid:
-        return [{}]
-    keys = list(grid.keys())
-    values = list(grid.values())
-    return [dict(zip(keys, combo)) for combo in product(*values)]
+        yield {}
+        return
+    keys = tuple(grid.keys())
+    for combo in product(*grid.values()):
+        yield dict(zip(keys, combo))
 
 
 META_KEYS = {"start", "end", "resolution", "fee"}
 
 
+def with_candle_window(feeds: Any, meta: Dict[str, Any]) -> Any:
+    """Return *feeds* with meta start/end filled into each candles_config entry lacking them."""
+    if not isinstance(feeds, list):
+        return feeds
+    window = {k: meta[m] for k, m in (("start_time", "start"), ("end_time", "end")) if meta.get(m)}
+    if not window:
+        return feeds
+    return [
+        {**feed, **{k: v for k, v in window.items() if k not in feed}} if isinstance(feed, dict) else feed
+        for feed in feeds
+    ]
+
+
 def build_payloads(
     base: Dict[str, Any],
     grid: Dict[str, List[Any]] | None,
@@ -53,15 +74,21 @@ def build_payloads(
     sweep = sweep or {}
     meta = meta or {}
 
-    variants: List[Dict[str, Any]] = []
-
-    # 1. Cartesian-product grid ------------------------------------------------
-    variants.extend(expand_grid(grid))  # returns [{}] if grid empty
-
-    # 2. Linear sweeps (vary one key at a time) --------------------------------
-    for key, values in sweep.items():
-        for v in (values or []):
-            variants.append({key: v})
+    # 1. Cartesian-product grid (yields {} if grid empty), then
+    # 2. linear sweeps (vary one key at a time) – both streamed, never materialised
+    variants = chain(
+        expand_grid(grid),
+        ({key: v} for key, values in sweep.items() for v in (values or [])),
+    )
+
+    # Per-payload invariants, split once instead of per variant
+    payload_meta = {k: v for k, v in meta.items() if k in META_KEYS}
+    cfg_meta = {k: v for k, v in meta.items() if k not in META_KEYS}
+    sweep_cols = list(grid.keys()) + list(sweep.keys())
+    # Propagate start/end into candles_config for robust data retrieval – once on
+    # base; only variants that override candles_config need it per combo
+    if "candles_config" in base:
+        base = {**base, "candles_config": with_candle_window(base["candles_config"], meta)}
 
     out: List[Dict[str, Any]] = []
     for idx, variant in enumerate(variants, 1):
@@ -83,14 +110,8 @@ def build_payloads(
                         equal = round(1.0 / len(spreads_list), 6)
                         cfg[amt_key] = [equal] * len(spreads_list)
 
-        # Propagate start/end into candles_config for robust data retrieval
-        if "candles_config" in cfg and isinstance(cfg["candles_config"], list):
-            for feed in cfg["candles_config"]:
-                if isinstance(feed, dict):
-                    if "start_time" not in feed and meta.get("start"):
-                        feed["start_time"] = meta["start"]
-                    if "end_time" not in feed and meta.get("end"):
-                        feed["end_time"] = meta["end"]
+        if "candles_config" in variant:
+            cfg["candles_config"] = with_candle_window(cfg["candles_config"], meta)
 
         # Validate spread/amount pairing – warn user if config is incomplete
         for s_key, a_key in (("buy_spreads", "buy_amounts_pct"), ("sell_spreads", "sell_amounts_pct")):
@@ -123,19 +144,14 @@ def build_payloads(
                     if amounts is not None:
                         cfg[a_key] = amounts
 
-        payload: Dict[str, Any] = {"config": cfg}
         # copy meta keys out; unknown meta items fall back into config
-        for k, v in meta.items():
-            if k in META_KEYS:
-                payload[k] = v
-            else:
-                cfg[k] = v
+        payload: Dict[str, Any] = {"config": cfg, **payload_meta}
+        cfg.update(cfg_meta)
 
         # Label for nicer reporting
         payload.setdefault("label", f"{cfg.get('controller_name','unknown')}_{idx}")
 
         # Embed sweep parameters so downstream scripts can write them to CSV
-        sweep_cols = list(grid.keys()) + list(sweep.keys())
         payload["_sweep_params"] = {k: cfg.get(k) for k in sweep_cols}
 
         # dman_maker_v2 requires list for activation_bounds
@@ -159,7 +175,7 @@ def main(argv: List[str] | None = None) -> None:
     ap.add_argument("--no-schema", action="store_true", help="Include no_schema flag in each payload so batch_tester skips schema validation")
     args = ap.parse_args(argv)
 
-    data = yaml.safe_load(Path(args.inp).read_text())
+    data = load_yaml(args.inp)
     base = data.get("base", {})
     grid = data.get("grid", {})
     sweep = data.get("sweep", {})
@@ -168,7 +184,7 @@ def main(argv: List[str] | None = None) -> None:
     # Optional meta overrides (same semantics as the legacy wrapper)
     if args.meta_file:
         try:
-            meta_override = yaml.safe_load(Path(args.meta_file).read_text()) or {}
+            meta_override = load_yaml(args.meta_file) or {}
         except Exception as exc:
             sys.exit(f"Could not read --meta-file {args.meta_file}: {exc}")
         for k, v in meta_override.items():
@@ -180,7 +196,11 @@ def main(argv: List[str] | None = None) -> None:
     if args.no_schema:
         meta = {**meta, "no_schema": True}
     payloads = build_payloads(base, grid, meta, sweep=sweep)
-    Path(args.out).write_text(json.dumps(payloads, indent=2, default=str))
+    if orjson is not None:
+        opts = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        Path(args.out).write_bytes(orjson.dumps(payloads, option=opts, default=str))
+    else:
+        Path(args.out).write_text(json.dumps(payloads, indent=2, default=str))
     print(f"Wrote {len(payloads)} payloads → {args.out}")
 
 
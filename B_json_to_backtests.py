@@ -40,11 +40,14 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Sequence
 
@@ -103,6 +106,9 @@ USERNAME: str = os.getenv("HB_USER", "admin")
 PASSWORD: str = os.getenv("HB_PASS", "admin")
 BLUEPRINT_PATH: str = os.getenv("HB_SCHEMA", "bots/hummingbot_files/schema/all_controller_configs.json")
 
+# Anything but letters, digits, '_' and '-' is replaced when a label becomes a file name
+LABEL_UNSAFE_RE = re.compile(r"[^\w-]")
+
 
 def to_timestamp(date_str: str) -> int:
     """YYYY-MM-DD -> unix ts (UTC midnight)."""
@@ -121,11 +127,22 @@ def wait_for_api(host: str = "localhost", port: int = 8000, timeout: int = 30) -
     raise RuntimeError("API not ready after %s s" % timeout)
 
 
+_THREAD_LOCAL = threading.local()
+
+
+def _session() -> requests.Session:
+    """Return this worker thread's HTTP session so its keep-alive connection is reused."""
+    sess = getattr(_THREAD_LOCAL, "session", None)
+    if sess is None:
+        sess = _THREAD_LOCAL.session = requests.Session()
+    return sess
+
+
 def run_backtest(body: Dict[str, Any], auth: HTTPBasicAuth, retries: int = 1) -> Dict[str, Any]:
     attempt = 0
     while True:
         try:
-            r = requests.post(f"{BASE_URL}/run-backtesting", json=body, auth=auth, timeout=1200)
+            r = _session().post(f"{BASE_URL}/run-backtesting", json=body, auth=auth, timeout=1200)
             try:
                 data = r.json()
             except ValueError:
@@ -145,10 +162,17 @@ def load_tests_from_file(path: str) -> List[TestPayload]:
     if path.endswith(('.yml', '.yaml')):
         if yaml is None:
             sys.exit("Install PyYAML to read YAML files.")
-        data = yaml.safe_load(raw_txt)
+        data = yaml.load(raw_txt, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     else:
         data = json.loads(raw_txt)
+    return load_tests_from_iterable(data)
+
 
+def load_tests_from_iterable(data: Any) -> List[TestPayload]:
+    """Build TestPayloads from already-parsed configs (list or single dict).
+
+    Entries are consumed in place – ``start``/``end``/``_sweep_params`` are popped.
+    """
     if isinstance(data, dict):
         # single block -> wrap in list
         data = [data]
@@ -290,6 +314,16 @@ def _normalize_blueprints(raw: dict) -> dict:
     return norm
 
 
+@lru_cache(maxsize=4)
+def _load_blueprints_cached(path: str, mtime_ns: int) -> dict:
+    return _normalize_blueprints(json.loads(Path(path).read_text()))
+
+
+def load_blueprints(path: str = BLUEPRINT_PATH) -> dict:
+    """Read + normalise the blueprint JSON, re-parsing only when the file's mtime changes."""
+    return _load_blueprints_cached(str(path), os.stat(path).st_mtime_ns)
+
+
 def validate_against_blueprint(cfg: dict, blueprints: dict) -> List[str]:
     """Return list of error strings; empty = ok."""
     ctype = cfg.get("controller_type", "").lower()
@@ -338,7 +372,7 @@ def main(argv: Sequence[str] | None = None) -> None:
     blueprints = None
     if not args.no_schema and Path(BLUEPRINT_PATH).exists():
         try:
-            blueprints = _normalize_blueprints(json.loads(Path(BLUEPRINT_PATH).read_text()))
+            blueprints = load_blueprints(BLUEPRINT_PATH)
         except Exception as exc:
             print(f"⚠️  Could not load blueprint ({exc}) – skipping validation")
 
@@ -374,7 +408,7 @@ def main(argv: Sequence[str] | None = None) -> None:
 
             # Persist full response packet for later visualisation / debugging
             try:
-                safe_label = ''.join(c if c.isalnum() or c in ('-_') else '_' for c in t.label)
+                safe_label = LABEL_UNSAFE_RE.sub('_', t.label)
                 out_json = DETAILS_DIR / f"{safe_label}.json"
                 tmp_path = out_json.with_suffix(out_json.suffix + ".tmp")
                 with tmp_path.open("w") as fp:
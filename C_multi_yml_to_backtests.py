@@ -13,10 +13,10 @@ python3 multi_market_sweep_tester.py --sweeps sweeps/ --workers 8 --outfile mm_m
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import os
 import sys
-import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List
@@ -30,15 +30,15 @@ try:
 except ImportError:
     sys.exit("Install PyYAML first: pip install pyyaml")
 
-import pandas as pd
-
 from A_yml_to_json import build_payloads
+from utils.yaml_cache import load_yaml
 from B_json_to_backtests import (
     run_backtest,
     validate_against_blueprint,
-    _normalize_blueprints,
+    load_blueprints,
     TestPayload,
     BLUEPRINT_PATH,
+    LABEL_UNSAFE_RE,
     BASE_URL,
     USERNAME,
     PASSWORD,
@@ -91,7 +91,7 @@ def sweep_yaml_files(sweeps_dir: Path) -> List[Path]:
 
 
 def tests_from_sweep(path: Path, meta_override: Dict[str, Any] | None = None) -> List[TestPayload]:
-    raw = yaml.safe_load(path.read_text())
+    raw = load_yaml(path)
     base = raw.get("base", {}) or {}
     grid = raw.get("grid", {}) or {}
     sweep = raw.get("sweep", {}) or {}
@@ -104,12 +104,59 @@ def tests_from_sweep(path: Path, meta_override: Dict[str, Any] | None = None) ->
             else:
                 base[k] = v
     payloads = build_payloads(base, grid, meta, sweep=sweep)
-    # convert to TestPayload objects (reuse B_json_to_backtests logic via tmp json)
-    tmp = Path(tempfile.gettempdir()) / f"{path.stem}_payloads.json"
-    tmp.write_text(json.dumps(payloads, default=str))
-    from B_json_to_backtests import load_tests_from_file  # late import to avoid cycles
+    # convert to TestPayload objects (reuse B_json_to_backtests logic). The JSON
+    # round-trip stays in memory; it turns YAML dates etc. into plain strings.
+    from B_json_to_backtests import load_tests_from_iterable  # late import to avoid cycles
+
+    return load_tests_from_iterable(json.loads(json.dumps(payloads, default=str)))
+
+
+def _flatten_row(row: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dicts into dotted keys (``results.trades``), like ``pd.json_normalize``."""
+    flat: Dict[str, Any] = {}
+    for k, v in row.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict) and v:
+            flat.update(_flatten_row(v, f"{key}."))
+        else:
+            flat[key] = v
+    return flat
+
 
-    return load_tests_from_file(str(tmp))
+def append_rows_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
+    """Append *rows* to the CSV at *path*, widening its header if new columns appear.
+
+    Rows are appended in place when the existing header already covers them;
+    otherwise the file is rewritten once with the union of columns (existing
+    columns first), leaving previously written values untouched.
+    """
+    flat = [_flatten_row(r) for r in rows]
+    cols = list(dict.fromkeys(k for r in flat for k in r))
+
+    prev_cols: List[str] = []
+    prev_rows: List[Dict[str, str]] = []
+    if path.exists():
+        try:
+            with path.open(newline="") as fp:
+                reader = csv.DictReader(fp)
+                prev_cols = list(reader.fieldnames or [])
+                if not set(cols) <= set(prev_cols):
+                    prev_rows = list(reader)
+        except Exception:
+            prev_cols = []  # unreadable – start the file afresh
+
+    if prev_cols and set(cols) <= set(prev_cols):
+        with path.open("a", newline="") as fp:
+            csv.DictWriter(fp, fieldnames=prev_cols).writerows(flat)
+        return
+
+    header = prev_cols + [c for c in cols if c not in set(prev_cols)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as fp:
+        w = csv.DictWriter(fp, fieldnames=header)
+        w.writeheader()
+        w.writerows(prev_rows)
+        w.writerows(flat)
 
 
 # ---------------------------------------------------------------------------
@@ -158,7 +205,7 @@ def main(argv: List[str] | None = None) -> None:
 
     meta_override: Dict[str, Any] | None = None
     if args.meta_file:
-        meta_override = yaml.safe_load(Path(args.meta_file).read_text()) or {}
+        meta_override = load_yaml(args.meta_file) or {}
 
     # collect tests
     tests: List[TestPayload] = []
@@ -181,7 +228,7 @@ def main(argv: List[str] | None = None) -> None:
     blueprints = None
     if not args.no_schema and Path(BLUEPRINT_PATH).exists():
         try:
-            blueprints = _normalize_blueprints(json.loads(Path(BLUEPRINT_PATH).read_text()))
+            blueprints = load_blueprints(BLUEPRINT_PATH)
         except Exception as exc:
             print(f"⚠️  Could not load blueprint ({exc}) – skipping validation")
 
@@ -228,7 +275,7 @@ def main(argv: List[str] | None = None) -> None:
             algo = p.config.get("controller_name", "unknown")
             # Persist full detail packet
             try:
-                safe_label = ''.join(c if c.isalnum() or c in ('-_') else '_' for c in p.label)
+                safe_label = LABEL_UNSAFE_RE.sub('_', p.label)
                 out_json = DETAILS_DIR / f"{safe_label}.json"
                 if not out_json.exists():
                     with out_json.open("w") as fp:
@@ -253,15 +300,8 @@ def main(argv: List[str] | None = None) -> None:
             prefix = "⚠️" if has_err else status
             print(f"{prefix} {p.label}{' – ' + msg if has_err else ''}")
 
-    df = pd.json_normalize(rows)
     out_csv = Path(args.outfile)
-    if out_csv.exists():
-        try:
-            prev = pd.read_csv(out_csv)
-            df = pd.concat([prev, df], ignore_index=True)
-        except Exception:
-            pass
-    df.to_csv(out_csv, index=False)
+    append_rows_csv(out_csv, rows)
 
     n_fail = sum(1 for r in rows if "error" in r)
     n_ok = len(rows) - n_fail
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Simplified Experiment Runner for Hummingbot (SERIAL VERSION)
-============================================================
+Simplified Experiment Runner for Hummingbot
+===========================================
 
 This script is a lighter version of *experiment_runner.py* that focuses only on
 `pmm_simple` and `pmm_dynamic` strategies.  Before any network calls it performs
@@ -9,30 +9,50 @@ an exhaustive validation of every generated configuration against the blueprint
 stored in ``bots/hummingbot_files/schema/all_controller_configs.json``.
 The run is **aborted** if *any* mismatch is detected so that no back-tests are
 executed with invalid payloads.
+
+Back-tests run concurrently (``--workers``, default 8; pass ``--workers 1`` for a
+serial run).  Result rows are appended to the CSV in completion order, not in
+experiment order.
 """
 from __future__ import annotations
 
 import argparse
+import copy
+import csv
 import hashlib
 import itertools
 import json
 import os
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 import json as _json
 
-import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 try:
-    from tqdm import tqdm  # type: ignore
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Optional multi-pattern matcher for comma-separated --only filters
+try:
+    import ahocorasick  # type: ignore  (pip install pyahocorasick)
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore
+
+# Optional compiled JSON-Schema validator (fast path for blueprint checks)
+try:
+    import fastjsonschema  # type: ignore
 except ImportError:  # pragma: no cover
-    tqdm = None  # type: ignore
+    fastjsonschema = None  # type: ignore
 
 # ----------------------------------------------------------------------
 # 🔧 USER GLOBALS
@@ -43,6 +63,12 @@ BASE_URL: str = "http://localhost:8000"
 RESULTS_CSV_PATH: str = "bots/hummingbot_files/results/backtest_results.csv"
 USERNAME, PASSWORD = "admin", "admin"
 
+# Back-tests are independent and network-bound – run this many concurrently
+DEFAULT_WORKERS: int = 8
+# Keep-alive pool per worker session (connections per host / hosts cached)
+HTTP_POOL_MAXSIZE: int = 32
+HTTP_POOL_CONNECTIONS: int = 16
+
 # Location of the blueprint file (produced by fetch_all_controller_configs.py)
 SCHEMA_PATH: str = "bots/hummingbot_files/schema/all_controller_configs.json"
 
@@ -113,7 +139,36 @@ STRAT_GRIDS: Dict[str, Dict[str, List]] = {
 # 🏗️  CONFIG BUILDERS
 # ----------------------------------------------------------------------
 
+def _freeze(d: Dict) -> tuple:
+    """Hashable, order-independent key for a flat parameter dict."""
+    return tuple(sorted(d.items()))
+
+
 def build_common_config(controller_name: str, common: Dict) -> Dict:
+    """Return a fresh copy of the memoised common config for *common*.
+
+    Nested lists/dicts (``candles_config``, ``initial_positions``) are deep-copied
+    too, so callers may mutate anything in the result.
+    """
+    try:
+        frozen = _freeze(common)
+        hash(frozen)
+    except TypeError:  # unhashable grid value (e.g. a list) – build uncached
+        return dict(_build_common_items(controller_name, common))
+    return {
+        k: copy.deepcopy(v) if isinstance(v, (list, dict)) else v
+        for k, v in _build_common_cached(controller_name, frozen)
+    }
+
+
+@lru_cache(maxsize=4096)
+def _build_common_cached(controller_name: str, frozen: tuple) -> tuple:
+    # Tuple-of-items keeps the top level immutable; nested containers are still
+    # shared, which is why build_common_config copies them on the way out
+    return _build_common_items(controller_name, dict(frozen))
+
+
+def _build_common_items(controller_name: str, common: Dict) -> tuple:
     spread_lvl1 = common["level_spread"]
     n_levels = common.get("n_levels", 1)  # Default to 1 level if not specified
 
@@ -181,7 +236,7 @@ def build_common_config(controller_name: str, common: Dict) -> Dict:
             "interval": "1m",
         }]
 
-    return cfg
+    return tuple(cfg.items())
 
 
 def build_pmm_simple(common: Dict, extra: Dict) -> Dict:
@@ -250,20 +305,35 @@ BUILDER_MAP = {
 # 🛠️  UTILITY HELPERS
 # ----------------------------------------------------------------------
 
-def combo_dict(grid: Dict[str, List]) -> List[Dict]:
-    """Cartesian-product expansion of a parameter grid."""
+def combo_dict(grid: Dict[str, List]) -> Iterator[Dict]:
+    """Lazily yield the Cartesian-product expansion of a parameter grid."""
     if not grid:
-        return [{}]
+        yield {}
+        return
     keys, values = zip(*grid.items())
-    return [dict(zip(keys, v)) for v in itertools.product(*values)]
+    for v in itertools.product(*values):
+        yield dict(zip(keys, v))
 
 
-def short_hash(obj: Dict) -> str:
-    """10-char deterministic hash for a dict (order-independent)."""
-    blob = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
-    return hashlib.md5(blob).hexdigest()[:10]
+def _canonical(obj: Dict) -> bytes:
+    """Order-independent compact JSON encoding used for hashing.
 
+    Stays on stdlib json: orjson formats floats differently (``1e-7`` vs
+    ``1e-07``), which would make persisted config hashes depend on whether
+    orjson happens to be installed.
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
+def short_hash_parts(*blobs: bytes) -> str:
+    """10-char hash of pre-serialised fragments (e.g. config then timeframe meta), fed in order."""
+    h = hashlib.blake2b(digest_size=5)
+    for blob in blobs:
+        h.update(blob)
+    return h.hexdigest()
 
+
+@lru_cache(maxsize=64)
 def to_timestamp(date_str: str) -> int:
     """Convert YYYY-MM-DD (interpreted as midnight UTC) to unix timestamp."""
     year, month, day = map(int, date_str.split("-"))
@@ -271,13 +341,45 @@ def to_timestamp(date_str: str) -> int:
     return int(dt.timestamp())
 
 
-def run_backtest(body: Dict, auth: HTTPBasicAuth, retries: int = 2) -> Dict:
-    """POST /run-backtesting with retries and return decoded JSON (or error)."""
+_THREAD_LOCAL = threading.local()
+
+
+def _utc_now_str() -> str:
+    """Current UTC time as ISO seconds, formatted at most once per second per thread."""
+    now = int(time.time())
+    cached = getattr(_THREAD_LOCAL, "ts", None)
+    if cached is None or cached[0] != now:
+        cached = _THREAD_LOCAL.ts = (now, datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+    return cached[1]
+
+
+def _session() -> requests.Session:
+    """Return this thread's keep-alive HTTP session, created on first use."""
+    sess = getattr(_THREAD_LOCAL, "session", None)
+    if sess is None:
+        sess = requests.Session()
+        # Retries are handled by run_backtest; the adapter only pools connections
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+        sess.mount("http://", adapter)
+        sess.mount("https://", adapter)
+        _THREAD_LOCAL.session = sess
+    return sess
+
+
+def run_backtest(body: Dict | bytes, session: requests.Session, auth: HTTPBasicAuth, retries: int = 2) -> Dict:
+    """POST /run-backtesting with retries and return decoded JSON (or error).
+
+    *body* may be a dict or an already-encoded JSON document.
+    """
+    if isinstance(body, bytes):
+        send = {"data": body, "headers": {"Content-Type": "application/json"}}
+    else:
+        send = {"json": body}
     attempt = 0
     debug_mode = 'DEBUG_MODE' in globals() and DEBUG_MODE
     while True:
         try:
-            r = requests.post(f"{BASE_URL}/run-backtesting", json=body, auth=auth, timeout=1200)
+            r = session.post(f"{BASE_URL}/run-backtesting", **send, auth=auth, timeout=1200)
 
             try:
                 data = r.json()
@@ -288,7 +390,7 @@ def run_backtest(body: Dict, auth: HTTPBasicAuth, retries: int = 2) -> Dict:
 
             if debug_mode and is_error:
                 print("--- FAILED REQUEST BODY ---")
-                print(json.dumps(body, indent=2)[:1000])
+                print((json.dumps(json.loads(body), indent=2) if isinstance(body, bytes) else json.dumps(body, indent=2))[:1000])
                 print(f"--- RESPONSE {r.status_code} ---")
                 print(r.text[:1000])
                 print("--------------------------------")
@@ -306,6 +408,78 @@ def run_backtest(body: Dict, auth: HTTPBasicAuth, retries: int = 2) -> Dict:
             time.sleep(wait)
             attempt += 1
 
+# ----------------------------------------------------------------------
+# 🕯️  CANDLE READINESS (once per connector/pair/interval/date-range group)
+# ----------------------------------------------------------------------
+CANDLE_WAIT_SEC: int = 60
+
+_CANDLE_GATES: Dict[tuple, threading.Event] = {}
+_CANDLE_READY: Dict[tuple, bool] = {}
+_CANDLE_LOCK = threading.Lock()
+
+
+def _candle_keys(cfg: Dict, meta: Dict) -> List[tuple]:
+    """Return the (connector, pair, interval, start, end) groups an experiment needs."""
+    start, end = to_timestamp(meta["start_time"]), to_timestamp(meta["end_time"])
+    intervals = {c.get("interval", meta["resolution"]) for c in cfg.get("candles_config", [])}
+    return [(cfg["connector_name"], cfg["trading_pair"], ivl, start, end) for ivl in sorted(intervals)]
+
+
+def _poll_candles(key: tuple, auth: HTTPBasicAuth, session: requests.Session) -> bool:
+    """Request candles for *key* and poll /candles-count until some exist (max CANDLE_WAIT_SEC)."""
+    connector, pair, interval, start, end = key
+    ensure_candles(connector, pair, interval, start, end, auth, session)
+    deadline = time.time() + CANDLE_WAIT_SEC
+    while True:
+        try:
+            r = session.get(
+                f"{BASE_URL}/candles-count",
+                params={
+                    "connector": connector,
+                    "trading_pair": pair,
+                    "interval": interval,
+                    "start_time": start,
+                    "end_time": end,
+                },
+                auth=auth,
+                timeout=10,
+            )
+            if r.status_code == 200 and r.json().get("count", 0) > 0:
+                return True
+        except Exception:
+            pass
+        if time.time() > deadline:
+            return False
+        time.sleep(2)
+
+
+def candles_ready(key: tuple, auth: HTTPBasicAuth, session: requests.Session) -> bool:
+    """Gate on candle group *key*: the first caller polls, concurrent callers wait on its event.
+
+    A failed poll is not remembered – the callers waiting on it get ``False`` and
+    the next caller starts a fresh poll.
+    """
+    with _CANDLE_LOCK:
+        gate = _CANDLE_GATES.get(key)
+        owner = gate is None
+        if owner:
+            gate = _CANDLE_GATES[key] = threading.Event()
+    if owner:
+        ready = False
+        try:
+            ready = _poll_candles(key, auth, session)
+        finally:
+            if ready:
+                _CANDLE_READY[key] = True
+            else:
+                # Only success is cached; drop the gate so the next caller polls again
+                with _CANDLE_LOCK:
+                    _CANDLE_GATES.pop(key, None)
+            gate.set()
+        return ready
+    gate.wait()
+    return _CANDLE_READY.get(key, False)
+
 # ----------------------------------------------------------------------
 # 🔎  BLUEPRINT VALIDATION
 # ----------------------------------------------------------------------
@@ -320,79 +494,162 @@ def _normalize_blueprints(raw: dict) -> dict:
 
 
 try:
-    _raw_blueprints = json.loads(Path(SCHEMA_PATH).read_text())
+    _raw_bytes = Path(SCHEMA_PATH).read_bytes()
+    _raw_blueprints = orjson.loads(_raw_bytes) if orjson else json.loads(_raw_bytes)
     BLUEPRINTS: dict = _normalize_blueprints(_raw_blueprints)
 except FileNotFoundError:
     sys.exit(f"❌  Cannot find blueprint file {SCHEMA_PATH}. Run fetch_all_controller_configs.py first.")
-except json.JSONDecodeError as e:
+except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
     sys.exit(f"❌  {SCHEMA_PATH} is not valid JSON: {e}")
 
 
+# NOTE: This is a hardcoded assumptions of which keys are allowed to be added
+#       to the base blueprint, per controller.
+ALLOWED_EXTRA_KEYS: Dict[str, frozenset] = {
+    "pmm_dynamic": frozenset([
+        "candles_connector", "candles_trading_pair", "interval",
+        "macd_fast", "macd_slow", "macd_signal", "natr_length",
+        "buy_amounts_pct", "sell_amounts_pct",
+    ]),
+    "pmm_dynamic_2": frozenset([
+        "buy_amounts_pct", "sell_amounts_pct",
+    ]),
+    "dman_maker_v2": frozenset(["dca_spreads", "dca_amounts", "top_executor_refresh_time", "executor_activation_bounds"]),
+    "ronimethod": frozenset([
+        "price_adjustment_factor", "spread_multiplier_factor"
+    ]),
+}
+
+
+def _json_type(value) -> str | None:
+    """JSON-Schema type name for a blueprint default (int/float both map to number)."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return None
+
+
+def _blueprint_schema(cname: str, template: dict) -> dict:
+    """Synthesize a JSON Schema equivalent to (or stricter than) the blueprint checks."""
+    properties: dict = {}
+    for key, value in template.items():
+        jtype = _json_type(value)
+        properties[key] = {"type": jtype} if jtype else {}
+    for key in ALLOWED_EXTRA_KEYS.get(cname, ()):
+        properties.setdefault(key, {})
+    return {
+        "type": "object",
+        "required": sorted(template),
+        "additionalProperties": False,
+        "properties": properties,
+    }
+
+
+# Compiled validators keyed by schema digest – structurally identical blueprints share one
+_COMPILED_CACHE: dict = {}
+
+
+def _compile_validators(blueprints: dict) -> dict:
+    """Map each (controller_type, controller_name) to a fastjsonschema validator."""
+    if fastjsonschema is None:
+        return {}
+    validators: dict = {}
+    for ctype, controllers in blueprints.items():
+        for cname, template in controllers.items():
+            schema = _blueprint_schema(cname, template)
+            blob = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS) if orjson else _canonical(schema)
+            key = hashlib.md5(blob).hexdigest()
+            if key not in _COMPILED_CACHE:
+                _COMPILED_CACHE[key] = fastjsonschema.compile(schema)
+            validators[(ctype, cname)] = _COMPILED_CACHE[key]
+    return validators
+
+
+_VALIDATORS: dict = _compile_validators(BLUEPRINTS)
+
+
+def _blueprint_meta(cname: str, template: dict) -> tuple:
+    """(expected_keys, type_map, null_keys, allowed_keys) derived from one blueprint template."""
+    expected = frozenset(template)
+    type_map = {k: type(v) for k, v in template.items()}
+    null_keys = frozenset(k for k, v in template.items() if v is None)
+    allowed = expected | ALLOWED_EXTRA_KEYS.get(cname, frozenset())
+    return expected, type_map, null_keys, allowed
+
+
+# Per-blueprint key sets and types, derived once instead of on every validation
+_BLUEPRINT_META: Dict[Tuple[str, str], tuple] = {
+    (ctype, cname): _blueprint_meta(cname, template)
+    for ctype, controllers in BLUEPRINTS.items()
+    for cname, template in controllers.items()
+}
+
+
 def validate_against_blueprint(cfg: dict, blueprints: dict) -> List[str]:
     """
     Return list of error strings; empty list means cfg matches.
     Checks for missing keys, extra keys, and type mismatches.
+
+    Configs accepted by the precompiled validator return immediately; only
+    failing configs walk the blueprint below to collect every mismatch.
     """
     ctype = cfg.get("controller_type", "").lower()
     cname = cfg.get("controller_name", "").lower()
     errs: List[str] = []
 
-    template = blueprints.get(ctype, {}).get(cname)
-    if template is None:
-        return [f"Unknown controller {ctype}/{cname} in blueprint"]
-
-    expected_keys = set(template.keys())
-    actual_keys = set(cfg.keys())
+    validator = _VALIDATORS.get((ctype, cname)) if blueprints is BLUEPRINTS else None
+    if validator is not None:
+        try:
+            validator(cfg)
+            return errs
+        except fastjsonschema.JsonSchemaException:
+            pass  # fall through to the detailed diff for readable messages
+
+    meta = _BLUEPRINT_META.get((ctype, cname)) if blueprints is BLUEPRINTS else None
+    if meta is None:
+        template = blueprints.get(ctype, {}).get(cname)
+        if template is None:
+            return [f"Unknown controller {ctype}/{cname} in blueprint"]
+        meta = _blueprint_meta(cname, template)
+    expected_keys, type_map, null_keys, allowed_keys = meta
 
     # 1. Find missing keys
-    if missing := sorted(list(expected_keys - actual_keys)):
+    if missing := sorted(expected_keys.difference(cfg)):
         errs.append(f"missing keys → {missing}")
 
-    # 2. Find extra keys (more complex, depends on strategy)
-    # The base blueprints are sometimes extended with additional parameters.
-    # We will check for extra keys that are not part of the base or known extensions.
-    
-    # NOTE: This is a hardcoded assumptions of which keys are allowed to be added
-    #       to the base blueprint.
-    allowed_extra_keys = set()
-    if cname == "pmm_dynamic":
-        allowed_extra_keys.update([
-            "candles_connector", "candles_trading_pair", "interval",
-            "macd_fast", "macd_slow", "macd_signal", "natr_length",
-            "buy_amounts_pct", "sell_amounts_pct",
-        ])
-    elif cname == "pmm_dynamic_2":
-        allowed_extra_keys.update([
-            "buy_amounts_pct", "sell_amounts_pct",
-        ])
-    elif cname == "dman_maker_v2":
-        allowed_extra_keys.update(["dca_spreads", "dca_amounts", "top_executor_refresh_time", "executor_activation_bounds"])
-    elif cname == "ronimethod":
-        allowed_extra_keys.update([
-            "price_adjustment_factor", "spread_multiplier_factor"
-        ])
-    
-    unexpected_keys = actual_keys - expected_keys - allowed_extra_keys
-    if unexpected_keys:
-        errs.append(f"unexpected keys → {sorted(list(unexpected_keys))}")
+    # 2. Find extra keys – the base blueprints are sometimes extended with
+    #    additional parameters (ALLOWED_EXTRA_KEYS, pre-merged into allowed_keys)
+    if unexpected_keys := [k for k in cfg if k not in allowed_keys]:
+        errs.append(f"unexpected keys → {sorted(unexpected_keys)}")
 
     # 3. Check for type mismatches on common keys
-    for key in expected_keys.intersection(actual_keys):
+    for key, expected_type in type_map.items():
+        if key not in cfg:
+            continue
+        value = cfg[key]
         # Strict check for None/null values
-        if template[key] is None:
-            if cfg[key] is not None:
-                errs.append(f"type mismatch for '{key}': expected null, got {type(cfg[key]).__name__} ({cfg[key]})")
+        if key in null_keys:
+            if value is not None:
+                errs.append(f"type mismatch for '{key}': expected null, got {type(value).__name__} ({value})")
             continue
 
-        if cfg[key] is None:
-            errs.append(f"type mismatch for '{key}': expected {type(template[key]).__name__}, got null")
+        if value is None:
+            errs.append(f"type mismatch for '{key}': expected {expected_type.__name__}, got null")
             continue
 
-        expected_type = type(template[key])
-        actual_type = type(cfg[key])
+        actual_type = type(value)
 
         # Be flexible with int/float comparisons
-        if isinstance(cfg[key], (int, float)) and isinstance(template[key], (int, float)):
+        if isinstance(value, (int, float)) and issubclass(expected_type, (int, float)):
             continue
 
         if expected_type != actual_type:
@@ -418,45 +675,58 @@ def fill_defaults(cfg: dict) -> dict:
 # 🧪  EXPERIMENT GENERATION
 # ----------------------------------------------------------------------
 
-def generate_experiments(fast: bool = False) -> List[Tuple[str, Dict, Dict, str]]:
-    experiments: List[Tuple[str, Dict, Dict, str]] = []
+def generate_experiments(fast: bool = False) -> List[Tuple[str, Dict, Dict, str, bytes]]:
+    experiments: List[Tuple[str, Dict, Dict, str, bytes]] = []
 
     def shrink(grid: Dict[str, List]) -> Dict[str, List]:
         return {k: [v[0]] for k, v in grid.items()} if fast else grid
 
-    common_variants = combo_dict(shrink(COMMON_GRID))
+    # materialised: indexed by the flat loop and reused for every strategy
+    common_variants = list(combo_dict(shrink(COMMON_GRID)))
     # In fast mode run only the highest-resolution (1m) timeframe to minimise data volume.
     tf_items = (
         [(k, v) for k, v in TIMEFRAMES.items() if v[2] == "1m"]
         if fast else list(TIMEFRAMES.items())
     )
 
+    # Timeframe metadata is identical for every strategy – build it once
+    tf_metas = [
+        {
+            "start_time": start_str,
+            "end_time": end_str,
+            "resolution": resolution,
+            "trade_cost": fee,
+        }
+        for _, (start_str, end_str, resolution, fee) in tf_items
+    ]
+    tf_meta_blobs = [_canonical(meta) for meta in tf_metas]
+    n_tf = len(tf_items)
+
     for strat_key, extra_grid in STRAT_GRIDS.items():
         builder = BUILDER_MAP[strat_key]
-        extra_variants = combo_dict(shrink(extra_grid)) if extra_grid else [{}]
-
-        for common_params in common_variants:
-            for extra_params in extra_variants:
-                cfg = builder(common_params, extra_params)
-
-                # fill defaults from blueprint to avoid missing-key errors
-                cfg = fill_defaults(cfg)
-
-                tag_common = "_".join(f"{k}{v}" for k, v in common_params.items())
-                tag_extra = "_".join(f"{k}{v}" for k, v in extra_params.items())
-
-                for tf_label, (start_str, end_str, resolution, fee) in tf_items:
-                    tag_parts = [tf_label, strat_key, tag_common, tag_extra]
-                    tag = "__".join(filter(None, tag_parts))
-
-                    meta = {
-                        "start_time": start_str,
-                        "end_time": end_str,
-                        "resolution": resolution,
-                        "trade_cost": fee,
-                    }
-                    cfg_hash = short_hash(cfg | meta)
-                    experiments.append((tag, cfg, meta, cfg_hash))
+        extra_variants = list(combo_dict(shrink(extra_grid))) if extra_grid else [{}]
+        n_extra = len(extra_variants)
+
+        # One config per (common, extra) pair, blueprint defaults filled in to avoid
+        # missing-key errors. Tags are derived afterwards because builders may pin
+        # keys on the shared common dict (pmm_simple sets n_levels).
+        cfgs = [
+            fill_defaults(builder(common_params, extra_params))
+            for common_params, extra_params in itertools.product(common_variants, extra_variants)
+        ]
+        tags_common = ["_".join(f"{k}{v}" for k, v in c.items()) for c in common_variants]
+        tags_extra = ["_".join(f"{k}{v}" for k, v in e.items()) for e in extra_variants]
+        # Serialise each config once; the bytes feed every timeframe's hash and request body
+        cfg_blobs = [_canonical(cfg) for cfg in cfgs]
+
+        # Single flat loop; (common, extra, timeframe) indices come from divmod
+        for flat in range(len(cfgs) * n_tf):
+            k, t = divmod(flat, n_tf)
+            i, j = divmod(k, n_extra)
+            cfg, meta = cfgs[k], tf_metas[t]
+            tag = "__".join(filter(None, (tf_items[t][0], strat_key, tags_common[i], tags_extra[j])))
+            cfg_hash = short_hash_parts(cfg_blobs[k], tf_meta_blobs[t])
+            experiments.append((tag, cfg, meta, cfg_hash, cfg_blobs[k]))
 
     return experiments
 
@@ -464,62 +734,38 @@ def generate_experiments(fast: bool = False) -> List[Tuple[str, Dict, Dict, str]
 # 🚀  EXECUTION & PERSISTENCE
 # ----------------------------------------------------------------------
 
-def _worker(payload_tuple: Tuple[str, Dict, Dict, str], auth: HTTPBasicAuth, retries: int) -> Dict:
+@lru_cache(maxsize=64)
+def _payload_head(start: str, end: str, resolution: str, trade_cost: float) -> bytes:
+    """Encoded request body up to ``"config":`` – identical for every experiment in a timeframe."""
+    head = json.dumps({
+        "start_time": to_timestamp(start),
+        "end_time":   to_timestamp(end),
+        "backtesting_resolution": resolution,
+        "trade_cost": trade_cost,
+    }).encode()
+    return head[:-1] + b',"config":'
+
+
+def _worker(payload_tuple: Tuple[str, Dict, Dict, str, bytes], auth: HTTPBasicAuth, retries: int) -> Dict:
     """Prepare and execute a single backtest, returning a results dictionary."""
-    tag, cfg, meta, cfg_hash = payload_tuple
+    tag, cfg, meta, cfg_hash, cfg_blob = payload_tuple
+    session = _session()
 
     if 'FETCH_CANDLES' in globals() and FETCH_CANDLES:
-        # ensure candles for every interval specified in the config
-        intervals = {c.get("interval", meta["resolution"]) for c in cfg.get("candles_config", [])}
-        for ivl in intervals:
-            ensure_candles(cfg["connector_name"], cfg["trading_pair"], ivl,
-                           to_timestamp(meta["start_time"]), to_timestamp(meta["end_time"]), auth)
-
-        # robust wait: poll until candles exist (max 60s)
-        deadline = time.time() + 60
-        while True:
-            all_ready = True
-            for ivl in intervals:
-                try:
-                    r = requests.get(
-                        f"{BASE_URL}/candles-count",
-                        params={
-                            "connector": cfg["connector_name"],
-                            "trading_pair": cfg["trading_pair"],
-                            "interval": ivl,
-                            "start_time": to_timestamp(meta["start_time"]),
-                            "end_time": to_timestamp(meta["end_time"]),
-                        },
-                        auth=auth,
-                        timeout=10,
-                    )
-                    if r.status_code != 200 or r.json().get("count", 0) == 0:
-                        all_ready = False
-                        break
-                except Exception:
-                    all_ready = False
-                    break
-
-            if all_ready:
-                break
-
-            if time.time() > deadline:
+        # one readiness check per candle group, shared by every experiment in it
+        for key in _candle_keys(cfg, meta):
+            if not candles_ready(key, auth, session):
                 return {
                     "experiment": tag,
                     "config_hash": cfg_hash,
                     "error": "timeout waiting for candles",
                 }
-            time.sleep(2)
-
-    payload = {
-        "start_time": to_timestamp(meta["start_time"]),
-        "end_time":   to_timestamp(meta["end_time"]),
-        "backtesting_resolution": meta["resolution"],
-        "trade_cost": meta["trade_cost"],
-        "config": cfg,
-    }
+
+    # splice the pre-serialised config into the shared per-timeframe JSON prefix
+    head = _payload_head(meta["start_time"], meta["end_time"], meta["resolution"], meta["trade_cost"])
+    payload = head + cfg_blob + b"}"
     t0 = time.perf_counter()
-    res = run_backtest(payload, auth, retries=retries)
+    res = run_backtest(payload, session, auth, retries=retries)
     runtime = round(time.perf_counter() - t0, 2)
 
     if isinstance(res, dict) and "results" in res and isinstance(res["results"], dict):
@@ -529,68 +775,162 @@ def _worker(payload_tuple: Tuple[str, Dict, Dict, str], auth: HTTPBasicAuth, ret
         "experiment": tag,
         "config_hash": cfg_hash,
         "runtime_sec": runtime,
-        "timestamp_run": datetime.utcnow().isoformat(timespec="seconds"),
+        "timestamp_run": _utc_now_str(),
         **meta,
         **res,
     }
 
 
+def _flatten(row: Dict, prefix: str = "") -> Dict:
+    """Flatten nested dicts into dotted keys (same column names as ``pd.json_normalize``)."""
+    flat: Dict = {}
+    for key, val in row.items():
+        if isinstance(val, dict) and val:
+            flat.update(_flatten(val, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = val
+    return flat
+
+
+class ResultsAppender:
+    """Append result rows to the results CSV one at a time, flushing after each.
+
+    The header is taken from the existing file (or the first row). A row that
+    introduces new columns widens the header by rewriting the file once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.fieldnames: List[str] = []
+        self.written = 0
+        self._fh = None
+        self._writer: csv.DictWriter | None = None
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, newline="") as fh:
+                self.fieldnames = next(csv.reader(fh), [])
+
+    def _open(self, new_cols: List[str]) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        has_header = bool(self.fieldnames)
+        if has_header and new_cols:
+            # widen the header: rewrite existing rows under the extended column list
+            with open(self.path, newline="") as fh:
+                old_rows = list(csv.DictReader(fh))
+            self.fieldnames += new_cols
+            with open(self.path, "w", newline="") as fh:
+                w = csv.DictWriter(fh, fieldnames=self.fieldnames)
+                w.writeheader()
+                w.writerows(old_rows)
+        elif not has_header:
+            self.fieldnames = list(new_cols)
+        self._fh = open(self.path, "a", newline="")
+        self._writer = csv.DictWriter(self._fh, fieldnames=self.fieldnames, extrasaction="ignore")
+        if not has_header:
+            self._writer.writeheader()
+
+    def write(self, row: Dict) -> None:
+        flat = _flatten(row)
+        known = set(self.fieldnames)
+        new_cols = [k for k in flat if k not in known]
+        if self._writer is None or new_cols:
+            self._open(new_cols)
+        self._writer.writerow(flat)
+        self._fh.flush()
+        self.written += 1
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _collect(row: Dict, results: ResultsAppender, errors: List[Dict]) -> None:
+    """Persist a successful worker row immediately, or record and echo its error.
+
+    Only the fields the error summary prints are kept, so failed back-tests do
+    not pin their full (possibly large) raw responses in memory for the run.
+    """
+    if not row.get("error"):
+        results.write(row)
+        return
+    err_msg = str(row["error"])
+    raw_snippet = str(row.get("raw") or "")
+    if raw_snippet:
+        raw_snippet = raw_snippet.replace("\n", " ")[:300] + (" …" if len(raw_snippet) > 300 else "")
+    errors.append({"experiment": row["experiment"], "error": err_msg, "raw": raw_snippet})
+    if len(err_msg) > 160:
+        err_msg = err_msg[:160] + " …"
+    print(f"⚠️  {row['experiment']} → {err_msg}")
+    if raw_snippet:
+        print(f"   ↳ raw: {raw_snippet}")
+
+
+def _read_existing_hashes(path: str) -> set[str]:
+    """Return the ``config_hash`` values already in *path*, parsing only that column."""
+    import pandas as pd  # deferred: only needed once a results CSV exists
+
+    try:
+        col = pd.read_csv(path, usecols=["config_hash"], dtype={"config_hash": "string"}, engine="pyarrow")
+    except ImportError:  # pyarrow not installed – C parser, still single-column
+        col = pd.read_csv(path, usecols=["config_hash"], dtype={"config_hash": str})
+    return set(col["config_hash"].dropna().astype(str))
+
+
 def execute_experiments(
-    experiments: List[Tuple[str, Dict, Dict, str]],
+    experiments: List[Tuple[str, Dict, Dict, str, bytes]],
     retries: int = 2,
+    workers: int = DEFAULT_WORKERS,
 ) -> None:
     os.makedirs(os.path.dirname(RESULTS_CSV_PATH), exist_ok=True)
 
-    existing_df = pd.DataFrame()
     existing_hashes: set[str] = set()
     if os.path.exists(RESULTS_CSV_PATH):
         try:
-            existing_df = pd.read_csv(RESULTS_CSV_PATH, low_memory=False)
-            if "config_hash" in existing_df.columns:
-                existing_hashes = set(existing_df["config_hash"].dropna().astype(str))
+            existing_hashes = _read_existing_hashes(RESULTS_CSV_PATH)
         except Exception:
             print("⚠️  Could not read existing results – starting fresh.")
 
     to_run = [e for e in experiments if e[3] not in existing_hashes]
     print(f"Will run {len(to_run)} new experiments (skipping {len(experiments) - len(to_run)} duplicates)")
 
+    try:
+        from tqdm import tqdm  # type: ignore
+    except ImportError:  # pragma: no cover
+        tqdm = None  # type: ignore
+
     auth = HTTPBasicAuth(USERNAME, PASSWORD)
-    progress_iter = tqdm(to_run, desc="Running") if tqdm else to_run
-    success_rows, errors = [], []
-
-    for payload_tuple in progress_iter:
-        row = _worker(payload_tuple, auth, retries)
-        if row.get("error"):
-            errors.append(row)
-            err_msg = str(row["error"])
-            raw_snippet = row.get("raw", "")
-            if raw_snippet:
-                raw_snippet = raw_snippet.replace("\n", " ")[:300] + (" …" if len(raw_snippet) > 300 else "")
-            if len(err_msg) > 160:
-                err_msg = err_msg[:160] + " …"
-            print(f"⚠️  {row['experiment']} → {err_msg}")
-            if raw_snippet:
-                print(f"   ↳ raw: {raw_snippet}")
-        else:
-            success_rows.append(row)
+    errors: List[Dict] = []
+
+    if 'FETCH_CANDLES' in globals() and FETCH_CANDLES:
+        groups = {key for _, cfg, meta, _, _ in to_run for key in _candle_keys(cfg, meta)}
+        print(f"Candle readiness is checked once for each of {len(groups)} connector/pair/interval/range groups")
 
-    if not success_rows:
+    # rows are appended and flushed as each back-test finishes, so an interrupted run keeps its progress
+    results = ResultsAppender(RESULTS_CSV_PATH)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+            futures = [ex.submit(_worker, p, auth, retries) for p in to_run]
+            done_iter = as_completed(futures)
+            if tqdm:
+                done_iter = tqdm(done_iter, total=len(futures), desc="Running")
+            for fut in done_iter:
+                _collect(fut.result(), results, errors)
+    finally:
+        results.close()
+
+    if not results.written:
         print("No new experiments executed. All caught up!")
         return
 
-    new_df = pd.json_normalize(success_rows)
-    combined = pd.concat([existing_df, new_df], ignore_index=True)
-    combined.to_csv(RESULTS_CSV_PATH, index=False)
-    print(f"\n✅  Saved {len(new_df)} successful rows → {RESULTS_CSV_PATH} (total {len(combined)})")
+    print(f"\n✅  Saved {results.written} successful rows → {RESULTS_CSV_PATH}")
 
     if errors:
         print("\n────────── ERROR SUMMARY ──────────")
         for row in errors:
-            raw_snippet = row.get("raw", "")
-            raw_snippet = raw_snippet.replace("\n", " ")[:300] + (" …" if len(raw_snippet) > 300 else "")
             print(f"• {row['experiment']}  → {row['error']}")
-            if raw_snippet:
-                print(f"   ↳ raw: {raw_snippet}")
+            if row["raw"]:
+                print(f"   ↳ raw: {row['raw']}")
         print("See details in CSV; fix inputs or backend accordingly.")
 
 # ------------------------------------------------------------------
@@ -598,7 +938,8 @@ def execute_experiments(
 # ------------------------------------------------------------------
 
 
-def ensure_candles(connector: str, pair: str, interval: str, start: int, end: int, auth: HTTPBasicAuth):
+def ensure_candles(connector: str, pair: str, interval: str, start: int, end: int, auth: HTTPBasicAuth,
+                   session: requests.Session | None = None):
     """Fire-and-forget POST /historical-candles to make sure data exists."""
     try:
         url = f"{BASE_URL}/historical-candles"
@@ -609,29 +950,48 @@ def ensure_candles(connector: str, pair: str, interval: str, start: int, end: in
             "start_time": start,
             "end_time": end,
         }
-        requests.post(url, json=body, auth=auth, timeout=60)
+        (session or _session()).post(url, json=body, auth=auth, timeout=60)
     except Exception:
         pass  # non-fatal; backend will error if data still missing 
 
 
 
+def tag_matcher(only: str):
+    """Return a predicate that is true when a tag contains any comma-separated pattern in *only*."""
+    patterns = [p for p in (s.strip() for s in only.split(",")) if p]
+    if len(patterns) <= 1:
+        needle = patterns[0] if patterns else only
+        return lambda tag: needle in tag
+    if ahocorasick is None:
+        return lambda tag: any(p in tag for p in patterns)
+    # one pass over each tag regardless of how many patterns were given
+    automaton = ahocorasick.Automaton()
+    for p in patterns:
+        automaton.add_word(p, p)
+    automaton.make_automaton()
+    return lambda tag: next(automaton.iter(tag), None) is not None
+
 # ----------------------------------------------------------------------
 # 🏁  CLI ENTRYPOINT
 # ----------------------------------------------------------------------
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Generate & run back-test experiments sequentially.")
+    parser = argparse.ArgumentParser(
+        description=f"Generate & run back-test experiments concurrently (--workers, default {DEFAULT_WORKERS}); "
+                    "result rows are appended in completion order."
+    )
     parser.add_argument("--fast", action="store_true", help="Run a minimal subset for quick tests.")
     parser.add_argument("--retries", type=int, default=2, help="Retry count on network/HTTP errors.")
     parser.add_argument("--skip-blueprint-check", action="store_true", help="Bypass blueprint validation (not recommended).")
     parser.add_argument("--debug", action="store_true", help="Print request and response payloads for troubleshooting.")
-    parser.add_argument("--only", type=str, help="Run only experiments whose tag contains this substring.")
+    parser.add_argument("--only", type=str, help="Run only experiments whose tag contains this substring (comma-separate several to match any).")
     parser.add_argument("--fetch-candles", action="store_true", help="Pre-download candles before each run.")
     parser.add_argument("--config-file", type=str, help="Path to JSON file containing a single controller config to back-test (bypasses generation).")
     parser.add_argument("--start-date", type=str, help="Start date YYYY-MM-DD (used with --config-file)")
     parser.add_argument("--end-date", type=str, help="End date YYYY-MM-DD (used with --config-file)")
     parser.add_argument("--resolution", type=str, default="1m", help="Backtesting resolution for --config-file mode")
     parser.add_argument("--fee", type=float, default=0.001, help="Trade cost fee for --config-file mode")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of back-tests to run concurrently.")
     args = parser.parse_args()
 
     global DEBUG_MODE, FETCH_CANDLES
@@ -670,9 +1030,10 @@ def main() -> None:
         }
 
         tag_single = f"manual::{cfg_manual.get('controller_name','unknown')}"
-        experiments_single = [(tag_single, cfg_manual, meta_single, short_hash(cfg_manual | meta_single))]
+        blob_manual = _canonical(cfg_manual)
+        experiments_single = [(tag_single, cfg_manual, meta_single, short_hash_parts(blob_manual, _canonical(meta_single)), blob_manual)]
 
-        execute_experiments(experiments_single, retries=args.retries)
+        execute_experiments(experiments_single, retries=args.retries, workers=args.workers)
         return
 
     # ------------------------------------------------------------------
@@ -681,7 +1042,8 @@ def main() -> None:
     experiments = generate_experiments(fast=args.fast)
 
     if args.only:
-        experiments = [e for e in experiments if args.only in e[0]]
+        matches = tag_matcher(args.only)
+        experiments = [e for e in experiments if matches(e[0])]
         if not experiments:
             print(f"No experiment tag contains '{args.only}'. Exiting.")
             return
@@ -692,7 +1054,7 @@ def main() -> None:
     if not args.skip_blueprint_check:
         print("☎️  Validating generated configs against blueprint …")
         bad: List[Tuple[str, List[str]]] = []
-        for tag, cfg, meta, _ in experiments:
+        for tag, cfg, meta, _, _ in experiments:
             errs = validate_against_blueprint(cfg, BLUEPRINTS)
             if errs and DEBUG_MODE:
                 template = BLUEPRINTS.get(cfg.get("controller_type", "").lower(), {}).get(cfg.get("controller_name", "").lower())
@@ -726,7 +1088,7 @@ def main() -> None:
         print(f"  {experiments[0][0]}")
     print("─" * 70)
 
-    execute_experiments(experiments, retries=args.retries)
+    execute_experiments(experiments, retries=args.retries, workers=args.workers)
 
 
 
@@ -9,6 +9,7 @@ from .candles import get_candlestick_trace  # noqa: F401
 from .executors import add_executors_trace  # noqa: F401
 from .pnl import get_pnl_trace  # noqa: F401
 from .backtesting import create_backtesting_figure  # noqa: F401
+from .downsample import downsample_lttb  # noqa: F401
 from .backtesting_metrics import (
     render_backtesting_metrics,  # noqa: F401
     render_accuracy_metrics,  # noqa: F401
@@ -21,6 +22,7 @@ __all__ = [
     "add_executors_trace",
     "get_pnl_trace",
     "create_backtesting_figure",
+    "downsample_lttb",
     "render_backtesting_metrics",
     "render_accuracy_metrics",
     "render_close_types",
@@ -8,6 +8,7 @@ import plotly.graph_objects as go
 from .candles import get_candlestick_trace
 from .executors import add_executors_trace
 from .pnl import get_pnl_trace
+from .signals import epoch_to_ts
 from .theme import get_default_layout
 
 
@@ -172,7 +173,7 @@ def _get_marker_traces(executors: list[dict], *, marker_scale: float = 1_000):
     close_x, close_y, close_size = [], [], []
 
     for exe in executors:
-        ts_entry = pd.to_datetime(exe.get("timestamp") or exe.get("entry_timestamp"), unit="s")
+        ts_entry = epoch_to_ts(exe.get("timestamp") or exe.get("entry_timestamp"))
         price_entry = exe.get("entry_price") or exe.get("custom_info", {}).get("current_position_average_price")
         if price_entry is None:
             continue
@@ -202,7 +203,7 @@ def _get_marker_traces(executors: list[dict], *, marker_scale: float = 1_000):
 
         # Exit (close) marker
         if exe.get("close_timestamp"):
-            ts_exit = pd.to_datetime(exe["close_timestamp"], unit="s")
+            ts_exit = epoch_to_ts(exe["close_timestamp"])
             exit_price = exe.get("custom_info", {}).get("close_price", exe.get("exit_price", price_entry))
             close_x.append(ts_exit)
             close_y.append(exit_price)
@@ -239,8 +240,8 @@ def _add_position_bar(fig: go.Figure, df: pd.DataFrame, executors: list[dict], *
     """Append net quote position bar subplot to *fig* at given *row*."""
     events = []
     for exe in executors:
-        ts_entry = pd.to_datetime(exe.get("timestamp") or exe.get("entry_timestamp"), unit="s")
-        ts_exit = pd.to_datetime(exe.get("close_timestamp", None), unit="s") if exe.get("close_timestamp") else None
+        ts_entry = epoch_to_ts(exe.get("timestamp") or exe.get("entry_timestamp"))
+        ts_exit = epoch_to_ts(exe.get("close_timestamp", None)) if exe.get("close_timestamp") else None
         size = float(exe.get("filled_amount_quote", 0))
         if size == 0:
             continue
@@ -295,8 +296,8 @@ def _add_position_bar(fig: go.Figure, df: pd.DataFrame, executors: list[dict], *
 def _add_duration_bar(fig: go.Figure, executors: list[dict], *, row: int):
     """Append a horizontal bar per trade spanning entry → exit."""
     for exe in executors:
-        entry_ts = pd.to_datetime(exe.get("timestamp") or exe.get("entry_timestamp"), unit="s")
-        exit_ts = pd.to_datetime(exe.get("close_timestamp", entry_ts), unit="s")
+        entry_ts = epoch_to_ts(exe.get("timestamp") or exe.get("entry_timestamp"))
+        exit_ts = epoch_to_ts(exe.get("close_timestamp", entry_ts))
         if exe.get("filled_amount_quote", 0) == 0:
             continue
         side = _classify_side(exe)
@@ -340,17 +341,17 @@ def _add_order_levels(fig: go.Figure, executors: list[dict], df: pd.DataFrame, *
     if isinstance(df.index, pd.DatetimeIndex):
         global_end = df.index.max()
     elif "timestamp" in df.columns:
-        global_end = pd.to_datetime(df["timestamp"].max(), unit="s")
+        global_end = epoch_to_ts(df["timestamp"].max())
     else:
         global_end = None
 
     for exe in executors:
-        entry_ts = pd.to_datetime(exe.get("timestamp") or exe.get("entry_timestamp"), unit="s")
+        entry_ts = epoch_to_ts(exe.get("timestamp") or exe.get("entry_timestamp"))
         if pd.isna(entry_ts):
             continue
 
         exit_ts_raw = exe.get("close_timestamp") or exe.get("exit_timestamp")
-        exit_ts = pd.to_datetime(exit_ts_raw, unit="s") if exit_ts_raw else global_end
+        exit_ts = epoch_to_ts(exit_ts_raw) if exit_ts_raw else global_end
 
         # Collect order price levels for this executor
         levels: list[float] = []
@@ -7,12 +7,11 @@ def get_bt_candlestick_trace(df: pd.DataFrame) -> go.Scatter:
 
     Accepts DataFrame with at least columns ['timestamp', 'close'].
     """
-    if "timestamp" in df.columns:
-        df = df.copy()
-        df.index = pd.to_datetime(df["timestamp"], unit="s")
+    # Build the x-axis directly instead of copying *df* just to swap its index
+    x = pd.to_datetime(df["timestamp"].to_numpy(), unit="s") if "timestamp" in df.columns else df.index
     # Neutral gray price line for dark theme
     color = "#9CA3AF"  # gray-400
-    return go.Scatter(x=df.index, y=df["close"], mode="lines", line=dict(color=color), name="Price")
+    return go.Scatter(x=x, y=df["close"].to_numpy(), mode="lines", line=dict(color=color), name="Price")
 
 def get_candlestick_trace(df: pd.DataFrame) -> go.Candlestick:
     """Return Plotly Candlestick trace from DataFrame with ['open','high','low','close'] columns.
@@ -20,14 +19,15 @@ def get_candlestick_trace(df: pd.DataFrame) -> go.Candlestick:
     Index is expected to be datetime (or we coerce timestamp column).
     """
     if "timestamp" in df.columns and not isinstance(df.index, pd.DatetimeIndex):
-        df = df.copy()
-        df.index = pd.to_datetime(df["timestamp"], unit="s")
+        x = pd.to_datetime(df["timestamp"].to_numpy(), unit="s")
+    else:
+        x = df.index
 
-    return go.Candlestick(x=df.index,
-                          open=df["open"],
-                          high=df["high"],
-                          low=df["low"],
-                          close=df["close"],
+    return go.Candlestick(x=x,
+                          open=df["open"].to_numpy(),
+                          high=df["high"].to_numpy(),
+                          low=df["low"].to_numpy(),
+                          close=df["close"].to_numpy(),
                           name="Candlestick",
                           increasing_line_color="#2ECC71",
-                          decreasing_line_color="#E74C3C") 
\ No newline at end of file
+                          decreasing_line_color="#E74C3C")
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+# Optional Rust-backed implementation; the numpy version below is the fallback
+try:
+    from tsdownsample import MinMaxLTTBDownsampler  # type: ignore
+except ImportError:  # pragma: no cover
+    MinMaxLTTBDownsampler = None  # type: ignore
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return the row positions kept by Largest-Triangle-Three-Buckets downsampling.
+
+    First and last points are always kept; every bucket in between contributes the
+    point forming the largest triangle with the previous pick and the next bucket mean.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+def downsample_lttb(df: pd.DataFrame, n_out: int = 2_000, *, x: str = "timestamp", y: str = "close") -> pd.DataFrame:
+    """Return *df* reduced to ~*n_out* rows that preserve the visual shape of *y*.
+
+    Frames that are already small or lack the *x*/*y* columns are returned unchanged.
+    """
+    if len(df) <= n_out or x not in df.columns or y not in df.columns:
+        return df
+    xs = df[x].to_numpy(dtype=np.float64)
+    ys = df[y].to_numpy(dtype=np.float64)
+    if MinMaxLTTBDownsampler is not None:
+        idx = MinMaxLTTBDownsampler().downsample(xs, np.nan_to_num(ys), n_out=n_out)
+    else:
+        idx = lttb_indices(xs, ys, n_out)
+    return df.iloc[idx]
@@ -6,8 +6,16 @@ import plotly.graph_objects as go
 
 # Reuse classification helper from signals module (avoids duplication)
 try:
-    from .signals import classify_side  # type: ignore
+    from .signals import classify_side, epoch_to_ts  # type: ignore
 except Exception:
+    def epoch_to_ts(value):
+        if value is None:
+            return pd.NaT
+        if isinstance(value, pd.Timestamp):
+            return value
+        return pd.Timestamp(value, unit="s")
+
+
     def classify_side(exe):
         side_val = exe.get("config", {}).get("side", "buy")
         if isinstance(side_val, (int, float)):
@@ -24,8 +32,8 @@ def add_executors_trace(fig: go.Figure, executors: List[dict], *, row: int = 1,
         if exe.get("filled_amount_quote", 0) == 0:
             continue  # skip not-executed orders
 
-        entry_ts = pd.to_datetime(exe.get("timestamp") or exe.get("entry_timestamp"), unit="s")
-        exit_ts = pd.to_datetime(exe.get("close_timestamp", entry_ts), unit="s")
+        entry_ts = epoch_to_ts(exe.get("timestamp") or exe.get("entry_timestamp"))
+        exit_ts = epoch_to_ts(exe.get("close_timestamp", entry_ts))
         entry_price = exe.get("custom_info", {}).get("current_position_average_price", exe.get("entry_price"))
         exit_price = exe.get("custom_info", {}).get("close_price", entry_price)
         side = classify_side(exe)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import List, Tuple
@@ -11,26 +12,35 @@ def classify_side(exe: dict) -> str:
     return str(side_val).lower()
 
 
+def epoch_to_ts(value) -> pd.Timestamp:
+    """Return a scalar ``pd.Timestamp`` for epoch-seconds *value* (``NaT`` when missing).
+
+    ``pd.Timestamp`` is much cheaper than ``pd.to_datetime`` for single values;
+    keep ``pd.to_datetime`` for array conversions.
+    """
+    if value is None:
+        return pd.NaT
+    if isinstance(value, pd.Timestamp):
+        return value
+    return pd.Timestamp(value, unit="s")
+
+
 def get_signal_traces(executors: List[dict], *, marker_scale: float = 1_000) -> Tuple[go.Scatter, go.Scatter]:
     """Return two scatter traces for buy and sell signals on a flat row.
 
     *marker_scale* controls how `filled_amount_quote` is mapped to marker size.
     Rough mapping: size_px ≈ (filled_quote / marker_scale) but clamped to 6–24 px.
     """
-    buy_ts, sell_ts, buy_size, sell_size = [], [], [], []
-    for exe in executors:
-        ts = pd.to_datetime(exe.get("timestamp") or exe.get("entry_timestamp"), unit="s")
-        size = exe.get("filled_amount_quote", 0) or exe.get("order_size_quote", 0)
-        try:
-            size_scaled = max(6, min(24, float(size) / marker_scale))
-        except Exception:
-            size_scaled = 8
-        if classify_side(exe) == "buy":
-            buy_ts.append(ts)
-            buy_size.append(size_scaled)
-        else:
-            sell_ts.append(ts)
-            sell_size.append(size_scaled)
+    ts = pd.to_datetime([exe.get("timestamp") or exe.get("entry_timestamp") for exe in executors], unit="s")
+    raw_sizes = [exe.get("filled_amount_quote", 0) or exe.get("order_size_quote", 0) for exe in executors]
+    is_buy = np.array([classify_side(exe) == "buy" for exe in executors], dtype=bool)
+
+    # Non-numeric sizes coerce to NaN and fall back to the default 8 px marker
+    sizes = pd.to_numeric(pd.Series(raw_sizes, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+    sizes_scaled = np.clip(np.nan_to_num(sizes / marker_scale, nan=8.0), 6.0, 24.0)
+
+    buy_ts, sell_ts = ts[is_buy], ts[~is_buy]
+    buy_size, sell_size = sizes_scaled[is_buy].tolist(), sizes_scaled[~is_buy].tolist()
 
     y_const_buy = [0] * len(buy_ts)
     y_const_sell = [0] * len(sell_ts)
@@ -41,4 +51,4 @@ def get_signal_traces(executors: List[dict], *, marker_scale: float = 1_000) ->
     sell_trace = go.Scatter(x=sell_ts, y=y_const_sell, mode="markers",
                             marker=dict(symbol="triangle-down", color="red", size=sell_size or 8),
                             name="Sell signals")
-    return buy_trace, sell_trace 
\ No newline at end of file
+    return buy_trace, sell_trace
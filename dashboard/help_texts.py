@@ -0,0 +1,53 @@
+"""Static help copy for the Experiments Overview page.
+
+Kept in an imported module so Streamlit reruns reuse the cached module instead
+of rebuilding these literals on every widget interaction.
+"""
+
+HELP_TEXTS = {
+    "pnl": "The average **Net PNL** across all successful runs in the selected CSV file.\n\n- **Source Column**: `net_pnl_quote`\n- **Aggregation**: Mean\n- **Note**: This is not volume-weighted and does not normalize for different quote currencies.",
+    "volume": "The average **Total Volume** traded across all successful runs.\n\n- **Source Column**: `total_volume`\n- **Aggregation**: Mean\n- **Note**: Volume is measured in the quote asset.",
+    "win_rate": "The percentage of runs in the batch that were profitable.\n\n- **Formula**: `(Number of runs with Profit Factor > 1) / (Number of runs with a Profit Factor value)`\n- **Note**: This is a *run-level* metric, not a *trade-level* win rate. Runs with no losing trades (infinite Profit Factor) count as wins; runs with a missing Profit Factor are excluded.",
+    "profit_factor": "The sum of all profits divided by the sum of all losses for the entire batch.\n\n- **Formula**: `sum(gross_profit) / sum(gross_loss)`\n- **Source Column**: `total_pnl_quote`\n- **Note**: A value greater than 1 indicates overall profitability."
+}
+
+CHART_HELP = {
+    "net_pnl_by_run": (
+        "A bar chart showing the final **Net PNL** for each individual test run.\n\n"
+        "- **X-axis**: `label` (the unique ID for each run)\n"
+        "- **Y-axis**: `net_pnl_quote`\n"
+        "- **Source**: Directly from the results CSV, one bar per row."
+    ),
+    "profit_factor_dist": (
+        "A box plot showing the distribution of the **Profit Factor** for each algorithm.\n\n"
+        "- The **box** shows the interquartile range (IQR), from the 25th to 75th percentile.\n"
+        "- The **line** in the middle is the median (50th percentile).\n"
+        "- The **whiskers** extend to show the rest of the distribution (typically 1.5x IQR).\n"
+        "- **Points** outside the whiskers are outliers."
+    ),
+    "profit_factor_vs_accuracy": (
+        "A scatter plot to visualize the relationship between profitability and trade accuracy.\n\n"
+        "- **X-axis**: `accuracy_long` (% of profitable long trades)\n"
+        "- **Y-axis**: `profit_factor` (Gross Profit / Gross Loss)\n"
+        "- **Source**: Each point represents one run from the CSV."
+    ),
+    "volume_vs_pnl": (
+        "A scatter plot showing the relationship between total trading volume and the final Net PNL.\n\n"
+        "- **X-axis**: `total_volume` (Total value of trades in quote currency)\n"
+        "- **Y-axis**: `net_pnl_quote`\n"
+        "- **Source**: Each point represents one run from the CSV."
+    ),
+    "accuracy_dist": (
+        "A box plot showing the distribution of **Long Trade Accuracy** for each algorithm.\n\n"
+        "- The **box** shows the interquartile range (IQR), from the 25th to 75th percentile.\n"
+        "- The **line** in the middle is the median (50th percentile).\n"
+        "- The **whiskers** extend to show the rest of the distribution (typically 1.5x IQR).\n"
+        "- **Points** outside the whiskers are outliers."
+    ),
+    "sharpe_dist": (
+        "A histogram showing the distribution of the **Sharpe Ratio** across all runs.\n\n"
+        "- **X-axis**: `sharpe_ratio`\n"
+        "- **Y-axis**: Frequency (count of runs in each bin)\n"
+        "- **Note**: The 'rug' marks along the bottom show the exact location of each individual run's Sharpe Ratio."
+    ),
+}
@@ -1,14 +1,36 @@
 """Index helper for detail packets to avoid loading every JSON on start-up."""
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import atexit
+import os
+import threading
 import pandas as pd
-import json
+
+try:
+    import orjson as _json  # type: ignore
+except ImportError:  # pragma: no cover
+    import json as _json  # type: ignore
 
 BASE_DIR = Path("results/detail_packets")
 
 def _index_path(base: Path) -> Path:
     return base / "_index.csv"
 
+
+def mtime_ns(path: Path) -> int:
+    """Return *path*'s mtime in ns (0 when missing) for use as a cache key."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def index_mtime_ns(base: Path = BASE_DIR) -> int:
+    """Cache key for ``load_index(base)``: the index CSV's mtime, else the directory's."""
+    index_file = _index_path(base)
+    return mtime_ns(index_file if index_file.exists() else base)
+
 COLUMNS = [
     "label",
     "file_path",
@@ -19,6 +41,37 @@ COLUMNS = [
     "note",
 ]
 
+# stat() calls are I/O bound – on network mounts parallelism hides the latency
+SCAN_WORKERS = 16
+
+# Write-back buffer for mark(): label → row, per index directory. Rows are
+# mutated in place and written to CSV once after FLUSH_DELAY seconds of quiet.
+FLUSH_DELAY = 0.5
+_INDEX_CACHE: dict[Path, dict[str, list]] = {}
+_FLUSH_TIMERS: dict[Path, threading.Timer] = {}
+_LOCK = threading.RLock()
+
+
+def _scan_record(entry: os.DirEntry) -> list:
+    """Return an index row for the packet file *entry*."""
+    try:
+        stat = entry.stat()
+        size = stat.st_size
+        mtime = stat.st_mtime
+    except OSError:
+        size = 0
+        mtime = 0
+    return [
+        Path(entry.name).stem,  # label
+        entry.path,             # file_path
+        size,                   # size (bytes)
+        mtime,                  # mtime (unix ts)
+        "",                     # event_log_csv (unknown)
+        1,                      # valid (assume OK)
+        "auto",                 # note
+    ]
+
+
 def load_index(base: Path = BASE_DIR) -> pd.DataFrame:
     """Load an index CSV if present, otherwise build a minimal index from
     any JSON files in *base*.
@@ -30,6 +83,11 @@ def load_index(base: Path = BASE_DIR) -> pd.DataFrame:
     "No index file found" warning when packets are actually available.
     """
 
+    with _LOCK:
+        pending = _INDEX_CACHE.get(base)
+        if pending is not None:
+            return pd.DataFrame(list(pending.values()), columns=COLUMNS)
+
     path = _index_path(base)
     if path.exists():
         try:
@@ -42,25 +100,13 @@ def load_index(base: Path = BASE_DIR) -> pd.DataFrame:
     if not base.is_dir():
         return pd.DataFrame(columns=COLUMNS)
 
-    records = []
-    for p in base.glob("*.json"):
-        if p.name.startswith("_index"):
-            continue
-        try:
-            size = p.stat().st_size
-            mtime = p.stat().st_mtime
-        except OSError:
-            size = 0
-            mtime = 0
-        records.append([
-            p.stem,            # label
-            str(p),            # file_path
-            size,              # size (bytes)
-            mtime,             # mtime (unix ts)
-            "",               # event_log_csv (unknown)
-            1,                 # valid (assume OK)
-            "auto",           # note
-        ])
+    with os.scandir(base) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".json") and not e.name.startswith("_index") and e.is_file()
+        ]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        records = list(ex.map(_scan_record, entries))
 
     df = pd.DataFrame(records, columns=COLUMNS)
 
@@ -77,17 +123,87 @@ def load_index(base: Path = BASE_DIR) -> pd.DataFrame:
 
 
 def mark(label: str, ok: bool, note: str = "", base: Path = BASE_DIR) -> None:
-    df = load_index(base)
-    if label in df.label.values:
-        df.loc[df.label == label, ["valid", "note"]] = [int(ok), note]
-    else:
-        # fallback if row not present
-        df = pd.concat([
-            df,
-            pd.DataFrame([[label, str(base / f"{label}.json"), 0, 0, "", int(ok), note]], columns=COLUMNS),
-        ])
-    _index_path(base).parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(_index_path(base), index=False)
+    with _LOCK:
+        rows = _INDEX_CACHE.get(base)
+        if rows is None:
+            df = load_index(base).reindex(columns=COLUMNS)
+            rows = {r[0]: r for r in df.values.tolist()}
+            _INDEX_CACHE[base] = rows
+        row = rows.get(label)
+        if row is not None:
+            row[5] = int(ok)
+            row[6] = note
+        else:
+            # fallback if row not present
+            rows[label] = [label, str(base / f"{label}.json"), 0, 0, "", int(ok), note]
+        _schedule_flush(base)
+
+
+def _schedule_flush(base: Path) -> None:
+    """(Re)start the debounce timer that persists pending marks for *base*."""
+    timer = _FLUSH_TIMERS.pop(base, None)
+    if timer is not None:
+        timer.cancel()
+    timer = threading.Timer(FLUSH_DELAY, _flush, args=(base,))
+    timer.daemon = True
+    _FLUSH_TIMERS[base] = timer
+    timer.start()
+
+
+def _flush(base: Path) -> None:
+    """Write pending marks for *base* to its index CSV in a single pass."""
+    with _LOCK:
+        _FLUSH_TIMERS.pop(base, None)
+        rows = _INDEX_CACHE.pop(base, None)
+        if rows is None:
+            return
+        df = pd.DataFrame(list(rows.values()), columns=COLUMNS)
+        _index_path(base).parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(_index_path(base), index=False)
+
+
+@atexit.register
+def _flush_all() -> None:
+    for base in list(_INDEX_CACHE):
+        timer = _FLUSH_TIMERS.get(base)
+        if timer is not None:
+            timer.cancel()
+        _flush(base)
+
+
+SPLIT_KEYS = {"index", "columns", "data"}
+
+
+def processed_frame(data: dict, base: Path = BASE_DIR) -> pd.DataFrame:
+    """Return a packet's ``processed_data`` as a DataFrame.
+
+    Handles every layout the API has produced: ``orient="split"`` dicts
+    (current responses), a nested ``features`` dict, flat column dicts (older
+    packets) and packets saved with ``HB_SAVE_PACKET=1``, whose table lives in a
+    Parquet file next to the JSON (``processed_data_path``, relative to *base*).
+    """
+    proc = data.get("processed_data")
+    if isinstance(proc, dict):
+        if proc.keys() == SPLIT_KEYS:
+            return pd.DataFrame(proc["data"], index=proc["index"], columns=proc["columns"])
+        if isinstance(proc.get("features"), dict):
+            return pd.DataFrame(proc["features"])
+    if proc is not None:
+        return pd.DataFrame(proc)
+    rel = data.get("processed_data_path")
+    if rel:
+        return pd.read_parquet(base / rel)
+    return pd.DataFrame()
+
+
+# Event-log columns read by create_backtesting_figure for the order overlay
+CREATE_COLS = ("event_type", "timestamp", "created_price", "reference_price")
+
+
+def read_creates(path: str | Path) -> pd.DataFrame:
+    """Read only the CREATE rows (and plotted columns) of an event-log CSV."""
+    df = pd.read_csv(path, usecols=lambda c: c in CREATE_COLS, engine="c")
+    return df.loc[df["event_type"].to_numpy() == "CREATE"].reset_index(drop=True)
 
 
 def load_packet(label: str, base: Path = BASE_DIR):
@@ -96,7 +212,7 @@ def load_packet(label: str, base: Path = BASE_DIR):
         mark(label, False, "missing packet", base)
         raise FileNotFoundError(p)
     try:
-        return json.loads(p.read_text())
+        return _json.loads(p.read_bytes())
     except Exception as exc:
         mark(label, False, str(exc), base)
         raise 
\ No newline at end of file
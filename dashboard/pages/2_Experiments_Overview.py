@@ -1,14 +1,27 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 from pathlib import Path
+import csv
+import itertools
 import json
 import logging
+import os
 from hb_components import create_backtesting_figure
 from hb_components.backtesting_metrics import render_backtesting_metrics
+from help_texts import CHART_HELP, HELP_TEXTS
 
 # AgGrid
-from st_aggrid import AgGrid, GridOptionsBuilder
+from st_aggrid import AgGrid, DataReturnMode, GridOptionsBuilder, GridUpdateMode
+
+# Optional multithreaded Arrow CSV reader ----------------------------------
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+    pacsv = None  # type: ignore
 
 # Ensure Tailwind CSS overrides are active across pages
 try:
@@ -21,30 +34,6 @@ except ImportError:
     importlib.import_module("dashboard.theme_overrides")
 
 
-# ================== TEMP PROFILE BLOCK (remove later) ==================
-import time, contextlib, sys
-from pathlib import Path
-
-@contextlib.contextmanager
-def timer(lbl):
-    t0 = time.perf_counter()
-    yield
-    print(f"[PROFILE] {lbl}: {time.perf_counter() - t0:.2f}s", file=sys.stderr)
-
-results_dir_path = Path(st.session_state.get("results_dir", Path.cwd()))
-csv_file_path = Path(st.session_state.get("file_choice", ""))
-
-with timer("CSV discovery"):
-    _ = list(results_dir_path.rglob("*results.csv"))
-
-with timer("CSV load"):
-    if csv_file_path.is_file():
-        _ = pd.read_csv(csv_file_path)
-
-with timer("Packet glob"):
-    _ = list(Path("results/detail_packets").glob("*.json"))
-# ================= END TEMP PROFILE BLOCK =================
-
 # ---------------------------------------------------------------------------
 # Page Config
 # ---------------------------------------------------------------------------
@@ -64,7 +53,58 @@ if "file_choice" not in st.session_state:
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
-@st.cache_data(show_spinner="Loading data...")
+# Known summary-CSV schema – handed to read_csv so the C parser writes typed
+# arrays directly instead of inferring and re-coercing each column.
+KNOWN_DTYPES = {
+    'algo': 'string', 'label': 'string', 'market': 'string',
+    'return_pct': 'float64', 'net_pnl_quote': 'float64', 'total_positions': 'float64',
+    'total_trades': 'float64', 'total_pnl_quote': 'float64', 'total_buy_trades': 'float64',
+    'total_sell_trades': 'float64', 'accuracy_long': 'float64', 'accuracy_short': 'float64',
+    'total_volume': 'float64', 'avg_close_time': 'float64', 'avg_profit_per_trade': 'float64',
+    'sharpe_ratio': 'float64', 'profit_factor': 'float64', 'winning_trades': 'float64',
+    'losing_trades': 'float64', 'total_open_trades': 'float64', 'total_closed_trades': 'float64',
+}
+
+
+def _read_header_csv(path: Path, dtype: dict, columns: list[str] | None = None) -> pd.DataFrame:
+    """Parse a CSV that has a header row, typing the columns listed in *dtype*.
+
+    Only *columns* are materialised when given. Uses pyarrow's multithreaded
+    tokenizer when available and converts to Arrow-backed pandas columns;
+    otherwise falls back to the pandas C parser.
+    """
+    if pacsv is None:
+        return pd.read_csv(
+            path, header=0, dtype=dtype, usecols=columns or (lambda c: not str(c).startswith("Unnamed"))
+        )
+    arrow_types = {"string": pa.string(), "float64": pa.float64()}
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={c: arrow_types[t] for c, t in dtype.items()},
+            null_values=["", "NA", "NaN", "nan"],
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _write_sidecar(df: pd.DataFrame, sidecar: Path) -> pd.DataFrame:
+    """Persist *df* as a Feather sidecar (best-effort) and return it unchanged."""
+    if pa is not None and not df.empty:
+        try:
+            df.to_feather(sidecar)
+        except Exception:
+            # Non-fatal – next load simply reparses the CSV.
+            pass
+    return df
+
+
+# cache_resource hands back the cached frame by reference (no pickle round-trip);
+# callers must .copy() before mutating it.
+@st.cache_resource(show_spinner="Loading data...")
 def load_df(path: Path) -> pd.DataFrame:
     """Load a results CSV (with or without header) and coerce numeric types.
 
@@ -72,10 +112,20 @@ def load_df(path: Path) -> pd.DataFrame:
     1. Try reading with the default header (header=0). If that yields at least one numeric
        column after coercion, we keep it.
     2. Otherwise fall back to reading as header-less (header=None) and assign generic names.
+
+    The parsed frame is cached as a ``.feather`` sidecar next to the CSV; while the
+    sidecar is newer than the CSV it is read instead, skipping tokenisation entirely.
     """
     if not path.exists():
         return pd.DataFrame()
 
+    sidecar = path.with_suffix(".feather")
+    if pa is not None and sidecar.exists() and sidecar.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+        try:
+            return pd.read_feather(sidecar, dtype_backend="pyarrow")
+        except Exception:
+            pass  # Unreadable sidecar – reparse the CSV below
+
     # Fallback column template for header-less CSVs
     column_names = [
         'algo', 'label', 'market', 'return_pct', 'net_pnl_quote', 'total_positions',
@@ -85,40 +135,62 @@ def load_df(path: Path) -> pd.DataFrame:
         'losing_trades', 'total_open_trades', 'total_closed_trades', 'param_1', 'param_2'
     ]
 
-    def _postprocess(df_in: pd.DataFrame) -> pd.DataFrame:
-        """Common cleaning for both read modes."""
-        df_out = df_in.copy()
-        df_out = df_out.loc[:, ~df_out.columns.str.contains('^Unnamed', na=False)]
+    def _postprocess(df_in: pd.DataFrame, typed=()) -> pd.DataFrame:
+        """Common cleaning for both read modes.
+
+        Columns in *typed* were already parsed with an explicit dtype and skip coercion.
+        """
+        # read_csv hands us a fresh frame (blank/Unnamed header columns were already
+        # excluded at parse time), so drop empty columns in place instead of copying
+        df_out = df_in
         df_out.dropna(axis=1, how='all', inplace=True)
 
-        for col in df_out.columns:
-            coerced = pd.to_numeric(df_out[col], errors="coerce")
-            # Only replace column if conversion produced at least one numeric value
-            if not coerced.isna().all():
-                df_out[col] = coerced
+        # Only text columns need coercion; object cast avoids Arrow NaN-vs-null quirks
+        untyped = [
+            c for c in df_out.columns
+            if c not in typed and not pd.api.types.is_numeric_dtype(df_out[c])
+        ]
+        coerced = df_out[untyped].astype(object).apply(pd.to_numeric, errors="coerce")
+        # Only replace columns where conversion produced at least one numeric value
+        keep = coerced.columns[coerced.notna().any(axis=0)]
+        df_out[keep] = coerced[keep]
+
+        # Type inference in C onto Arrow-backed columns – this also brings header-less
+        # (pandas-parsed) frames and coerced columns onto the same backend.
+        df_out = df_out.convert_dtypes(dtype_backend="pyarrow")
 
         if 'label' not in df_out.columns or df_out['label'].isnull().any():
-            df_out['label'] = [f"run_{i}" for i in df_out.index]
+            df_out['label'] = 'run_' + df_out.index.astype(str)
         return df_out
 
-    def _row0_is_duplicate_header(df_test: pd.DataFrame) -> bool:
-        """Return True if first data row appears to repeat the header names (string match)."""
-        if df_test.empty:
-            return False
-        header_vals = [str(c).strip().lower() for c in df_test.columns]
-        row0_vals = [str(v).strip().lower() for v in df_test.iloc[0].values]
-        # Compare first few columns (3) to avoid false positives
-        return header_vals[:3] == row0_vals[:3]
-
-    # First attempt: read with a header row.
-    try:
-        df_header = pd.read_csv(path, header=0)
-        if _row0_is_duplicate_header(df_header):
-            raise ValueError("Detected duplicated header row – treating as header-less file")
-        df_header = _postprocess(df_header)
-        return df_header
-    except Exception:
-        pass  # Fallback to header-less mode
+    # Sniff the first two raw lines once: they give the header names for the typed
+    # read and reveal a duplicated header row without a second full parse.
+    with path.open("r", newline="") as fh:
+        rdr = csv.reader(fh)
+        header = next(rdr, None) or []
+        first = next(rdr, None) or []
+    duplicated = bool(first) and (
+        [c.strip().lower() for c in header[:3]] == [c.strip().lower() for c in first[:3]]
+    )
+
+    # First attempt: read with a header row (skipped for duplicated-header files).
+    if not duplicated:
+        try:
+            dtype = {c: KNOWN_DTYPES[c] for c in header if c in KNOWN_DTYPES}
+            # Skip index-like blank/"Unnamed" header cells in the parser itself
+            columns = [c for c in header if c.strip() and not c.startswith("Unnamed")]
+            if len(set(columns)) != len(columns) or len(columns) == len(header):
+                columns = None  # duplicates need the parser's own name mangling
+            try:
+                df_header = _read_header_csv(path, dtype, columns)
+            except (ValueError, TypeError):
+                # Non-numeric values in a known column – let _postprocess coerce instead
+                dtype = {}
+                df_header = _read_header_csv(path, dtype, columns)
+            df_header = _postprocess(df_header, typed=dtype.keys())
+            return _write_sidecar(df_header, sidecar)
+        except Exception:
+            pass  # Fallback to header-less mode
 
     # Fallback: no header present
     try:
@@ -126,18 +198,55 @@ def load_df(path: Path) -> pd.DataFrame:
         df_no_header.columns = column_names[: len(df_no_header.columns)]
 
         df_no_header = _postprocess(df_no_header)
-        return df_no_header
+        return _write_sidecar(df_no_header, sidecar)
     except Exception as exc:
         st.error(f"Error loading {path.name}: {exc}")
         return pd.DataFrame()
 
 
-def find_csvs(directory: Path):
-    """Return a list of paths to *results.csv files under directory (recursive)."""
-    csvs = list(directory.rglob("*results.csv"))
-    # Also include custom-named CSVs (e.g., pmm_dynamic_2.csv) under summaries
-    extra = [p for p in directory.rglob("*.csv") if p not in csvs]
-    return sorted(csvs + extra)
+# Upper bound on CSVs listed in the sidebar selector
+MAX_CSV_FILES = 10_000
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def find_csvs(directory: str, mtime_ns: int):
+    """Return a list of paths to *results.csv files under directory (recursive).
+
+    *mtime_ns* is only part of the cache key so adding/removing files in
+    *directory* invalidates the cached listing; the TTL covers nested changes.
+    """
+    # One walk covers both *results.csv and custom-named CSVs (e.g., pmm_dynamic_2.csv).
+    # The walker is lazy, so the cap stops it early on huge trees.
+    return [Path(p) for p in sorted(itertools.islice(_walk_csv(directory), MAX_CSV_FILES))]
+
+
+@st.cache_data(show_spinner=False)
+def read_labels(path: str, mtime_ns: int) -> set:
+    """Return the run labels in *path*, parsing only the ``label`` column.
+
+    *mtime_ns* is part of the cache key so an updated CSV is re-read.
+    """
+    try:
+        labels = pd.read_csv(path, usecols=["label"], engine="pyarrow", dtype_backend="pyarrow")["label"]
+    except ImportError:
+        labels = pd.read_csv(path, usecols=["label"])["label"]
+    return set(labels.dropna())
+
+
+def _walk_csv(root: str):
+    """Yield every ``*.csv`` path under *root* using a single ``os.scandir`` walk."""
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.name.endswith(".csv"):
+                        yield e.path
+        except OSError:
+            continue
 
 # ---------------------------------------------------------------------------
 # Sidebar – data source selection
@@ -155,7 +264,8 @@ if results_dir_input != st.session_state.results_dir:
 
 results_dir = Path(st.session_state.results_dir).expanduser().resolve()
 
-csv_files = find_csvs(results_dir)
+results_mtime = results_dir.stat().st_mtime_ns if results_dir.is_dir() else 0
+csv_files = find_csvs(str(results_dir), results_mtime)
 if not csv_files:
     st.warning(f"No `*results.csv` files found in `{results_dir}`. Run a batch test or choose a valid directory.")
     st.stop()
@@ -180,25 +290,41 @@ if file_choice_str != st.session_state.file_choice:
 
 if sidebar.button("🔄 Reload CSV"):
     load_df.clear()
+    find_csvs.clear()
 
 # ---------------------------------------------------------------------------
 # Detail packet selector (optional candlestick preview)
 # ---------------------------------------------------------------------------
 
 try:
-    from ..packet_index import load_index, load_packet  # type: ignore
+    from ..packet_index import index_mtime_ns, load_index, load_packet, mtime_ns, processed_frame, read_creates  # type: ignore
 except ImportError:
     # Fallback when running as script or path not set up
     import importlib, pathlib, sys
     root = pathlib.Path(__file__).resolve().parents[2]
     if str(root) not in sys.path:
         sys.path.insert(0, str(root))
-    load_index, load_packet = importlib.import_module("dashboard.packet_index").load_index, importlib.import_module("dashboard.packet_index").load_packet
+    _pi = importlib.import_module("dashboard.packet_index")
+    load_index, load_packet, processed_frame = _pi.load_index, _pi.load_packet, _pi.processed_frame
+    read_creates, mtime_ns, index_mtime_ns = _pi.read_creates, _pi.mtime_ns, _pi.index_mtime_ns
+
+
+@st.cache_data(show_spinner=False)
+def cached_index(detail_dir: str, mtime_ns: int) -> pd.DataFrame:
+    """``load_index`` memoised on the index CSV (or packet directory) mtime."""
+    return load_index(Path(detail_dir))
+
+
+@st.cache_data(show_spinner=False)
+def read_create_orders(path: str, mtime_ns: int) -> pd.DataFrame:
+    """``read_creates`` memoised on the event log's mtime."""
+    return read_creates(path)
+
 
 csv_stem = file_choice.stem  # e.g., dev_results
 # Allow per-run subdirectories under detail_packets
 detail_dir = Path("results/detail_packets") / csv_stem
-idx_df = load_index(detail_dir)
+idx_df = cached_index(str(detail_dir), index_mtime_ns(detail_dir))
 
 selected_detail = None
 
@@ -216,7 +342,7 @@ else:
 
     if not csv_labels:
         try:
-            csv_labels = set(pd.read_csv(file_choice, usecols=["label"]).label.dropna())
+            csv_labels = read_labels(str(file_choice), file_choice.stat().st_mtime_ns)
         except Exception:
             csv_labels = set()
 
@@ -233,7 +359,7 @@ else:
 # ---------------------------------------------------------------------------
 # Main content – load and display data
 # ---------------------------------------------------------------------------
-df = load_df(file_choice)
+df = load_df(file_choice).copy()
 
 if df.empty:
     st.error(f"Could not load or parse data from {file_choice.name}. Check the file format.")
@@ -268,46 +394,47 @@ with st.expander("Show / Hide Table"):
 # Batch KPI header
 # ---------------------------------------------------------------------------
 
-# Helper to return an empty numeric Series when a column is absent
-def _get_series_or_empty(column_name: str) -> pd.Series:
-    return df[column_name] if column_name in df.columns else pd.Series(dtype=float)
+def _win_rate(profit_factor: pd.Series) -> float:
+    """Share of runs with a profit factor above 1, over runs that report one (0 when none do).
 
-# Compute batch-level KPIs, defaulting to zero/NaN when not available in the CSV
-net_pnl_series = _get_series_or_empty("net_pnl_quote")
-total_volume_series = _get_series_or_empty("total_volume")
-profit_factor_series = _get_series_or_empty("profit_factor")
-total_pnl_quote_series = _get_series_or_empty("total_pnl_quote")
-
-# Win-rate: share of rows whose profit_factor > 1 (only if column exists)
-if not profit_factor_series.empty:
-    win_rate_val = (profit_factor_series > 1).mean()
-else:
-    win_rate_val = 0.0
-
-# Profit factor computed from total_pnl_quote column when present
-if not total_pnl_quote_series.empty and (total_pnl_quote_series != 0).any():
-    gross_profit = total_pnl_quote_series.clip(lower=0).sum()
-    gross_loss = abs(total_pnl_quote_series.clip(upper=0).sum())
-    profit_factor_val = gross_profit / gross_loss if gross_loss != 0 else float("nan")
-else:
-    profit_factor_val = float("nan")
+    ``inf`` (a run with no losing trades) counts as a win; only missing/NaN
+    values are left out of the denominator.
+    """
+    a = profit_factor.to_numpy(dtype=np.float64, na_value=np.nan)
+    m = ~np.isnan(a)
+    return np.count_nonzero(a[m] > 1) / m.sum() if m.any() else 0.0
+
+
+def _batch_profit_factor(pnl: pd.Series) -> float:
+    """Gross profit / gross loss over *pnl*; NaN when there are no losses."""
+    # Raw ndarray reductions skip pandas' index/NA machinery
+    v = pnl.to_numpy(dtype=np.float64, na_value=0.0)
+    gross_profit = np.maximum(v, 0.0).sum()
+    gross_loss = -np.minimum(v, 0.0).sum()
+    return gross_profit / gross_loss if gross_loss != 0 else float("nan")
+
+
+# Compute batch-level KPIs in one agg pass; absent columns are reindexed to NaN
+# so their KPIs default to NaN (means/profit factor) or 0 (win rate).
+kpi_stats = df.reindex(columns=["net_pnl_quote", "total_volume", "profit_factor", "total_pnl_quote"]).agg({
+    "net_pnl_quote": "mean",
+    "total_volume": "mean",
+    # Win-rate: share of rows whose profit_factor > 1
+    "profit_factor": _win_rate,
+    # Profit factor computed from total_pnl_quote column
+    "total_pnl_quote": _batch_profit_factor,
+})
 
 batch_results = {
-    "net_pnl_quote": net_pnl_series.mean(),
-    "total_volume": total_volume_series.mean(),
-    "win_rate": win_rate_val,
-    "profit_factor": profit_factor_val,
+    "net_pnl_quote": kpi_stats["net_pnl_quote"],
+    "total_volume": kpi_stats["total_volume"],
+    "win_rate": kpi_stats["profit_factor"],
+    "profit_factor": kpi_stats["total_pnl_quote"],
 }
 
 st.subheader("Batch Performance Summary")
 b1, b2, b3, b4 = st.columns(4)
 
-HELP_TEXTS = {
-    "pnl": "The average **Net PNL** across all successful runs in the selected CSV file.\n\n- **Source Column**: `net_pnl_quote`\n- **Aggregation**: Mean\n- **Note**: This is not volume-weighted and does not normalize for different quote currencies.",
-    "volume": "The average **Total Volume** traded across all successful runs.\n\n- **Source Column**: `total_volume`\n- **Aggregation**: Mean\n- **Note**: Volume is measured in the quote asset.",
-    "win_rate": "The percentage of runs in the batch that were profitable.\n\n- **Formula**: `(Number of runs with Profit Factor > 1) / (Total number of runs)`\n- **Note**: This is a *run-level* metric, not a *trade-level* win rate.",
-    "profit_factor": "The sum of all profits divided by the sum of all losses for the entire batch.\n\n- **Formula**: `sum(gross_profit) / sum(gross_loss)`\n- **Source Column**: `total_pnl_quote`\n- **Note**: A value greater than 1 indicates overall profitability."
-}
 
 def render_kpi_with_info(column, title: str, value_str: str, help_key: str):
     with column:
@@ -331,10 +458,35 @@ render_kpi_with_info(b4, "Profit Factor", f"{batch_results['profit_factor']:.2f}
 base_cols = ["label", "algo", "net_pnl_quote", "total_volume", "total_trades", "profit_factor", "sharpe_ratio"]
 leader_cols = [c for c in base_cols if c in df.columns]
 display_df = df[leader_cols].copy()
-gb = GridOptionsBuilder.from_dataframe(display_df)
-gb.configure_default_column(sortable=True, resizable=True)
-gb.configure_selection(selection_mode="single", use_checkbox=False)
-grid = AgGrid(display_df, gridOptions=gb.build(), theme="streamlit", height=300, update_mode="SELECTION_CHANGED")
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda d: (tuple(d.columns), tuple(map(str, d.dtypes)))})
+def leaderboard_grid_options(frame: pd.DataFrame) -> dict:
+    """Build leaderboard GridOptions once per column layout.
+
+    Keyed on column names/dtypes only (not row count), so reloading or
+    filtering rows still reuses the cached options.
+    """
+    gb = GridOptionsBuilder.from_dataframe(frame)
+    gb.configure_default_column(sortable=True, resizable=True)
+    gb.configure_selection(selection_mode="single", use_checkbox=False)
+    return gb.build()
+
+
+# The key fingerprints the data (CSV path + mtime + row count): while it is
+# unchanged reload_data=False lets the grid reuse its rows across reruns, and a
+# new/rewritten CSV gets a fresh grid instead of the previous file's rows.
+leaderboard_key = f"leaderboard_grid:{file_choice}:{mtime_ns(file_choice)}:{len(display_df)}"
+grid = AgGrid(
+    display_df,
+    gridOptions=leaderboard_grid_options(display_df),
+    theme="streamlit",
+    height=300,
+    update_mode=GridUpdateMode.SELECTION_CHANGED,
+    data_return_mode=DataReturnMode.FILTERED_AND_SORTED,
+    reload_data=False,
+    key=leaderboard_key,
+)
 
 if grid["selected_rows"]:
     sel_label = grid["selected_rows"][0]["label"]
@@ -350,7 +502,9 @@ algo_col_candidates = [c for c in df.columns if c in ("algo", "controller_name",
 algo_col = sidebar.selectbox("Group / filter by column", algo_col_candidates) if algo_col_candidates else None
 
 if algo_col and algo_col in df.columns:
-    algos = sorted(df[algo_col].dropna().unique())
+    # Categorical codes turn the isin filter into an integer compare
+    df[algo_col] = df[algo_col].astype("category")
+    algos = list(df[algo_col].cat.categories)
     chosen_algos = sidebar.multiselect("Filter values", algos, default=algos)
     df_display = df[df[algo_col].isin(chosen_algos)]
 else:
@@ -374,34 +528,21 @@ with col1:
             fig = px.bar(df_display, x="label", y="net_pnl_quote", color=algo_col)
             fig.update_layout(xaxis_title="Test Label", yaxis_title="PNL (Quote)", showlegend=False)
             st.plotly_chart(fig, use_container_width=True)
-        render_chart_with_info(chart, "Net PNL Quote by Test Run", 
-                               "A bar chart showing the final **Net PNL** for each individual test run.\n\n"
-                               "- **X-axis**: `label` (the unique ID for each run)\n"
-                               "- **Y-axis**: `net_pnl_quote`\n"
-                               "- **Source**: Directly from the results CSV, one bar per row.")
+        render_chart_with_info(chart, "Net PNL Quote by Test Run", CHART_HELP["net_pnl_by_run"])
 
     if "profit_factor" in df_display.columns and algo_col:
         def chart():
             fig = px.box(df_display, x=algo_col, y="profit_factor", color=algo_col)
             fig.update_layout(showlegend=False)
             st.plotly_chart(fig, use_container_width=True)
-        render_chart_with_info(chart, "Profit Factor Distribution", 
-                               "A box plot showing the distribution of the **Profit Factor** for each algorithm.\n\n"
-                               "- The **box** shows the interquartile range (IQR), from the 25th to 75th percentile.\n"
-                               "- The **line** in the middle is the median (50th percentile).\n"
-                               "- The **whiskers** extend to show the rest of the distribution (typically 1.5x IQR).\n"
-                               "- **Points** outside the whiskers are outliers.")
+        render_chart_with_info(chart, "Profit Factor Distribution", CHART_HELP["profit_factor_dist"])
 
     if {"profit_factor", "accuracy_long"}.issubset(df_display.columns):
         def chart():
             fig = px.scatter(df_display, x="accuracy_long", y="profit_factor", color=algo_col, hover_data=["label"])
             fig.update_layout(showlegend=False)
             st.plotly_chart(fig, use_container_width=True)
-        render_chart_with_info(chart, "Profit Factor vs Accuracy",
-                               "A scatter plot to visualize the relationship between profitability and trade accuracy.\n\n"
-                               "- **X-axis**: `accuracy_long` (% of profitable long trades)\n"
-                               "- **Y-axis**: `profit_factor` (Gross Profit / Gross Loss)\n"
-                               "- **Source**: Each point represents one run from the CSV.")
+        render_chart_with_info(chart, "Profit Factor vs Accuracy", CHART_HELP["profit_factor_vs_accuracy"])
 
 with col2:
     if {"total_volume", "net_pnl_quote"}.issubset(df_display.columns):
@@ -409,34 +550,21 @@ with col2:
             fig = px.scatter(df_display, x="total_volume", y="net_pnl_quote", color=algo_col, hover_data=["label"])
             fig.update_layout(showlegend=False)
             st.plotly_chart(fig, use_container_width=True)
-        render_chart_with_info(chart, "Volume vs Net PNL",
-                               "A scatter plot showing the relationship between total trading volume and the final Net PNL.\n\n"
-                               "- **X-axis**: `total_volume` (Total value of trades in quote currency)\n"
-                               "- **Y-axis**: `net_pnl_quote`\n"
-                               "- **Source**: Each point represents one run from the CSV.")
+        render_chart_with_info(chart, "Volume vs Net PNL", CHART_HELP["volume_vs_pnl"])
 
     if "accuracy_long" in df_display.columns and algo_col:
         def chart():
             fig = px.box(df_display, x=algo_col, y="accuracy_long", color=algo_col)
             fig.update_layout(showlegend=False)
             st.plotly_chart(fig, use_container_width=True)
-        render_chart_with_info(chart, "Accuracy Distribution by Algorithm",
-                               "A box plot showing the distribution of **Long Trade Accuracy** for each algorithm.\n\n"
-                               "- The **box** shows the interquartile range (IQR), from the 25th to 75th percentile.\n"
-                               "- The **line** in the middle is the median (50th percentile).\n"
-                               "- The **whiskers** extend to show the rest of the distribution (typically 1.5x IQR).\n"
-                               "- **Points** outside the whiskers are outliers.")
+        render_chart_with_info(chart, "Accuracy Distribution by Algorithm", CHART_HELP["accuracy_dist"])
 
     if "sharpe_ratio" in df_display.columns and "net_pnl_quote" in df_display.columns:
         def chart():
             fig = px.histogram(df_display, x="sharpe_ratio", color=algo_col, marginal="rug")
             fig.update_layout(showlegend=False)
             st.plotly_chart(fig, use_container_width=True)
-        render_chart_with_info(chart, "Sharpe Ratio Distribution",
-                               "A histogram showing the distribution of the **Sharpe Ratio** across all runs.\n\n"
-                               "- **X-axis**: `sharpe_ratio`\n"
-                               "- **Y-axis**: Frequency (count of runs in each bin)\n"
-                               "- **Note**: The 'rug' marks along the bottom show the exact location of each individual run's Sharpe Ratio.")
+        render_chart_with_info(chart, "Sharpe Ratio Distribution", CHART_HELP["sharpe_dist"])
 
 # ---------------------------------------------------------------------------
 # Graph preview for selected run (detail packet)
@@ -454,12 +582,7 @@ if selected_detail:
                 with st.expander("Show raw server response"):
                     st.code(raw_response, language="text")
         else:
-            proc = detail_data["processed_data"]
-            if "features" in proc and isinstance(proc["features"], dict):
-                df_feat = pd.DataFrame(proc["features"])  # type: ignore[arg-type]
-            else:
-                # assume flat dict-of-lists (keys are columns)
-                df_feat = pd.DataFrame(proc)  # type: ignore[arg-type]
+            df_feat = processed_frame(detail_data, detail_dir)
             executors = detail_data.get("executors", [])
             results = detail_data["results"]
 
@@ -471,8 +594,7 @@ if selected_detail:
                 ev_path = detail_data.get("event_log_csv")
                 if ev_path and Path(ev_path).exists():
                     try:
-                        ev_df = pd.read_csv(ev_path)
-                        extra_orders_df = ev_df[ev_df["event_type"] == "CREATE"]
+                        extra_orders_df = read_create_orders(ev_path, mtime_ns(Path(ev_path)))
                     except Exception as e:
                         logging.warning(f"Could not process event log {ev_path}: {e}")
 
@@ -487,8 +609,9 @@ if selected_detail:
     except Exception as exc:
         st.warning(f"Could not load detail packet: {exc}")
 
-# Load CSV and drop rows with 'error' (failed backtests)
-df = pd.read_csv(file_choice)
+# Drop rows with 'error' (failed backtests) – reuse the cached frame, copied
+# so the cached object is never mutated
+df = load_df(file_choice).copy()
 if 'error' in df.columns:
     failed = df[df['error'].notna()]
     if not failed.empty:
@@ -2,8 +2,13 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
+import csv
 from pathlib import Path
-import json
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    import json as orjson  # type: ignore
 
 # Ensure CSS overrides
 try:
@@ -15,7 +20,19 @@ except ImportError:
         sys.path.insert(0, str(root))
     importlib.import_module("dashboard.theme_overrides")
 
-from hb_components import create_backtesting_figure, render_backtesting_metrics
+from hb_components import create_backtesting_figure, downsample_lttb, render_backtesting_metrics
+
+# Index helper to avoid stat-ing every packet
+try:
+    from ..packet_index import index_mtime_ns, load_index, processed_frame, read_creates  # type: ignore
+except ImportError:
+    import importlib, pathlib, sys
+    root = pathlib.Path(__file__).resolve().parents[2]
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    _pi = importlib.import_module("dashboard.packet_index")
+    load_index, processed_frame, read_creates = _pi.load_index, _pi.processed_frame, _pi.read_creates
+    index_mtime_ns = _pi.index_mtime_ns
 
 # ---------------------------------------------------------------------------
 # Page Config
@@ -26,6 +43,29 @@ st.title("🏅 Top 5")
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
+COLUMN_NAMES = [
+    'algo', 'label', 'market', 'return_pct', 'net_pnl_quote', 'total_positions',
+    'total_trades', 'total_pnl_quote', 'total_buy_trades', 'total_sell_trades',
+    'accuracy_long', 'accuracy_short', 'total_volume', 'avg_close_time',
+    'avg_profit_per_trade', 'sharpe_ratio', 'profit_factor', 'winning_trades',
+    'losing_trades', 'total_open_trades', 'total_closed_trades', 'param_1', 'param_2'
+]
+STR_COLS = {'algo', 'label', 'market'}
+NUMERIC_COLS = set(COLUMN_NAMES[3:21])
+KNOWN_DTYPES = {c: "string" for c in STR_COLS} | {c: "float64" for c in NUMERIC_COLS}
+
+
+def _header_is_duplicated(path: Path) -> bool:
+    """Sniff the first two raw lines: a repeated header means a header-less append."""
+    with path.open("r", newline="") as fh:
+        rdr = csv.reader(fh)
+        header = next(rdr, None)
+        first = next(rdr, None)
+    if not header or not first:
+        return False
+    return [c.strip().lower() for c in header[:3]] == [c.strip().lower() for c in first[:3]]
+
+
 @st.cache_data(show_spinner="Loading data...")
 def load_df(path: Path) -> pd.DataFrame:
     """Robust CSV loader that auto-detects header presence (mirrors Overview page)."""
@@ -33,57 +73,118 @@ def load_df(path: Path) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame()
 
-    column_names = [
-        'algo', 'label', 'market', 'return_pct', 'net_pnl_quote', 'total_positions',
-        'total_trades', 'total_pnl_quote', 'total_buy_trades', 'total_sell_trades',
-        'accuracy_long', 'accuracy_short', 'total_volume', 'avg_close_time',
-        'avg_profit_per_trade', 'sharpe_ratio', 'profit_factor', 'winning_trades',
-        'losing_trades', 'total_open_trades', 'total_closed_trades', 'param_1', 'param_2'
-    ]
-
-    def _postprocess(df_in: pd.DataFrame) -> pd.DataFrame:
-        df_out = df_in.copy()
-        df_out = df_out.loc[:, ~df_out.columns.str.contains('^Unnamed', na=False)]
+    def _postprocess(df_out: pd.DataFrame, typed=()) -> pd.DataFrame:
         df_out.dropna(axis=1, how='all', inplace=True)
 
-        for col in df_out.columns:
-            try:
-                df_out[col] = pd.to_numeric(df_out[col])
-            except (ValueError, TypeError):
-                # This column cannot be converted to numeric, so we leave it as is.
-                pass
+        # Columns outside the known schema: keep as numeric only if every value parses
+        for col in df_out.columns.difference(list(typed)):
+            if pd.api.types.is_numeric_dtype(df_out[col]):
+                continue
+            converted = pd.to_numeric(df_out[col], errors="coerce")
+            if converted.notna().sum() == df_out[col].notna().sum():
+                df_out[col] = converted
 
         if 'label' not in df_out.columns or df_out['label'].isnull().any():
-            df_out['label'] = [f"run_{i}" for i in df_out.index]
+            df_out['label'] = 'run_' + df_out.index.astype(str)
         return df_out
 
-    def _row0_is_duplicate_header(df_test: pd.DataFrame) -> bool:
-        if df_test.empty:
-            return False
-        header_vals = [str(c).strip().lower() for c in df_test.columns]
-        row0_vals = [str(v).strip().lower() for v in df_test.iloc[0].values]
-        return header_vals[:3] == row0_vals[:3]
-
     try:
-        df_header = pd.read_csv(path, header=0)
-        if _row0_is_duplicate_header(df_header):
-            raise ValueError
-        df_header = _postprocess(df_header)
-        return df_header
+        if not _header_is_duplicated(path):
+            try:
+                return _postprocess(
+                    pd.read_csv(
+                        path,
+                        usecols=lambda c: not str(c).startswith("Unnamed"),
+                        dtype=KNOWN_DTYPES,
+                        engine="c",
+                    ),
+                    typed=KNOWN_DTYPES.keys(),
+                )
+            except (ValueError, TypeError):
+                # Non-numeric values in a known column – coerce per column instead
+                return _postprocess(pd.read_csv(path, usecols=lambda c: not str(c).startswith("Unnamed"), engine="c"))
     except Exception:
         pass
 
     # Fallback no-header.
     try:
-        df_no_header = pd.read_csv(path, header=None)
-        df_no_header.columns = column_names[: len(df_no_header.columns)]
-        df_no_header = _postprocess(df_no_header)
-        return df_no_header
+        df_no_header = pd.read_csv(path, header=None, engine="c")
+        df_no_header.columns = COLUMN_NAMES[: len(df_no_header.columns)]
+        return _postprocess(df_no_header)
     except Exception as exc:
         st.error(f"Error loading {path.name}: {exc}")
         return pd.DataFrame()
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
+def get_bundle(packet_path: str, mtime: float) -> dict:
+    """Parse a detail packet into everything a Top-5 panel renders, memoised on path + mtime.
+
+    ``df_feat`` only feeds the back-testing figure, so it is LTTB-downsampled to ~2k
+    rows here; executor/trade overlays are drawn from the full executor list.
+    """
+    data = orjson.loads(Path(packet_path).read_bytes())
+    if "results" not in data or not data.get("results"):
+        return {"error": data.get("error", "Packet is missing 'results' data or results are empty."), "raw": data.get("raw")}
+    return {
+        "results": data["results"],
+        "executors": data["executors"],
+        "df_feat": downsample_lttb(processed_frame(data, Path(packet_path).parent)),
+        "event_log_csv": data.get("event_log_csv"),
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _load_creates(path: str, mtime: float) -> pd.DataFrame:
+    """``read_creates`` memoised on path + mtime."""
+    return read_creates(path)
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def get_backtest_figure(packet_path: str, mtime: float, event_mtime: float | None = None):
+    """Build the back-testing figure for a packet; reused while packet and event log are unchanged."""
+    bundle = get_bundle(packet_path, mtime)
+    event_log = bundle["event_log_csv"]
+    return create_backtesting_figure(
+        bundle["df_feat"],
+        bundle["executors"],
+        {"trading_pair": bundle["results"].get("market", "N/A")},
+        extra_orders=_load_creates(event_log, event_mtime) if event_mtime is not None else None,
+        include_signals=True,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def valid_packet_labels(detail_dir: str, mtime_ns: int) -> frozenset[str]:
+    """Labels flagged valid in the packet index, memoised on the index (or directory) mtime."""
+    idx_df = load_index(Path(detail_dir))
+    if idx_df.empty:
+        return frozenset()
+    return frozenset(idx_df.loc[idx_df["valid"].isin([1, "1", True]), "label"].astype(str))
+
+
+# Metrics for the radar chart (add/remove here as needed)
+SPIDER_METRICS = (
+    "net_pnl_quote",          # absolute profitability
+    "profit_factor",          # ratio of gross profit to gross loss
+    "accuracy_long",          # long-side hit rate
+    "accuracy_short",         # short-side hit rate (if available)
+    "sharpe_ratio",           # risk-adjusted return
+    "inverse_max_drawdown",   # 1 − max_drawdown_pct (risk proxy)
+    "return_over_volume",     # capital efficiency
+)
+
+
+@st.cache_data(show_spinner=False)
+def _metric_stats(df: pd.DataFrame, metrics: tuple[str, ...]) -> dict[str, tuple[float, float, int]]:
+    """Return ``(min, max, nunique)`` per numeric metric column, computed once per summary."""
+    return {
+        m: (df[m].min(skipna=True), df[m].max(skipna=True), df[m].nunique(dropna=True))
+        for m in metrics
+        if m in df.columns and pd.api.types.is_numeric_dtype(df[m])
+    }
+
+
 # Fallback minmax scaling (avoids sklearn dependency)
 
 def _minmax_scale(arr):
@@ -97,13 +198,17 @@ def _minmax_scale(arr):
     return (arr - min_val) / (max_val - min_val)
 
 
+# Seeded generator for the placeholder metrics – one C call per array, reproducible output
+_RNG = np.random.default_rng(0)
+
+
 @st.cache_data
 def add_mock_advanced_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """Add additional mock metrics used by visualisations."""
     if 'total_trade_volume' not in df.columns:
-        df['total_trade_volume'] = [np.random.uniform(10_000, 100_000) for _ in range(len(df))]
+        df['total_trade_volume'] = _RNG.uniform(10_000, 100_000, size=len(df))
     if 'max_drawdown' not in df.columns:
-        df['max_drawdown'] = [np.random.uniform(0.05, 0.3) for _ in range(len(df))]
+        df['max_drawdown'] = _RNG.uniform(0.05, 0.3, size=len(df))
 
     df['inverse_max_drawdown'] = 1 - df['max_drawdown']
     df['return_over_volume'] = df['net_pnl_quote'] / df['total_trade_volume']
@@ -114,18 +219,14 @@ def add_mock_advanced_metrics(df: pd.DataFrame) -> pd.DataFrame:
 def get_mock_playthrough_data(pnl: float, label: str) -> pd.DataFrame:
     """Generate synthetic price, trade and pnl series (placeholder)."""
     timestamps = pd.to_datetime(np.arange(1, 101), unit='h', origin=pd.Timestamp('2023-01-01'))
-    price = 100 + np.random.randn(100).cumsum()
-
-    trade_indices = np.random.choice(range(100), size=20, replace=False)
-    sides = np.random.choice(['buy', 'sell'], size=20)
+    price = 100 + _RNG.standard_normal(100).cumsum()
 
-    trades = pd.DataFrame(index=timestamps)
-    trades['price'] = price
-    trades['side'] = np.nan
-    trades.loc[timestamps[trade_indices], 'side'] = sides
+    trade_indices = _RNG.choice(100, size=20, replace=False)
+    side = np.full(100, np.nan, dtype=object)
+    side[trade_indices] = _RNG.choice(['buy', 'sell'], size=20)
 
-    noise = np.random.normal(loc=pnl / (100 * 2), scale=abs(pnl / 20) if pnl != 0 else 1, size=100)
-    trades['pnl'] = np.cumsum(noise)
+    noise = _RNG.normal(loc=pnl / (100 * 2), scale=abs(pnl / 20) if pnl != 0 else 1, size=100)
+    trades = pd.DataFrame({'price': price, 'side': side, 'pnl': np.cumsum(noise)}, index=timestamps)
 
     return trades.reset_index().rename(columns={'index': 'timestamp'})
 
@@ -156,47 +257,49 @@ df_top5 = df_summary.sort_values(rank_kpi, ascending=False).head(5)
 
 st.success(f"Top 5 runs by {rank_kpi} (descending)")
 
-for idx, row in df_top5.iterrows():
+metric_stats = _metric_stats(df_summary, SPIDER_METRICS)
+
+detail_dir = Path("results/detail_packets") / csv_path.stem
+valid_labels = valid_packet_labels(str(detail_dir), index_mtime_ns(detail_dir))
+
+def render_panel(idx, row: pd.Series) -> None:
+    """Render one Top-5 panel: back-testing figure, metrics, radar chart and parameters."""
     label = row["label"]
     kpi_val = row[rank_kpi]
 
     st.subheader(f"🏷️ {idx+1}. {label} — {rank_kpi}: {kpi_val:,.4f}")
 
     # Load detail packet ---------------------------------------------------
-    packet_path = Path("results/detail_packets") / csv_path.stem / f"{label}.json"
-    if not packet_path.exists():
+    if str(label) not in valid_labels:
         st.warning("Detail packet missing – run batch again.")
-        continue
+        return
 
+    packet_path = detail_dir / f"{label}.json"
     try:
-        data = json.loads(packet_path.read_text())
-    except json.JSONDecodeError as exc:
+        packet_mtime = packet_path.stat().st_mtime
+        data = get_bundle(str(packet_path), packet_mtime)
+    except FileNotFoundError:
+        # Index is stale – the packet was removed after it was written
+        st.warning("Detail packet missing – run batch again.")
+        return
+    except orjson.JSONDecodeError as exc:
         st.warning(f"Malformed detail packet for {label}: {exc}")
-        continue
+        return
 
-    if "results" not in data or not data.get("results"):
-        error_msg = data.get("error", "Packet is missing 'results' data or results are empty.")
-        raw_response = data.get("raw")
-        st.warning(f"Skipping {label}: {error_msg}")
-        if raw_response:
+    if "error" in data:
+        st.warning(f"Skipping {label}: {data['error']}")
+        if data["raw"]:
             with st.expander("Show raw server response"):
-                st.code(raw_response, language='text')
-        continue
-
-    df_feat = pd.DataFrame(data["processed_data"])
+                st.code(data["raw"], language='text')
+        return
 
     cols_top = st.columns([3, 2])
 
     # --- Left: Backtesting figure ---------------------------------------
     with cols_top[0]:
-        tp = data["results"].get("market", "N/A")
-        fig = create_backtesting_figure(
-            df_feat,
-            data["executors"],
-            {"trading_pair": tp},
-            extra_orders=pd.read_csv(data["event_log_csv"])[lambda d: d.event_type=="CREATE"] if "event_log_csv" in data else None,
-            include_signals=True,
-        )
+        event_log = Path(data["event_log_csv"]) if data["event_log_csv"] else None
+        event_mtime = event_log.stat().st_mtime if event_log and event_log.exists() else None
+        fig = get_backtest_figure(str(packet_path), packet_mtime, event_mtime)
         st.plotly_chart(fig, use_container_width=True, key=f"fig_{label}")
 
     # --- Right: Metrics & Spider chart ----------------------------------
@@ -227,43 +330,24 @@ for idx, row in df_top5.iterrows():
         if "accuracy" in res and "accuracy_long" not in res:
             res["accuracy_long"] = res.get("accuracy")
 
-        # -------------------------------------------------------------
-        # Select metrics for the radar chart (add/remove here as needed)
-        # -------------------------------------------------------------
-        spider_metrics = [
-            "net_pnl_quote",          # absolute profitability
-            "profit_factor",          # ratio of gross profit to gross loss
-            "accuracy_long",          # long-side hit rate
-            "accuracy_short",         # short-side hit rate (if available)
-            "sharpe_ratio",           # risk-adjusted return
-            "inverse_max_drawdown",   # 1 − max_drawdown_pct (risk proxy)
-            "return_over_volume",     # capital efficiency
-        ]
-
-        # Keep only the metrics present in the result set
-        spider_metrics = [m for m in spider_metrics if m in res]
+        # Keep only the radar metrics present in the result set
+        spider_metrics = [m for m in SPIDER_METRICS if m in res]
 
         # -----------------------------------------------------------------
         # 1⃣  Scale each metric RELATIVE TO THE WHOLE RESULTS DF  ---------
         #     This avoids one very large metric (e.g. net_pnl_quote)         
         #     dwarfing the others and producing a near-zero polygon.         
         # -----------------------------------------------------------------
-        scaled_vals = []
-        for m in spider_metrics:
-            raw_val = float(res.get(m, 0))
-            col = df_summary[m] if m in df_summary.columns else None
-            if col is not None and col.nunique(dropna=True) > 1:
-                col_min, col_max = col.min(skipna=True), col.max(skipna=True)
-                # Protect division by zero
-                if col_max - col_min == 0:
-                    scaled = 0.5  # neutral centre
-                else:
-                    scaled = (raw_val - col_min) / (col_max - col_min)
-                    scaled = max(0, min(1, scaled))
-            else:
-                scaled = 0.5
-            scaled_vals.append(scaled)
-         
+        raw_vals = np.array([float(res.get(m, 0)) for m in spider_metrics], dtype=float)
+        lo, hi, n_unique = np.array(
+            [metric_stats.get(m, (np.nan, np.nan, 0)) for m in spider_metrics], dtype=float
+        ).reshape(-1, 3).T
+        span = hi - lo
+        # Columns with a single distinct value (or zero span) sit at the neutral centre
+        valid = (n_unique > 1) & (span != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled_vals = np.where(valid, np.clip((raw_vals - lo) / span, 0, 1), 0.5).tolist()
+
         fig_spider = go.Figure(
             data=[
                 go.Scatterpolar(
@@ -287,7 +371,12 @@ for idx, row in df_top5.iterrows():
     with st.expander("Show run parameters"):
         st.json({k: v for k, v in row.items() if k not in (numeric_cols + ["label"])})
 
-    st.markdown("---")
+
+# Only the selected rank is built – st.tabs would still execute (and ship) all five bodies
+rank_labels = [f"#{i + 1} {lbl}" for i, lbl in enumerate(df_top5["label"])]
+rank_choice = st.radio("Rank", rank_labels, horizontal=True, label_visibility="collapsed")
+rank_pos = rank_labels.index(rank_choice)
+render_panel(df_top5.index[rank_pos], df_top5.iloc[rank_pos])
 
 # ---------------------------------------------------------------------------
 # End of page content after Top-5 panels
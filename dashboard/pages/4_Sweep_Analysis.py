@@ -43,11 +43,6 @@ yaml_choice: Path | None = st.sidebar.selectbox("Sweep YAML (optional)", yaml_fi
 # Load CSV
 # ---------------------------------------------------------------------------
 
-df = pd.read_csv(csv_choice)
-if df.empty:
-    st.error("Selected CSV is empty.")
-    st.stop()
-
 # Convert stringified single-element lists like "[0.005]" → 0.005 for easier filtering
 def _maybe_unwrap(val):
     if isinstance(val, str) and val.startswith("[") and val.endswith("]"):
@@ -59,7 +54,28 @@ def _maybe_unwrap(val):
             pass
     return val
 
-df = df.applymap(_maybe_unwrap)
+
+@st.cache_data(show_spinner="Loading sweep summary...", max_entries=8)
+def load_sweep_df(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Read a summary CSV and unwrap list cells, memoised on path + mtime."""
+    df = pd.read_csv(path)
+
+    # Only object columns can hold "[...]" strings; parse just the cells that match
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        s = df[col].astype(str)
+        mask = s.str.startswith("[") & s.str.endswith("]")
+        if mask.any():
+            if df[col].dtype != object:
+                # String-dtype columns cannot hold the unwrapped numbers
+                df[col] = df[col].astype(object)
+            df.loc[mask, col] = df.loc[mask, col].map(_maybe_unwrap)
+    return df
+
+
+df = load_sweep_df(str(csv_choice), csv_choice.stat().st_mtime_ns)
+if df.empty:
+    st.error("Selected CSV is empty.")
+    st.stop()
 
 # Identify sweep parameter columns
 if yaml_choice and yaml_choice.exists():
@@ -78,6 +94,10 @@ if not param_cols:
     st.error("Sweep parameter columns not found in the CSV.")
     st.stop()
 
+# Few distinct values per parameter – categorical codes make unique/filter/groupby cheap
+for p in param_cols:
+    df[p] = df[p].astype("category")
+
 # Metric choices (numeric columns)
 metric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
 metric_default = "net_pnl_quote" if "net_pnl_quote" in metric_cols else metric_cols[0]
@@ -96,7 +116,7 @@ other_params = [p for p in param_cols if p not in {x_param, (y_param_sel if y_pa
 with st.sidebar.expander("Lock other parameters", expanded=False):
     filters = {}
     for p in other_params:
-        vals = sorted(df[p].dropna().unique())
+        vals = df[p].cat.categories.tolist()
         if len(vals) <= 1:
             continue  # nothing to filter
         vals_display = ["<Any>"] + list(vals)
@@ -128,7 +148,7 @@ if y_param_sel == "<None>":
     fig.update_layout(xaxis_title=x_param, yaxis_title=metric_col)
     st.plotly_chart(fig, use_container_width=True)
 else:
-    piv = df.pivot_table(index=y_param_sel, columns=x_param, values=metric_col, aggfunc="mean")
+    piv = df.groupby([y_param_sel, x_param], sort=True, observed=True)[metric_col].mean().unstack(x_param)
     fig = px.imshow(piv, x=piv.columns, y=piv.index, color_continuous_scale="RdYlGn", aspect="auto")
     fig.update_layout(xaxis_title=x_param, yaxis_title=y_param_sel, coloraxis_colorbar_title=metric_col)
     st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
@@ -1,16 +1,18 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
 import plotly.express as px
 
 from hb_components import (
     create_backtesting_figure,
+    downsample_lttb,
     render_backtesting_metrics,
     render_accuracy_metrics,
     render_close_types,
 )
-from st_aggrid import AgGrid, GridOptionsBuilder, JsCode
+from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, JsCode
 # CSS overrides
 try:
     from .. import theme_overrides  # noqa: F401
@@ -23,13 +25,102 @@ except ImportError:
 
 # Index helper to avoid scanning every JSON
 try:
-    from ..packet_index import load_index, load_packet  # type: ignore
+    from ..packet_index import index_mtime_ns, load_index, load_packet, mtime_ns, processed_frame, read_creates  # type: ignore
 except ImportError:
     import importlib, pathlib, sys
     root = pathlib.Path(__file__).resolve().parents[2]
     if str(root) not in sys.path:
         sys.path.insert(0, str(root))
-    load_index, load_packet = importlib.import_module("dashboard.packet_index").load_index, importlib.import_module("dashboard.packet_index").load_packet
+    _pi = importlib.import_module("dashboard.packet_index")
+    load_index, load_packet, processed_frame = _pi.load_index, _pi.load_packet, _pi.processed_frame
+    read_creates, mtime_ns, index_mtime_ns = _pi.read_creates, _pi.mtime_ns, _pi.index_mtime_ns
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    import json as orjson  # type: ignore
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def feature_frame(path: str, mtime: float) -> pd.DataFrame:
+    """Build the ``processed_data`` frame of a detail packet, memoised on path + mtime.
+
+    The frame only feeds the back-testing figure, so it is LTTB-downsampled to ~2k
+    rows here; executor/trade overlays are drawn from the full executor list.
+    """
+    data = orjson.loads(Path(path).read_bytes())
+    return downsample_lttb(processed_frame(data, Path(path).parent))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def executors_frame(path: str, mtime: float) -> pd.DataFrame:
+    """Flatten a detail packet's executors, memoised on path + mtime."""
+    data = orjson.loads(Path(path).read_bytes())
+    return pd.json_normalize(data["executors"])
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def cached_index(detail_dir: str, mtime_ns: int) -> pd.DataFrame:
+    """``load_index`` memoised on the index CSV (or packet directory) mtime."""
+    return load_index(Path(detail_dir))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def row_configs(csv_path: str, mtime_ns: int) -> dict[str, dict]:
+    """Map each run label in a results CSV to its row, parsed once per CSV mtime."""
+    try:
+        df_csv = pd.read_csv(csv_path, engine="pyarrow")
+    except ImportError:
+        df_csv = pd.read_csv(csv_path, engine="c")
+    if "label" not in df_csv.columns:
+        return {}
+    df_csv = df_csv.drop_duplicates("label", keep="first").set_index("label", drop=False)
+    return df_csv.to_dict(orient="index")
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def load_creates(path: str, mtime: float) -> pd.DataFrame:
+    """``read_creates`` memoised on path + mtime."""
+    return read_creates(path)
+
+
+def _first_col(df: pd.DataFrame, *names: str, default=np.nan) -> pd.Series:
+    """Return the first of *names* present in *df*, back-filled from the later ones."""
+    out = pd.Series(default, index=df.index, dtype=object)
+    for name in reversed(names):
+        if name in df.columns:
+            out = df[name].where(df[name].notna(), out)
+    return out
+
+
+def build_trade_log(ex_df: pd.DataFrame) -> pd.DataFrame:
+    """Derive the trade-log table from a flattened executors frame in one vectorised pass."""
+    if ex_df.empty:
+        return pd.DataFrame()
+    ts = pd.to_numeric(_first_col(ex_df, "close_timestamp", "timestamp", default=0), errors="coerce").fillna(0)
+    order = np.argsort(ts.to_numpy(), kind="stable")
+    ex_df, ts = ex_df.iloc[order], ts.iloc[order]
+
+    filled = pd.to_numeric(_first_col(ex_df, "filled_amount_quote"), errors="coerce").replace(0, np.nan)
+    filled = filled.fillna(pd.to_numeric(_first_col(ex_df, "order_size_quote"), errors="coerce")).fillna(0)
+    mask = (filled != 0).to_numpy()
+    ex_df, ts, filled = ex_df[mask], ts[mask], filled[mask]  # skip zero-volume orders
+
+    side = _first_col(ex_df, "side", "config.side", default=1)
+    is_buy = (pd.to_numeric(side, errors="coerce").eq(1) | side.astype(str).str.lower().eq("buy")).to_numpy()
+    signed = np.where(is_buy, filled.to_numpy(), -filled.to_numpy())
+
+    return pd.DataFrame(
+        {
+            "Time": pd.to_datetime(ts.to_numpy(), unit="s").strftime("%Y-%m-%dT%H:%M:%S"),
+            "Side": np.where(is_buy, "BUY", "SELL"),
+            "Size (quote)": filled.to_numpy(dtype="float64"),
+            "Price": pd.to_numeric(_first_col(ex_df, "config.entry_price", "entry_price"), errors="coerce").to_numpy(dtype="float64"),
+            "P/L": pd.to_numeric(_first_col(ex_df, "net_pnl_quote", default=0), errors="coerce").to_numpy(dtype="float64"),
+            "Cum Pos": signed.cumsum(),
+        }
+    )
+
 
 st.set_page_config(page_title="Experiment Analysis", layout="wide")
 st.title("🔬 Experiment Analysis")
@@ -40,7 +131,7 @@ csv_stem = csv_path.stem if csv_path else "unknown"
 detail_dir = Path("results/detail_packets") / csv_stem
 
 # Load index & filter
-idx_df = load_index(detail_dir)
+idx_df = cached_index(str(detail_dir), index_mtime_ns(detail_dir))
 if idx_df.empty:
     st.warning("No index file found. Run batch tester first to generate detail packets.")
     st.stop()
@@ -98,21 +189,18 @@ if "config" in data and data["config"]:
         st.json(data["config"], expanded=False)
 
 # Figure
-df_feat = pd.DataFrame(data["processed_data"])
-event_df = None
+packet_path = detail_dir / f"{selected}.json"
+packet_mtime = packet_path.stat().st_mtime
+df_feat = feature_frame(str(packet_path), packet_mtime)
+order_creates = None
 if "event_log_csv" in data:
     try:
         ev_path = Path(data["event_log_csv"])
         if ev_path.exists():
-            event_df = pd.read_csv(ev_path)
+            order_creates = load_creates(str(ev_path), ev_path.stat().st_mtime)
     except Exception:
         pass
 
-if event_df is not None:
-    order_creates = event_df[event_df["event_type"] == "CREATE"]
-else:
-    order_creates = None
-
 fig = create_backtesting_figure(
     df_feat,
     data["executors"],
@@ -129,51 +217,34 @@ st.plotly_chart(fig, use_container_width=True)
 csv_path = Path(st.session_state.get("file_choice", ""))
 if csv_path.exists():
     try:
-        df_csv = pd.read_csv(csv_path)
-        row_cfg = df_csv[df_csv.get("label") == selected]
-        if not row_cfg.empty:
-            row_dict = row_cfg.iloc[0].to_dict()
-            if not (len(row_dict) == 1 and "error" in row_dict):
-                st.subheader("Run parameters from CSV")
-                st.json(row_dict, expanded=False)
+        row_dict = row_configs(str(csv_path), mtime_ns(csv_path)).get(selected)
+        if row_dict and not (len(row_dict) == 1 and "error" in row_dict):
+            st.subheader("Run parameters from CSV")
+            st.json(row_dict, expanded=False)
     except Exception:
         pass
 
 # Raw executors table
 st.header("Executors")
-exec_df = pd.json_normalize(data["executors"])
-st.dataframe(exec_df, use_container_width=True, height=400)
+exec_df = executors_frame(str(packet_path), packet_mtime)
+# Paginated grid: only one page of executors is rendered in the browser at a time
+exec_gb = GridOptionsBuilder.from_dataframe(exec_df)
+exec_gb.configure_default_column(sortable=True, filter=True, resizable=True)
+exec_gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=100)
+AgGrid(
+    exec_df,
+    gridOptions=exec_gb.build(),
+    theme="streamlit",
+    height=400,
+    update_mode=GridUpdateMode.NO_UPDATE,
+    enable_enterprise_modules=False,
+    # One grid per packet version, so switching runs never shows the previous run's executors
+    key=f"executors_grid:{packet_path}:{packet_mtime}",
+)
 
 # NEW SECTION – Trade Log Table & Win/Loss Metrics
 # -------------------------------------------------
-trade_rows = []
-cumulative_pos = 0.0
-for ex in sorted(data.get("executors", []), key=lambda e: e.get("close_timestamp", e.get("timestamp", 0))):
-    filled_quote = ex.get("filled_amount_quote", 0) or ex.get("order_size_quote", 0)
-    if filled_quote == 0:
-        continue  # skip zero-volume orders
-    side_val = ex.get("side", ex.get("config", {}).get("side", 1))
-    is_buy = int(side_val) == 1 if isinstance(side_val, (int, float)) else str(side_val).lower() == "buy"
-    signed_size = filled_quote if is_buy else -filled_quote
-    cumulative_pos += signed_size
-
-    timestamp = pd.to_datetime(
-        ex.get("close_timestamp", ex.get("timestamp", 0)), unit="s"
-    ).isoformat()
-
-    trade_rows.append(
-        {
-            "Time": timestamp,
-            "Side": "BUY" if is_buy else "SELL",
-            "Size (quote)": filled_quote,
-            "Price": ex.get("config", {}).get("entry_price", ex.get("entry_price")),
-            "P/L": ex.get("net_pnl_quote", 0),
-            "Cum Pos": cumulative_pos,
-        }
-    )
-
-# Convert to DataFrame
-trade_df = pd.DataFrame(trade_rows)
+trade_df = build_trade_log(exec_df)
 
 if not trade_df.empty:
     st.header("Detailed Trade Log")
@@ -1,10 +1,16 @@
+import json
 import logging
 import traceback
-from typing import Dict, Union
+from typing import Dict, List, TypedDict, Union
 import math
 import os
+from functools import lru_cache
+import re
 
-from fastapi import APIRouter, HTTPException
+import numpy as np
+import pandas as pd
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
 from pydantic import BaseModel
@@ -12,7 +18,13 @@ from pydantic import BaseModel
 from config import CONTROLLERS_MODULE, CONTROLLERS_PATH
 import utils.candles_cache  # Activate Parquet cache for candle data
 
-router = APIRouter(tags=["Market Backtesting"])
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Backtest responses carry the full processed_data table – let orjson encode them when available
+router = APIRouter(tags=["Market Backtesting"], default_response_class=ORJSONResponse if orjson else JSONResponse)
 candles_factory = CandlesFactory()
 backtesting_engine = BacktestingEngineBase()
 
@@ -38,6 +50,177 @@ def _safe_summarize_results(executors_info, total_amount_quote: float = 1000):
 BacktestingEngineBase.summarize_results = staticmethod(_safe_summarize_results)  # type: ignore[attr-defined]
 
 
+def _finite_or_zero(obj):
+    """Return *obj* with NaN/inf floats replaced by 0, descending into dicts and lists."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else 0
+    if isinstance(obj, dict):
+        return {k: _finite_or_zero(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_finite_or_zero(v) for v in obj]
+    return obj
+
+
+# Clients sending this Accept type get the executors as an Arrow IPC stream
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+
+def _dumps(obj) -> bytes:
+    """JSON-encode *obj*, stringifying anything JSON has no type for (Decimal, enums, …)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str).encode()
+
+
+def _arrow_column(values: List):
+    """Arrow array for one column; values Arrow cannot type (enums, mixed types) are JSON-encoded strings."""
+    import pyarrow as pa
+
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pa.array([None if v is None else _json_text(v) for v in values], type=pa.string())
+
+
+def _json_text(value) -> str:
+    """JSON text of *value*, with bare strings (incl. stringified enums/Decimals) left unquoted."""
+    if isinstance(value, str):
+        return value
+    text = _dumps(value).decode()
+    return json.loads(text) if text.startswith('"') else text
+
+
+def _executors_arrow(executors_info: List[Dict], meta: Dict, processed_data=None) -> bytes:
+    """Serialise *executors_info* as an Arrow IPC stream (one row per executor).
+
+    Columns are the union of executor keys (first-seen order, missing values
+    null); nested dicts such as ``config``/``custom_info`` become struct
+    columns.  The small rest of the response (*meta*) rides along as JSON in
+    the schema metadata under ``hb_payload``; the *processed_data* frame, if
+    given, is embedded as its own IPC stream under ``hb_processed_data``.
+    Read back with ``pa.ipc.open_stream(buf).read_all()`` (and
+    ``pa.ipc.open_stream(schema.metadata[b"hb_processed_data"]).read_all()``).
+    """
+    import pyarrow as pa
+
+    cols = list(dict.fromkeys(k for exe in executors_info for k in exe))
+    table = pa.table({c: _arrow_column([exe.get(c) for exe in executors_info]) for c in cols})
+    metadata = {b"hb_payload": _dumps(meta)}
+    if processed_data is not None:
+        metadata[b"hb_processed_data"] = _ipc_stream(pa.Table.from_pandas(processed_data))
+    return _ipc_stream(table.replace_schema_metadata(metadata))
+
+
+def _ipc_stream(table) -> bytes:
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# Characters replaced by '_' when a config label becomes a file name
+_LABEL_UNSAFE_RE = re.compile(r"[^\w-]")
+
+# Candle columns copied onto CREATE events (as candle_<name>)
+_CANDLE_FIELDS = ("open_time", "close_time", "open", "high", "low", "close")
+
+
+def _take(values, pos) -> List:
+    """Return ``values[pos]`` as Python scalars, with ``None`` for missing positions and NaNs."""
+    out = values[np.maximum(pos, 0)].astype(object)
+    out[(pos < 0) | pd.isna(out)] = None
+    return out.tolist()
+
+
+def _build_event_rows(executors_info: List[Dict], feat_df) -> List[Dict]:
+    """Return CREATE / FILL / CLOSE event rows for *executors_info*, in per-executor order.
+
+    Candle rows for every CREATE are located with one ``Index.get_indexer`` call
+    and read straight from the column arrays (mid price precomputed for the whole
+    frame) instead of a ``feat_df.loc[ts]`` probe per executor.
+    Fields are pulled with ``dict.get`` (not ``json_normalize``) so values keep
+    their original Python types, e.g. int sides are not upcast to float.
+    """
+    if not executors_info:
+        return []
+    cfgs = [exe.get("config", {}) for exe in executors_info]
+    ts = [int(exe.get("timestamp") or exe.get("entry_timestamp", 0)) for exe in executors_info]
+    sides = [
+        "BUY" if str(exe.get("side") or cfg.get("side")) in ("1", "buy", "BUY") else "SELL"
+        for exe, cfg in zip(executors_info, cfgs)
+    ]
+    entry_px = [
+        exe.get("entry_price") if exe.get("entry_price") is not None else cfg.get("entry_price")
+        for exe, cfg in zip(executors_info, cfgs)
+    ]
+
+    # Candle values aligned to executor timestamps; missing candles/columns read as None
+    missing = [None] * len(ts)
+    cand_cols = {f"candle_{c}": missing for c in _CANDLE_FIELDS}
+    mid, ref = missing, missing
+    if isinstance(feat_df, pd.DataFrame) and not feat_df.empty:
+        feat = feat_df[~feat_df.index.duplicated(keep="first")]
+        pos = feat.index.get_indexer(ts)
+        for c in _CANDLE_FIELDS:
+            if c in feat.columns:
+                cand_cols[f"candle_{c}"] = _take(feat[c].to_numpy(), pos)
+        if "high" in feat.columns and "low" in feat.columns:
+            mid = _take(((feat["high"] + feat["low"]) / 2).to_numpy(), pos)
+        if "reference_price" in feat.columns:
+            ref = _take(feat["reference_price"].to_numpy(), pos)
+
+    rows: List[Dict] = []
+    for i, (exe, cfg) in enumerate(zip(executors_info, cfgs)):
+        strategy = cfg.get("controller_id", "main")
+        order_id = cfg.get("level_id")
+        # CREATE event (when order was submitted)
+        rows.append({
+            "timestamp": ts[i],
+            "event_type": "CREATE",
+            "strategy_name": strategy,
+            **{k: v[i] for k, v in cand_cols.items()},
+            "candle_mid_price": mid[i],
+            "reference_price": float(ref[i]) if ref[i] is not None else None,
+            "order_id": order_id,
+            "trade_type": sides[i],
+            "created_price": float(entry_px[i]) if entry_px[i] is not None else None,
+            "created_size": cfg.get("amount"),
+        })
+
+        # FILL event – if executor has filled_amount_quote > 0
+        if exe.get("filled_amount_quote", 0):
+            rows.append({
+                "timestamp": ts[i],  # approximation
+                "event_type": "FILL",
+                "strategy_name": strategy,
+                "order_id": order_id,
+                "position_id": exe.get("id"),
+                "trade_type": sides[i],
+                "fill_price": float(entry_px[i]) if entry_px[i] is not None else None,
+                "amount_filled": exe.get("filled_amount_quote"),
+            })
+
+        # CLOSE event if closed
+        close_ts = exe.get("close_timestamp")
+        if close_ts:
+            rows.append({
+                "timestamp": int(close_ts),
+                "event_type": "CLOSE",
+                "strategy_name": strategy,
+                "order_id": order_id,
+                "position_id": exe.get("id"),
+                "trade_type": sides[i],
+                "entry_price": exe.get("entry_price"),
+                "close_price": exe.get("custom_info", {}).get("close_price", exe.get("exit_price")),
+                "closing_reason": exe.get("close_type"),
+                "pnl_quote": exe.get("net_pnl_quote"),
+                "pnl_percent": exe.get("net_pnl_pct"),
+            })
+    return rows
+
+
 class BacktestingConfig(BaseModel):
     start_time: int = 1672542000  # 2023-01-01 00:00:00
     end_time: int = 1672628400  # 2023-01-01 23:59:00
@@ -46,22 +229,88 @@ class BacktestingConfig(BaseModel):
     config: Union[Dict, str]
 
 
-@router.post("/run-backtesting")
-async def run_backtesting(backtesting_config: BacktestingConfig):
-    print("RUNNING BACKTESTING")
-    print("BACKTESTING CONFIG: ", backtesting_config)
+class BacktestingRequest(TypedDict):
+    """Decoded /run-backtesting body – same fields and defaults as ``BacktestingConfig``."""
+
+    start_time: int
+    end_time: int
+    backtesting_resolution: str
+    trade_cost: float
+    config: Union[Dict, str]
+
+
+_BACKTESTING_DEFAULTS = {name: field.default for name, field in BacktestingConfig.model_fields.items() if not field.is_required()}
+
+
+def _decode_backtesting_request(body: bytes) -> BacktestingRequest:
+    """Decode and coerce a /run-backtesting body without a Pydantic validation pass.
+
+    ``config`` can be a large nested dict; it is passed through as decoded and
+    only type-checked at the top level, which is all ``BacktestingConfig`` did.
+    Bad input raises a 422 like FastAPI's own validation would.
+    """
+    try:
+        raw = orjson.loads(body) if orjson else json.loads(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON body: {exc}")
+    if not isinstance(raw, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object")
+    config = raw.get("config")
+    if not isinstance(config, (dict, str)):
+        raise HTTPException(status_code=422, detail="config must be a dict or a controller config file name")
+    merged = {**_BACKTESTING_DEFAULTS, **raw}
+    try:
+        return BacktestingRequest(
+            start_time=int(merged["start_time"]),
+            end_time=int(merged["end_time"]),
+            backtesting_resolution=str(merged["backtesting_resolution"]),
+            trade_cost=float(merged["trade_cost"]),
+            config=config,
+        )
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid backtesting config: {exc}")
+
+
+@lru_cache(maxsize=256)
+def _parse_controller_config(blob: bytes):
+    return backtesting_engine.get_controller_config_instance_from_dict(
+        config_data=json.loads(blob),
+        controllers_module=CONTROLLERS_MODULE
+    )
+
+
+def _controller_config_from_dict(config: Dict):
+    """Build the controller config model, reusing the parse of an identical earlier *config*.
+
+    Sweeps and re-runs resend identical configs; the cache is keyed on their
+    sorted-key JSON and each caller gets a deep copy, since the handler patches
+    fields on the instance.
+    """
+    if orjson is not None:
+        blob = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+    else:
+        blob = json.dumps(config, sort_keys=True).encode()
+    return _parse_controller_config(blob).model_copy(deep=True)
+
+
+# The handler reads the raw body itself; publish BacktestingConfig as the documented request schema
+@router.post(
+    "/run-backtesting",
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": BacktestingConfig.model_json_schema()}}}},
+)
+async def run_backtesting(request: Request):
+    backtesting_config = _decode_backtesting_request(await request.body())
+    # Lazy %-formatting: the (possibly multi-MB) config repr is only built when DEBUG is on
+    logging.debug("RUNNING BACKTESTING config=%r", backtesting_config)
     try:
-        if isinstance(backtesting_config.config, str):
+        if isinstance(backtesting_config["config"], str):
             controller_config = backtesting_engine.get_controller_config_instance_from_yml(
-                config_path=backtesting_config.config,
+                config_path=backtesting_config["config"],
                 controllers_conf_dir_path=CONTROLLERS_PATH,
                 controllers_module=CONTROLLERS_MODULE
             )
         else:
-            controller_config = backtesting_engine.get_controller_config_instance_from_dict(
-                config_data=backtesting_config.config,
-                controllers_module=CONTROLLERS_MODULE
-            )
+            controller_config = _controller_config_from_dict(backtesting_config["config"])
         # ------------------------------------------------------------------
         # Instance-level fallbacks – do NOT monkey-patch the class, just fill
         # missing values on this config object so downstream code sees a real
@@ -84,11 +333,11 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
                 if ep1 is not None:
                     controller_config.trading_pair = getattr(ep1, "trading_pair", None)
 
-        logging.info(f"RUNNING BACKTEST WITH CONFIG: {controller_config}")
+        logging.info("RUNNING BACKTEST WITH CONFIG: %s", controller_config)
         backtesting_results = await backtesting_engine.run_backtesting(
-            controller_config=controller_config, trade_cost=backtesting_config.trade_cost,
-            start=int(backtesting_config.start_time), end=int(backtesting_config.end_time),
-            backtesting_resolution=backtesting_config.backtesting_resolution)
+            controller_config=controller_config, trade_cost=backtesting_config["trade_cost"],
+            start=int(backtesting_config["start_time"]), end=int(backtesting_config["end_time"]),
+            backtesting_resolution=backtesting_config["backtesting_resolution"])
         
         # ------------------------------------------------------------------
         # Normalise & validate `processed_data` ----------------------------
@@ -127,11 +376,18 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
 
             processed_df = processed_df.fillna(0)
             processed_data = processed_df
-            backtesting_results["processed_data"] = processed_df.to_dict()
+            # orient="split" layout: flat row lists instead of a {col: {idx: val}} dict per cell
+            backtesting_results["processed_data"] = {
+                "index": processed_df.index.tolist(),
+                "columns": processed_df.columns.tolist(),
+                "data": processed_df.to_numpy().tolist(),
+            }
         except Exception as exc:
             logging.exception("processed_data parsing failed – rejecting request")
             raise HTTPException(status_code=422, detail=f"Invalid processed_data: {exc}")
 
+        # Converted once: the full dicts are returned as "executors" and the quote
+        # log / event-row builders below read from the same list.
         executors_info = [e.to_dict() for e in backtesting_results.get("executors", [])]
         results = backtesting_results["results"]
         
@@ -142,9 +398,7 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
 
         results["sharpe_ratio"] = results.get("sharpe_ratio", 0) or 0
         # replace any NaN or infinite values that break JSON serialization
-        for k, v in list(results.items()):
-            if isinstance(v, float) and (math.isinf(v) or math.isnan(v)):
-                results[k] = 0
+        results = backtesting_results["results"] = _finite_or_zero(results)
 
         # Prepare base response_payload early so subsequent sections can append to it
         response_payload = {
@@ -155,8 +409,8 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
         }
 
         # Derive a stable filename label early so both event CSV & packet use the same value
-        if isinstance(backtesting_config.config, dict):
-            _cfg_dict = backtesting_config.config
+        if isinstance(backtesting_config["config"], dict):
+            _cfg_dict = backtesting_config["config"]
         else:
             _cfg_dict = {}
 
@@ -165,30 +419,28 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
             from time import time as _time
             _label_src = f"run_{int(_time())}"
 
-        safe_label = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in str(_label_src))
+        safe_label = _LABEL_UNSAFE_RE.sub("_", str(_label_src))
 
         # ------------------------------------------------------------------
         # Extra logging – record every quote price at submission time so we can
         # later verify spread calculations.  We print BUY vs SELL along with
-        # timestamp (ISO) and raw epoch to ease spreadsheet filtering.
+        # timestamp (ISO) to ease spreadsheet filtering.  Lines keep the
+        # "QUOTE_SUBMITTED | iso | side | price=" format (so grep still finds
+        # every quote) but are formatted column-wise and emitted as one record,
+        # and skipped entirely unless INFO logging is on.
         try:
-            from datetime import datetime, timezone
-
-            for exe in executors_info:
-                ts = exe.get("timestamp") or exe.get("entry_timestamp")
-                if ts is None:
-                    continue
-                # Convert to readable ISO string in UTC
-                iso = datetime.fromtimestamp(float(ts), tz=timezone.utc).isoformat(timespec="seconds")
-                side_val = exe.get("side") or (exe.get("config", {}).get("side"))
-                side = "BUY" if str(side_val) in ("1", "buy", "BUY") else "SELL"
-                price = exe.get("entry_price") or exe.get("config", {}).get("entry_price")
-                logging.info(
-                    "QUOTE_SUBMITTED | %s | %s | price=%.8f",
-                    iso,
-                    side,
-                    price if price is not None else float('nan'),
-                )
+            if executors_info and logging.getLogger().isEnabledFor(logging.INFO):
+                quotes = pd.DataFrame({
+                    "ts": [exe.get("timestamp") or exe.get("entry_timestamp") for exe in executors_info],
+                    "side": [exe.get("side") or (exe.get("config", {}).get("side")) for exe in executors_info],
+                    "price": [exe.get("entry_price") or exe.get("config", {}).get("entry_price") for exe in executors_info],
+                }).dropna(subset=["ts"])
+                if not quotes.empty:
+                    quotes["iso"] = pd.to_datetime(quotes["ts"].astype(float), unit="s", utc=True).dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+                    quotes["side"] = quotes["side"].astype(str).isin(("1", "buy", "BUY")).map({True: "BUY", False: "SELL"})
+                    price = np.char.mod("%.8f", pd.to_numeric(quotes["price"], errors="coerce").to_numpy(dtype=float))
+                    lines = "QUOTE_SUBMITTED | " + quotes["iso"] + " | " + quotes["side"] + " | price=" + price
+                    logging.info("%s", "\n".join(lines))
         except Exception as log_exc:  # pragma: no cover
             logging.warning("Order logging failed: %s", log_exc)
 
@@ -214,71 +466,7 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
         except Exception:
             feat_df = None
 
-        for exe in executors_info:
-            ts = int(exe.get("timestamp") or exe.get("entry_timestamp", 0))
-            side_val = exe.get("side") or exe.get("config", {}).get("side")
-            side = "BUY" if str(side_val) in ("1", "buy", "BUY") else "SELL"
-
-            candle = feat_df.loc[ts] if feat_df is not None and ts in feat_df.index else {}
-
-            # Robust entry price extraction ---------------------------------
-            entry_px = exe.get("entry_price")
-            if entry_px is None:
-                entry_px = exe.get("config", {}).get("entry_price")
-
-            # CREATE event (when order was submitted)
-            BTEventLogger.add(
-                timestamp=ts,
-                event_type="CREATE",
-                strategy_name=exe.get("config", {}).get("controller_id", "main"),
-                candle_open_time=candle.get("open_time"),
-                candle_close_time=candle.get("close_time"),
-                candle_open=candle.get("open"),
-                candle_high=candle.get("high"),
-                candle_low=candle.get("low"),
-                candle_close=candle.get("close"),
-                # Compute mid-price robustly without relying on truthiness of a Series
-                candle_mid_price=(
-                    ((candle.get("high") + candle.get("low")) / 2)
-                    if candle is not None and candle.get("high") is not None and candle.get("low") is not None
-                    else None
-                ),
-                reference_price=float(candle.get("reference_price")) if candle is not None and candle.get("reference_price") is not None else None,
-                order_id=exe.get("config", {}).get("level_id"),
-                trade_type=side,
-                created_price=float(entry_px) if entry_px is not None else None,
-                created_size=exe.get("config", {}).get("amount"),
-            )
-
-            # FILL event – if executor has filled_amount_quote > 0
-            if exe.get("filled_amount_quote", 0):
-                BTEventLogger.add(
-                    timestamp=ts,  # approximation
-                    event_type="FILL",
-                    strategy_name=exe.get("config", {}).get("controller_id", "main"),
-                    order_id=exe.get("config", {}).get("level_id"),
-                    position_id=exe.get("id"),
-                    trade_type=side,
-                    fill_price=float(entry_px) if entry_px is not None else None,
-                    amount_filled=exe.get("filled_amount_quote"),
-                )
-
-            # CLOSE event if closed
-            close_ts = exe.get("close_timestamp")
-            if close_ts:
-                BTEventLogger.add(
-                    timestamp=int(close_ts),
-                    event_type="CLOSE",
-                    strategy_name=exe.get("config", {}).get("controller_id", "main"),
-                    order_id=exe.get("config", {}).get("level_id"),
-                    position_id=exe.get("id"),
-                    trade_type=side,
-                    entry_price=exe.get("entry_price"),
-                    close_price=exe.get("custom_info", {}).get("close_price", exe.get("exit_price")),
-                    closing_reason=exe.get("close_type"),
-                    pnl_quote=exe.get("net_pnl_quote"),
-                    pnl_percent=exe.get("net_pnl_pct"),
-                )
+        BTEventLogger.add_many(_build_event_rows(executors_info, feat_df))
 
         try:
             from pathlib import Path
@@ -295,13 +483,36 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
         if os.getenv("HB_SAVE_PACKET", "0") == "1":
             try:
                 from pathlib import Path
-                import json
 
                 DETAILS_DIR = Path(os.getenv("HB_DETAIL_DIR", "results/detail_packets"))
                 DETAILS_DIR.mkdir(parents=True, exist_ok=True)
                 out_path = DETAILS_DIR / f"{safe_label}.json"
-                with out_path.open("w") as fp:
-                    json.dump(response_payload, fp, indent=2)
+
+                # The OHLC/feature table goes to a Parquet file next to the packet;
+                # the JSON keeps only the small parts plus a pointer to it.
+                packet = {k: v for k, v in response_payload.items() if k != "processed_data"}
+                try:
+                    pq_path = out_path.with_suffix(".parquet")
+                    processed_data.to_parquet(pq_path, compression="zstd")
+                    packet["processed_data_path"] = pq_path.name
+                except Exception as exc:
+                    logging.info(f"Parquet packet write unavailable ({exc}) – keeping processed_data inline")
+                    packet["processed_data"] = response_payload["processed_data"]
+
+                # Columnar copy of the executors for dashboards that load them as a frame
+                try:
+                    arrow_path = out_path.with_suffix(".arrow")
+                    arrow_path.write_bytes(_executors_arrow(executors_info, {}))
+                    packet["executors_arrow_path"] = arrow_path.name
+                except Exception as exc:
+                    logging.info(f"Arrow executors write unavailable ({exc})")
+
+                if orjson is not None:
+                    opts = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    out_path.write_bytes(orjson.dumps(packet, option=opts))
+                else:
+                    with out_path.open("w") as fp:
+                        json.dump(packet, fp, indent=2)
             except Exception as exc:
                 logging.warning(f"Could not save detail packet: {exc}")
 
@@ -319,6 +530,13 @@ async def run_backtesting(backtesting_config: BacktestingConfig):
             if not hasattr(cfg_cls, "trading_pair"):
                 setattr(cfg_cls, "trading_pair", property(lambda self: getattr(getattr(self, "exchange_pair_1", None), "trading_pair", None)))
 
+        if ARROW_STREAM in request.headers.get("accept", ""):
+            try:
+                meta = {k: v for k, v in response_payload.items() if k not in ("executors", "processed_data")}
+                return Response(_executors_arrow(executors_info, meta, processed_data), media_type=ARROW_STREAM)
+            except Exception as exc:
+                logging.warning(f"Arrow response unavailable ({exc}) – falling back to JSON")
+
         return response_payload
     except Exception as e:
         # Log the full exception traceback to the server logs
@@ -1,25 +1,76 @@
+import asyncio
 import json
-from typing import Dict, List, get_args, get_origin, Any
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, List, Tuple, get_args, get_origin, Any
 
-import yaml
 from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.responses import Response
 from starlette import status
 
 from models import Script, ScriptConfig
 from utils.file_system import FileSystemUtil
+from utils.yaml_fast import safe_dump
 from inspect import isclass
 from pydantic import BaseModel
 from pydantic.fields import PydanticUndefined
 from enum import Enum
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 router = APIRouter(tags=["Files Management"])
 
 file_system = FileSystemUtil()
 
+# build_defaults output per config class, stored as JSON bytes so every caller gets a fresh dict
+_DEFAULTS_CACHE: Dict[Tuple[str, str, int], bytes] = {}
+_DEFAULTS_CACHE_MAX = 256
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str).encode()
+
+
+def _json_loads(blob: bytes) -> Any:
+    return orjson.loads(blob) if orjson is not None else json.loads(blob)
+
+
+def _model_cache_key(model_cls: type) -> Tuple[str, str, int]:
+    """Identify *model_cls* by module, qualname and source mtime.
+
+    Config classes are re-imported with ``importlib.reload`` whenever their file
+    changes, so the class object is not a stable key; the source mtime is.
+    """
+    module = sys.modules.get(model_cls.__module__)
+    try:
+        mtime = os.stat(module.__file__).st_mtime_ns if getattr(module, "__file__", None) else 0
+    except OSError:
+        mtime = 0
+    return model_cls.__module__, model_cls.__qualname__, mtime
+
+
+@lru_cache(maxsize=4096)
+def _cached_origin_args(ann: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    return get_origin(ann), get_args(ann)
+
+
+def _origin_args(ann: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    """``(get_origin(ann), get_args(ann))``, memoised – annotations repeat across fields and requests."""
+    try:
+        return _cached_origin_args(ann)
+    except TypeError:  # unhashable annotation metadata
+        return get_origin(ann), get_args(ann)
+
 
 def _placeholder_for_annotation(ann: Any):
     """Return a generic placeholder based on type annotation."""
-    origin = get_origin(ann)
+    origin, _ = _origin_args(ann)
     if origin is list:
         return []
     if origin is dict:
@@ -44,62 +95,40 @@ def _convert_comma_sep(value: str, subtype: Any):
     return parts
 
 
-def build_defaults(model_cls: type[BaseModel]) -> Dict[str, Any]:
-    """Return a fully-populated default dict for *model_cls*, recursively."""
-    instance = model_cls.model_construct()  # skips validation, fills defaults
-    # Using JSON mode ensures Enum members serialize to their underlying value (int/str) rather
-    # than the less useful "EnumClass.VALUE" string representation.
-    data: Dict[str, Any] = instance.model_dump(mode="json", exclude_unset=False)
+def _serialise_enums_inplace(obj: Any) -> None:
+    """Replace Enum members with their .value throughout nested dicts/lists, in place."""
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        items = cur.items() if isinstance(cur, dict) else enumerate(cur)
+        for k, v in items:
+            if isinstance(v, Enum):
+                cur[k] = v.value
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
 
-    for name, field in model_cls.model_fields.items():
-        ann = field.annotation
-        origin = get_origin(ann)
-        subtype = get_args(ann)[0] if origin is list and get_args(ann) else Any
-        val = data.get(name, PydanticUndefined)
 
-        # Handle list conversions ------------------------------------------------
-        if origin is list:
-            # Avoid converting when the subtype is itself a list (e.g. List[List[Decimal]]).
-            nested_list = get_origin(subtype) is list
-            if isinstance(val, str) and not nested_list:  # comma-separated defaults
-                data[name] = _convert_comma_sep(val, subtype)
-            elif val is None:
-                data[name] = []
-            elif isclass(subtype) and issubclass(subtype, BaseModel):
-                # leave empty list; creating sample nested objects often breaks validation
-                data[name] = []
-            continue
+# Placeholder pairs kucoin can't serve: these bases become BTC, FDUSD quotes become USDT
+_PLACEHOLDER_BAD_BASES = frozenset({"WLD", "PEPE"})
+_PLACEHOLDER_QUOTE_SWAP = {"FDUSD": "USDT"}
 
-        # Handle nested Pydantic model ------------------------------------------
-        if isclass(ann) and issubclass(ann, BaseModel):
-            if val is None or val == {}:
-                data[name] = build_defaults(ann)
-            continue
 
-        # Replace PydanticUndefined / None with placeholder ----------------------
-        if val is PydanticUndefined or val is None:
-            data[name] = _placeholder_for_annotation(ann)
+def _sanitise_pair(pair: str) -> str:
+    if not isinstance(pair, str) or "-" not in pair:
+        return pair
+    base, quote = pair.split("-", 1)
+    if base in _PLACEHOLDER_BAD_BASES:
+        base = "BTC"
+    quote = _PLACEHOLDER_QUOTE_SWAP.get(quote, quote)
+    return f"{base}-{quote}"
 
-    # Ensure mandatory identifier fields are present
-    for key in ("controller_name", "controller_type"):
-        if not data.get(key):
-            attr_val = getattr(model_cls, key, None)
-            if isinstance(attr_val, str) and attr_val:
-                data[key] = attr_val
 
-    # --- Post-processing fixes ----------------------------------------------
-    def _serialise_enums(obj):
-        """Recursively convert Enum objects to their .value primitive."""
-        if isinstance(obj, Enum):
-            return obj.value
-        if isinstance(obj, list):
-            return [_serialise_enums(x) for x in obj]
-        if isinstance(obj, dict):
-            return {k: _serialise_enums(v) for k, v in obj.items()}
-        return obj
-
-    data = _serialise_enums(data)
+def _postprocess_defaults(data: Dict[str, Any], fields: Dict[str, Any]) -> None:
+    """Apply the scaffold-friendly connector / pair / candles fixes to *data* in place.
 
+    *fields* is the model's ``model_fields``; steps run in order because later
+    ones read values filled by earlier ones.
+    """
     # Prefer sandbox exchange for scaffolds to avoid live REST calls.
     conn = data.get("connector_name")
     if isinstance(conn, str) and conn.lower().startswith("binance"):
@@ -108,12 +137,12 @@ def build_defaults(model_cls: type[BaseModel]) -> Dict[str, Any]:
     # ------------------------------------------------------------------
     # Derive missing connector / trading_pair for multi-exchange controllers
     # ------------------------------------------------------------------
-    if "connector_name" in model_cls.model_fields and not data.get("connector_name"):
+    if "connector_name" in fields and not data.get("connector_name"):
         ep1 = data.get("exchange_pair_1")
         if isinstance(ep1, dict) and ep1.get("connector_name"):
             data["connector_name"] = ep1["connector_name"]
 
-    if "trading_pair" in model_cls.model_fields and not data.get("trading_pair"):
+    if "trading_pair" in fields and not data.get("trading_pair"):
         ep1 = data.get("exchange_pair_1")
         if isinstance(ep1, dict) and ep1.get("trading_pair"):
             data["trading_pair"] = ep1["trading_pair"]
@@ -135,16 +164,6 @@ def build_defaults(model_cls: type[BaseModel]) -> Dict[str, Any]:
         }]
 
     # Kucoin doesn't list FDUSD pairs – swap to USDT for placeholders
-    def _sanitise_pair(pair: str) -> str:
-        if not isinstance(pair, str) or "-" not in pair:
-            return pair
-        base, quote = pair.split("-", 1)
-        if base in {"WLD", "PEPE"}:
-            base = "BTC"
-        if quote == "FDUSD":
-            quote = "USDT"
-        return f"{base}-{quote}"
-
     if data.get("connector_name") == "kucoin" and isinstance(data.get("trading_pair"), str):
         data["trading_pair"] = _sanitise_pair(data["trading_pair"])
 
@@ -159,12 +178,80 @@ def build_defaults(model_cls: type[BaseModel]) -> Dict[str, Any]:
 
     # Fill optional explicit candles_connector / candles_trading_pair so controllers like
     # dman_v3 that reference them don't break when scaffolds omit them.
-    if "candles_connector" in model_cls.model_fields and not data.get("candles_connector"):
+    if "candles_connector" in fields and not data.get("candles_connector"):
         data["candles_connector"] = data.get("connector_name")
 
-    if "candles_trading_pair" in model_cls.model_fields and not data.get("candles_trading_pair"):
+    if "candles_trading_pair" in fields and not data.get("candles_trading_pair"):
         data["candles_trading_pair"] = data.get("trading_pair")
 
+
+def build_defaults_json(model_cls: type[BaseModel]) -> bytes:
+    """Return ``build_defaults(model_cls)`` as encoded JSON, memoised per class."""
+    key = _model_cache_key(model_cls)
+    blob = _DEFAULTS_CACHE.get(key)
+    if blob is None:
+        blob = _json_dumps(_build_defaults(model_cls))
+        if len(_DEFAULTS_CACHE) >= _DEFAULTS_CACHE_MAX:
+            _DEFAULTS_CACHE.pop(next(iter(_DEFAULTS_CACHE)))
+        _DEFAULTS_CACHE[key] = blob
+    return blob
+
+
+def build_defaults(model_cls: type[BaseModel]) -> Dict[str, Any]:
+    """Return a fully-populated default dict for *model_cls*, recursively.
+
+    The result is JSON-plain (non-JSON values stringified) and memoised per class.
+    """
+    return _json_loads(build_defaults_json(model_cls))
+
+
+def _build_defaults(model_cls: type[BaseModel]) -> Dict[str, Any]:
+    instance = model_cls.model_construct()  # skips validation, fills defaults
+    # Using JSON mode ensures Enum members serialize to their underlying value (int/str) rather
+    # than the less useful "EnumClass.VALUE" string representation.
+    data: Dict[str, Any] = instance.model_dump(mode="json", exclude_unset=False)
+
+    for name, field in model_cls.model_fields.items():
+        ann = field.annotation
+        origin, args = _origin_args(ann)
+        subtype = args[0] if origin is list and args else Any
+        val = data.get(name, PydanticUndefined)
+
+        # Handle list conversions ------------------------------------------------
+        if origin is list:
+            # Avoid converting when the subtype is itself a list (e.g. List[List[Decimal]]).
+            nested_list = _origin_args(subtype)[0] is list
+            if isinstance(val, str) and not nested_list:  # comma-separated defaults
+                data[name] = _convert_comma_sep(val, subtype)
+            elif val is None:
+                data[name] = []
+            elif isclass(subtype) and issubclass(subtype, BaseModel):
+                # leave empty list; creating sample nested objects often breaks validation
+                data[name] = []
+            continue
+
+        # Handle nested Pydantic model ------------------------------------------
+        if isclass(ann) and issubclass(ann, BaseModel):
+            if val is None or val == {}:
+                data[name] = build_defaults(ann)
+            continue
+
+        # Replace PydanticUndefined / None with placeholder ----------------------
+        if val is PydanticUndefined or val is None:
+            data[name] = _placeholder_for_annotation(ann)
+
+    # Ensure mandatory identifier fields are present
+    for key in ("controller_name", "controller_type"):
+        if not data.get(key):
+            attr_val = getattr(model_cls, key, None)
+            if isinstance(attr_val, str) and attr_val:
+                data[key] = attr_val
+
+    # --- Post-processing fixes ----------------------------------------------
+    _serialise_enums_inplace(data)
+
+    _postprocess_defaults(data, model_cls.model_fields)
+
     return data
 
 
@@ -185,26 +272,34 @@ async def get_script_config(script_name: str):
     :param script_name: The name of the script.
     :return: JSON containing the configuration parameters.
     """
-    config_class = file_system.load_script_config_class(script_name)
+    config_class = await asyncio.to_thread(file_system.load_script_config_class, script_name)
     if config_class is None:
         raise HTTPException(status_code=404, detail="Script configuration class not found")
 
-    # Extracting fields and default values using the improved logic
-    config_fields = build_defaults(config_class)
-    return json.loads(json.dumps(config_fields, default=str))
+    # Extracting fields and default values using the improved logic – already JSON-encoded
+    return Response(content=await asyncio.to_thread(build_defaults_json, config_class), media_type="application/json")
+
+
+_CONTROLLER_TYPES = ("directional_trading", "market_making", "generic")
+# (mtime_ns of each controllers/<type> dir) -> encoded /list-controllers body
+_controllers_listing: Tuple[Tuple[int, ...], bytes] | None = None
+
+
+def _controllers_listing_json() -> bytes:
+    """Return the /list-controllers body as JSON bytes, re-encoded only when a controllers dir changes."""
+    global _controllers_listing
+    dirs = [f"controllers/{ctype}" for ctype in _CONTROLLER_TYPES]
+    key = tuple(os.stat(os.path.join(file_system.base_path, d)).st_mtime_ns for d in dirs)
+    if _controllers_listing is None or _controllers_listing[0] != key:
+        listing = {ctype: [file for file in file_system.list_files(d) if file != "__init__.py"]
+                   for ctype, d in zip(_CONTROLLER_TYPES, dirs)}
+        _controllers_listing = (key, _json_dumps(listing))
+    return _controllers_listing[1]
 
 
 @router.get("/list-controllers", response_model=dict)
 async def list_controllers():
-    directional_trading_controllers = [file for file in file_system.list_files('controllers/directional_trading') if
-                                       file != "__init__.py"]
-    market_making_controllers = [file for file in file_system.list_files('controllers/market_making') if
-                                 file != "__init__.py"]
-    generic_controllers = [file for file in file_system.list_files('controllers/generic') if file != "__init__.py"]
-
-    return {"directional_trading": directional_trading_controllers,
-            "market_making": market_making_controllers,
-            "generic": generic_controllers}
+    return Response(content=_controllers_listing_json(), media_type="application/json")
 
 @router.get("/controller-config-pydantic/{controller_type}/{controller_name}", response_model=dict)
 async def get_controller_config_pydantic(controller_type: str, controller_name: str):
@@ -213,13 +308,12 @@ async def get_controller_config_pydantic(controller_type: str, controller_name:
     :param controller_name: The name of the controller.
     :return: JSON containing the configuration parameters.
     """
-    config_class = file_system.load_controller_config_class(controller_type, controller_name)
+    config_class = await asyncio.to_thread(file_system.load_controller_config_class, controller_type, controller_name)
     if config_class is None:
         raise HTTPException(status_code=404, detail="Controller configuration class not found")
 
-    # Extracting fields and default values using the improved logic
-    config_fields = build_defaults(config_class)
-    return json.loads(json.dumps(config_fields, default=str))
+    # Extracting fields and default values using the improved logic – already JSON-encoded
+    return Response(content=await asyncio.to_thread(build_defaults_json, config_class), media_type="application/json")
 
 
 @router.get("/list-controllers-configs", response_model=List[str])
@@ -229,29 +323,45 @@ async def list_controllers_configs():
 
 @router.get("/controller-config/{controller_name}", response_model=dict)
 async def get_controller_config(controller_name: str):
-    config = file_system.read_yaml_file(f"bots/conf/controllers/{controller_name}.yml")
+    config = await asyncio.to_thread(file_system.read_yaml_file, f"bots/conf/controllers/{controller_name}.yml")
     return config
 
 
+async def _read_yaml_files(paths: List[str]) -> List[dict]:
+    """Read + parse *paths* on worker threads (keeps the event loop free), preserving order."""
+    return list(await asyncio.gather(*(asyncio.to_thread(file_system.read_yaml_file, p) for p in paths)))
+
+
 @router.get("/all-controller-configs", response_model=List[dict])
 async def get_all_controller_configs():
-    configs = []
-    for controller in file_system.list_files('conf/controllers'):
-        config = file_system.read_yaml_file(f"bots/conf/controllers/{controller}")
-        configs.append(config)
-    return configs
+    return await _read_yaml_files(
+        [f"bots/conf/controllers/{controller}" for controller in file_system.list_files('conf/controllers')]
+    )
 
 
 @router.get("/all-controller-configs/bot/{bot_name}", response_model=List[dict])
 async def get_all_controller_configs_for_bot(bot_name: str):
-    configs = []
     bots_config_path = f"instances/{bot_name}/conf/controllers"
     if not file_system.path_exists(bots_config_path):
         raise HTTPException(status_code=400, detail="Bot not found.")
-    for controller in file_system.list_files(bots_config_path):
-        config = file_system.read_yaml_file(f"bots/{bots_config_path}/{controller}")
-        configs.append(config)
-    return configs
+    return await _read_yaml_files(
+        [f"bots/{bots_config_path}/{controller}" for controller in file_system.list_files(bots_config_path)]
+    )
+
+
+def _merge_yaml_file(path: str, updates: Dict) -> None:
+    current_config = file_system.read_yaml_file(path)
+    current_config.update(updates)
+    file_system.dump_dict_to_yaml(path, current_config)
+
+
+def _write_yaml_file(directory: str, file_name: str, content: Dict) -> None:
+    file_system.add_file(directory, file_name, safe_dump(content), override=True)
+
+
+def _delete_all_files(directory: str) -> None:
+    for file in file_system.list_files(directory):
+        file_system.delete_file(directory, file)
 
 
 @router.post("/update-controller-config/bot/{bot_name}/{controller_id}")
@@ -259,16 +369,14 @@ async def update_controller_config(bot_name: str, controller_id: str, config: Di
     bots_config_path = f"instances/{bot_name}/conf/controllers"
     if not file_system.path_exists(bots_config_path):
         raise HTTPException(status_code=400, detail="Bot not found.")
-    current_config = file_system.read_yaml_file(f"bots/{bots_config_path}/{controller_id}.yml")
-    current_config.update(config)
-    file_system.dump_dict_to_yaml(f"bots/{bots_config_path}/{controller_id}.yml", current_config)
+    await asyncio.to_thread(_merge_yaml_file, f"bots/{bots_config_path}/{controller_id}.yml", config)
     return {"message": "Controller configuration updated successfully."}
 
 
 @router.post("/add-script", status_code=status.HTTP_201_CREATED)
 async def add_script(script: Script, override: bool = False):
     try:
-        file_system.add_file('scripts', script.name + '.py', script.content, override)
+        await asyncio.to_thread(file_system.add_file, 'scripts', script.name + '.py', script.content, override)
         return {"message": "Script added successfully."}
     except FileExistsError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -277,8 +385,7 @@ async def add_script(script: Script, override: bool = False):
 @router.post("/upload-script")
 async def upload_script(config_file: UploadFile = File(...), override: bool = False):
     try:
-        contents = await config_file.read()
-        file_system.add_file('scripts', config_file.filename, contents.decode(), override)
+        await asyncio.to_thread(file_system.add_file_from_stream, 'scripts', config_file.filename, config_file.file, override)
         return {"message": "Script uploaded successfully."}
     except FileExistsError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -287,9 +394,7 @@ async def upload_script(config_file: UploadFile = File(...), override: bool = Fa
 @router.post("/add-script-config", status_code=status.HTTP_201_CREATED)
 async def add_script_config(config: ScriptConfig):
     try:
-        yaml_content = yaml.dump(config.content)
-
-        file_system.add_file('conf/scripts', config.name + '.yml', yaml_content, override=True)
+        await asyncio.to_thread(_write_yaml_file, 'conf/scripts', config.name + '.yml', config.content)
         return {"message": "Script configuration uploaded successfully."}
     except Exception as e:  # Consider more specific exception handling
         raise HTTPException(status_code=400, detail=str(e))
@@ -298,8 +403,7 @@ async def add_script_config(config: ScriptConfig):
 @router.post("/upload-script-config")
 async def upload_script_config(config_file: UploadFile = File(...), override: bool = False):
     try:
-        contents = await config_file.read()
-        file_system.add_file('conf/scripts', config_file.filename, contents.decode(), override)
+        await asyncio.to_thread(file_system.add_file_from_stream, 'conf/scripts', config_file.filename, config_file.file, override)
         return {"message": "Script configuration uploaded successfully."}
     except FileExistsError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -308,9 +412,7 @@ async def upload_script_config(config_file: UploadFile = File(...), override: bo
 @router.post("/add-controller-config", status_code=status.HTTP_201_CREATED)
 async def add_controller_config(config: ScriptConfig):
     try:
-        yaml_content = yaml.dump(config.content)
-
-        file_system.add_file('conf/controllers', config.name + '.yml', yaml_content, override=True)
+        await asyncio.to_thread(_write_yaml_file, 'conf/controllers', config.name + '.yml', config.content)
         return {"message": "Controller configuration uploaded successfully."}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -319,8 +421,7 @@ async def add_controller_config(config: ScriptConfig):
 @router.post("/upload-controller-config")
 async def upload_controller_config(config_file: UploadFile = File(...), override: bool = False):
     try:
-        contents = await config_file.read()
-        file_system.add_file('conf/controllers', config_file.filename, contents.decode(), override)
+        await asyncio.to_thread(file_system.add_file_from_stream, 'conf/controllers', config_file.filename, config_file.file, override)
         return {"message": "Controller configuration uploaded successfully."}
     except FileExistsError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -329,7 +430,7 @@ async def upload_controller_config(config_file: UploadFile = File(...), override
 @router.post("/delete-controller-config", status_code=status.HTTP_200_OK)
 async def delete_controller_config(config_name: str):
     try:
-        file_system.delete_file('conf/controllers', config_name)
+        await asyncio.to_thread(file_system.delete_file, 'conf/controllers', config_name)
         return {"message": f"Controller configuration {config_name} deleted successfully."}
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -338,7 +439,7 @@ async def delete_controller_config(config_name: str):
 @router.post("/delete-script-config", status_code=status.HTTP_200_OK)
 async def delete_script_config(config_name: str):
     try:
-        file_system.delete_file('conf/scripts', config_name)
+        await asyncio.to_thread(file_system.delete_file, 'conf/scripts', config_name)
         return {"message": f"Script configuration {config_name} deleted successfully."}
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -347,8 +448,7 @@ async def delete_script_config(config_name: str):
 @router.post("/delete-all-controller-configs", status_code=status.HTTP_200_OK)
 async def delete_all_controller_configs():
     try:
-        for file in file_system.list_files('conf/controllers'):
-            file_system.delete_file('conf/controllers', file)
+        await asyncio.to_thread(_delete_all_files, 'conf/controllers')
         return {"message": "All controller configurations deleted successfully."}
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -357,8 +457,7 @@ async def delete_all_controller_configs():
 @router.post("/delete-all-script-configs", status_code=status.HTTP_200_OK)
 async def delete_all_script_configs():
     try:
-        for file in file_system.list_files('conf/scripts'):
-            file_system.delete_file('conf/scripts', file)
+        await asyncio.to_thread(_delete_all_files, 'conf/scripts')
         return {"message": "All script configurations deleted successfully."}
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -8,18 +8,53 @@ prints new log lines so they appear in the dev console for ChatGPT iteration.
 """
 import subprocess
 import threading
-import time
 from pathlib import Path
 import os
 
+# watchdog ships with Streamlit on Linux/Windows; without it tail_log falls back to polling
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover
+    Observer = None  # type: ignore
+
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 LOG_PATH = LOG_DIR / "dashboard_runtime.log"
 
 
+POLL_SEC = 0.5  # wake-up interval when watchdog is unavailable
+WATCH_SAFETY_SEC = 5.0  # re-check interval with watchdog, in case an event is missed
+
+
+def _watch_for_writes(path: Path, changed: threading.Event) -> bool:
+    """Set *changed* whenever *path* is modified; return False if watchdog is unavailable."""
+    if Observer is None:
+        return False
+
+    target = str(path.resolve())
+
+    class _Handler(FileSystemEventHandler):
+        def on_modified(self, event):
+            if os.path.abspath(event.src_path) == target:
+                changed.set()
+
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(_Handler(), str(path.resolve().parent), recursive=False)
+    observer.start()
+    return True
+
+
 def tail_log(path: Path):
-    """Continuously print appended lines from *path*."""
+    """Continuously print appended lines from *path*.
+
+    Sleeps on filesystem events (inotify via watchdog) between bursts of lines,
+    falling back to polling every POLL_SEC when watchdog is not installed.
+    """
     path.touch(exist_ok=True)
+    changed = threading.Event()
+    timeout = WATCH_SAFETY_SEC if _watch_for_writes(path, changed) else POLL_SEC
     with path.open() as fp:
         fp.seek(0, os.SEEK_END)
         while True:
@@ -27,7 +62,8 @@ def tail_log(path: Path):
             if line:
                 print("[LOG]", line.rstrip())
             else:
-                time.sleep(0.5)
+                changed.wait(timeout)
+                changed.clear()
 
 
 def main():
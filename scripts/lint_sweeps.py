@@ -12,8 +12,9 @@ This prevents broken YAML from reaching CI or other developers.
 from __future__ import annotations
 
 import sys, os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 import traceback
 
 try:
@@ -28,13 +29,17 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from A_yml_to_json import build_payloads  # re-use existing logic
+from utils.yaml_fast import safe_load
+
+# Below this many files a process pool costs more to start than it saves.
+PARALLEL_MIN_FILES = 4
 
 
 def check_file(path: Path) -> List[str]:
     """Return list of error strings (empty list → file OK)."""
     errors: List[str] = []
     try:
-        data = yaml.safe_load(path.read_text())
+        data = safe_load(path.read_text())
     except Exception as exc:
         errors.append(f"YAML parse error → {exc}")
         return errors
@@ -52,6 +57,16 @@ def check_file(path: Path) -> List[str]:
     return errors
 
 
+def iter_checks(targets: List[Path]) -> Iterator[List[str]]:
+    """Yield ``check_file`` results in *targets* order, using a process pool for larger batches."""
+    if len(targets) < PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+        yield from map(check_file, targets)
+        return
+    # check_file is CPU-bound (YAML parse + build_payloads) and top-level, so it pickles.
+    with ProcessPoolExecutor() as pool:
+        yield from pool.map(check_file, targets)
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print("Usage: lint_sweeps.py <dir-or-file> [...]", file=sys.stderr)
@@ -66,8 +81,7 @@ def main() -> None:
             targets.append(p)
 
     has_err = False
-    for yml in targets:
-        errs = check_file(yml)
+    for yml, errs in zip(targets, iter_checks(targets)):
         if errs:
             has_err = True
             print(f"❌ {yml}")
@@ -3,6 +3,8 @@
 
 1. Recursively compiles every *.py file under the project root **in memory** to catch
    syntax errors without touching the filesystem (avoids __pycache__ permission issues).
+   Files that compiled cleanly last time and have not changed since (same mtime +
+   size, recorded in `.cache/quick_smoke.json`) are skipped.
 2. Exits with non-zero status if any file fails to compile, printing a concise report.
 
 Usage
@@ -14,9 +16,12 @@ launching Streamlit on every reload (see `scripts/dev_watch.py`).
 """
 from __future__ import annotations
 
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Configuration – directories to ignore (version control, large data dumps, etc.)
@@ -28,28 +33,88 @@ EXCLUDE_DIRS = {
     "data",
 }
 
-
-def should_skip(path: Path) -> bool:
-    """Return True if *path* is located within an excluded directory."""
-    parts = set(path.parts)
-    return bool(parts & EXCLUDE_DIRS)
-
-
-def compile_sources(root: Path = Path(".")) -> List[Tuple[Path, Exception]]:
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 200
+
+# path -> [mtime_ns, size] of files that compiled cleanly; only valid for the same Python
+CACHE_PATH = Path(".cache/quick_smoke.json")
+_PY_TAG = "%d.%d" % sys.version_info[:2]
+
+
+def iter_sources(root: Path = Path(".")) -> Iterator[Path]:
+    """Yield every *.py file under *root*, never descending into excluded directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield Path(dirpath, name)
+
+
+def _compile_one(py_path: Path) -> Optional[Exception]:
+    """Compile *py_path* in memory; return the exception on failure, else None."""
+    try:
+        with open(py_path, "rb") as fp:
+            source = fp.read()
+        compile(source, str(py_path), "exec")  # in-memory compile; bytes honour coding cookies
+    except Exception as exc:  # noqa: BLE001 – we want to catch any exception
+        return exc
+    return None
+
+
+def _load_cache(path: Path) -> Dict[str, List[int]]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("python") != _PY_TAG:
+        return {}
+    return data.get("files", {})
+
+
+def _save_cache(path: Path, files: Dict[str, List[int]]) -> None:
+    """Best-effort atomic write of the cache (never fatal)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"python": _PY_TAG, "files": files}))
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def compile_sources(
+    root: Path = Path("."),
+    workers: Optional[int] = None,
+    cache_path: Optional[Path] = CACHE_PATH,
+) -> List[Tuple[Path, Exception]]:
     """Compile every Python file under *root* (depth-first).
 
+    Files whose mtime + size match their entry in *cache_path* are skipped;
+    pass ``cache_path=None`` to compile everything.  Large trees are compiled
+    across a process pool (*workers* defaults to the CPU count); results keep
+    the walk order either way.
+
     Returns a list of (path, exception) tuples for files that failed to compile.
     """
-    errors: List[Tuple[Path, Exception]] = []
-
-    for py_path in root.rglob("*.py"):
-        if should_skip(py_path):
-            continue
-        try:
-            source = py_path.read_text(encoding="utf-8")
-            compile(source, str(py_path), "exec")  # in-memory compile
-        except Exception as exc:  # noqa: BLE001 – we want to catch any exception
-            errors.append((py_path, exc))
+    cached = _load_cache(cache_path) if cache_path else {}
+    stamps: Dict[str, List[int]] = {}
+    todo: List[Path] = []
+    for p in iter_sources(root):
+        st = p.stat()
+        stamps[str(p)] = [st.st_mtime_ns, st.st_size]
+        if cached.get(str(p)) != stamps[str(p)]:
+            todo.append(p)
+
+    if len(todo) < PARALLEL_MIN_FILES or (workers or os.cpu_count() or 1) < 2:
+        results = [_compile_one(p) for p in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_compile_one, todo, chunksize=32))
+    errors = [(p, exc) for p, exc in zip(todo, results) if exc is not None]
+
+    if cache_path:
+        failed = {str(p) for p, _ in errors}
+        _save_cache(cache_path, {k: v for k, v in stamps.items() if k not in failed})
     return errors
 
 
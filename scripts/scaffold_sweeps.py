@@ -30,10 +30,16 @@ import pkgutil
 import sys
 from pathlib import Path
 import difflib
-from typing import Any, Dict, List
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 import numpy as _np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import re
 import argparse
 
 try:
@@ -41,10 +47,17 @@ try:
 except ImportError:
     sys.exit("Install PyYAML: pip install pyyaml")
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 ROOT = Path(__file__).resolve().parent.parent
 SWEEP_DIR = ROOT / "sweeps"
 GEN_DIR = SWEEP_DIR / "generated"
 GEN_DIR.mkdir(parents=True, exist_ok=True)
+# name -> [hash of sanitised base, curated file mtime_ns] for stubs last found identical to the curated sweep
+UNCHANGED_CACHE = ROOT / ".cache" / "scaffold_sweeps.json"
 
 # Temporary compatibility patch for NumPy ≥2.0 removal of NaN constant
 if not hasattr(_np, "NaN"):
@@ -54,11 +67,17 @@ if not hasattr(_np, "NaN"):
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from utils.yaml_fast import safe_dump  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Sanitiser shared by API and local discovery paths
 # ---------------------------------------------------------------------------
 
-NULL_BOOL_KEYS = {"dynamic_order_spread", "dynamic_target", "manual_kill_switch"}
+NULL_BOOL_KEYS = frozenset({"dynamic_order_spread", "dynamic_target", "manual_kill_switch"})
+# "connector_name" itself ends with "connector_name", so one tuple endswith covers all three cases
+_CONNECTOR_KEY_SUFFIXES = ("_connector", "connector_name")
+# field name -> "is a connector field"; the same few names recur across every controller
+_CONNECTOR_KEY_MEMO: Dict[str, bool] = {}
 
 
 def sanitize_base(base_dict: Dict[str, Any], file_stem: str) -> Dict[str, Any]:
@@ -69,26 +88,25 @@ def sanitize_base(base_dict: Dict[str, Any], file_stem: str) -> Dict[str, Any]:
 
     original_keys = set(base_dict.keys())
 
-    def _rec(obj):
+    # Walk nested dicts/lists with an explicit stack (replacing values never resizes a dict)
+    stack: List[Any] = [base_dict]
+    while stack:
+        obj = stack.pop()
         if isinstance(obj, dict):
-            for k, v in list(obj.items()):
+            for k, v in obj.items():
                 if isinstance(v, (dict, list)):
-                    _rec(v)
-                else:
-                    if v is None and k in NULL_BOOL_KEYS:
+                    stack.append(v)
+                elif v is None:
+                    if k in NULL_BOOL_KEYS:
                         obj[k] = False
-                    elif isinstance(v, str):
-                        if (
-                            k == "connector_name"
-                            or k.endswith("_connector")
-                            or k.endswith("connector_name")
-                        ) and v.startswith("binance"):
-                            obj[k] = "kucoin"
-        elif isinstance(obj, list):
-            for item in obj:
-                _rec(item)
-
-    _rec(base_dict)
+                elif isinstance(v, str) and v.startswith("binance"):
+                    is_connector = _CONNECTOR_KEY_MEMO.get(k)
+                    if is_connector is None:
+                        is_connector = _CONNECTOR_KEY_MEMO[k] = k.endswith(_CONNECTOR_KEY_SUFFIXES)
+                    if is_connector:
+                        obj[k] = "kucoin"
+        else:
+            stack.extend(item for item in obj if isinstance(item, (dict, list)))
 
     # Remove top-level connector/trading_pair if they were not part of the
     # original payload (avoid "extra inputs not permitted" for configs like
@@ -151,18 +169,82 @@ def build_yaml(cfg_cls) -> str:
         "sweep": {},
         "grid": {},
     }
-    return yaml.safe_dump(stub, sort_keys=False, default_flow_style=False)
+    return safe_dump(stub, sort_keys=False, default_flow_style=False)
+
+
+def json_body(resp: requests.Response) -> Any:
+    """Decode a JSON response straight from its bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def api_session(username: str, password: str) -> requests.Session:
+    """Pooled keep-alive session shared by all config fetches (safe across worker threads)."""
+    sess = requests.Session()
+    sess.auth = (username, password)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                          max_retries=Retry(total=3, backoff_factor=0.2))
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    return sess
+
 
+def base_digest(base: Dict[str, Any]) -> str:
+    """Cheap content key for a sanitised base dict (order-insensitive)."""
+    blob = json.dumps(base, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
 
-def diff(existing: str, new: str, path_old: Path, path_new: Path):
+
+def _load_unchanged(path: Path) -> Dict[str, List[Any]]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_unchanged(path: Path, entries: Dict[str, List[Any]]) -> None:
+    """Best-effort atomic write of the unchanged-stub cache (never fatal)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entries))
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+_HUNK_RE = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def diff(existing: str, new: str, path_old: Path, path_new: Path, context: int = 3):
+    a = existing.splitlines()
+    b = new.splitlines()
+    # Trim the common head/tail (keeping *context* lines) so SequenceMatcher only
+    # sees the region that actually changed; hunk line numbers are shifted back.
+    n = min(len(a), len(b))
+    head = 0
+    while head < n and a[head] == b[head]:
+        head += 1
+    tail = 0
+    while tail < n - head and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+    skip_head = max(0, head - context)
+    skip_tail = max(0, tail - context)
     d = difflib.unified_diff(
-        existing.splitlines(),
-        new.splitlines(),
+        a[skip_head:len(a) - skip_tail],
+        b[skip_head:len(b) - skip_tail],
         fromfile=str(path_old),
         tofile=str(path_new),
         lineterm="",
+        n=context,
     )
     for line in d:
+        m = _HUNK_RE.match(line) if skip_head else None
+        if m:
+            line = (f"@@ -{int(m[1]) + skip_head}{m[2] or ''} "
+                    f"+{int(m[3]) + skip_head}{m[4] or ''} @@")
         print(line)
 
 
@@ -175,19 +257,23 @@ def main() -> None:
     created = updated = skipped = 0
 
     emitted_names: Dict[str, int] = {}
+    unchanged = _load_unchanged(UNCHANGED_CACHE)
     try:
         USERNAME = os.getenv("HB_USER", "admin")
         PASSWORD = os.getenv("HB_PASS", "admin")
         base_url = "http://localhost:8000"
 
+        sess = api_session(USERNAME, PASSWORD)
+
         # 1) Discover controller files
-        r = requests.get(f"{base_url}/list-controllers", auth=(USERNAME, PASSWORD), timeout=10)
+        r = sess.get(f"{base_url}/list-controllers", timeout=10)
         r.raise_for_status()
-        listing: Dict[str, List[str]] = r.json()
+        listing: Dict[str, List[str]] = json_body(r)
 
         total = sum(len(v) for v in listing.values())
         print(f"🛰  Fetched controller list (total {total}) via /list-controllers")
 
+        jobs: List[Tuple[str, str, str]] = []  # (controller_type, fname, name_unique)
         for controller_type, files in listing.items():
             for fname in files:
                 name = fname.replace(".py", "")
@@ -197,55 +283,80 @@ def main() -> None:
                 else:
                     emitted_names[name] = 1
                     name_unique = name
-
-                # 2) Fetch default config per controller
-                url = f"{base_url}/controller-config-pydantic/{controller_type}/{fname}"
-                try:
-                    resp = requests.get(url, auth=(USERNAME, PASSWORD), timeout=10)
-                    resp.raise_for_status()
-                    base = resp.json()
-                    if name_unique != name:
-                        base["controller_name"] = name_unique
-                except Exception as exc_inner:
-                    print(f"❌ fetch {fname}: {exc_inner}")
+                jobs.append((controller_type, fname, name_unique))
+
+        # 2) Fetch default config per controller – concurrently over the pooled
+        # session; results come back in listing order so file writes stay deterministic.
+        def fetch_one(job: Tuple[str, str, str]) -> Dict[str, Any] | Exception:
+            controller_type, fname, _ = job
+            url = f"{base_url}/controller-config-pydantic/{controller_type}/{fname}"
+            try:
+                resp = sess.get(url, timeout=10)
+                resp.raise_for_status()
+                return json_body(resp)
+            except Exception as exc_inner:
+                return exc_inner
+
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            fetched = list(ex.map(fetch_one, jobs))
+
+        for (controller_type, fname, name_unique), base in zip(jobs, fetched):
+            if isinstance(base, Exception):
+                print(f"❌ fetch {fname}: {base}")
+                continue
+            if name_unique != fname.replace(".py", ""):
+                base["controller_name"] = name_unique
+
+            base = sanitize_base(base, name_unique)
+
+            curated_path = SWEEP_DIR / f"{name_unique}_sweep.yml"
+            gen_path = GEN_DIR / f"{name_unique}_sweep.yml"
+
+            # Same base as last time and the curated file untouched since → nothing to emit
+            digest = base_digest(base)
+            try:
+                curated_mtime = curated_path.stat().st_mtime_ns
+            except OSError:
+                curated_mtime = None
+            if curated_mtime is not None and unchanged.get(name_unique) == [digest, curated_mtime]:
+                skipped += 1
+                continue
+
+            yaml_text = safe_dump({
+                "meta": {
+                    "start": "2024-03-11",
+                    "end": "2024-03-13",
+                    "resolution": "3m",
+                    "fee": 0.001,
+                },
+                "base": base,
+                "sweep": {},
+                "grid": {},
+            }, sort_keys=False, default_flow_style=False)
+
+            unchanged.pop(name_unique, None)
+            if curated_mtime is not None:
+                existing = curated_path.read_text()
+                if existing.strip() == yaml_text.strip():
+                    unchanged[name_unique] = [digest, curated_mtime]
+                    skipped += 1
                     continue
-
-                base = sanitize_base(base, name_unique)
-                yaml_text = yaml.safe_dump({
-                    "meta": {
-                        "start": "2024-03-11",
-                        "end": "2024-03-13",
-                        "resolution": "3m",
-                        "fee": 0.001,
-                    },
-                    "base": base,
-                    "sweep": {},
-                    "grid": {},
-                }, sort_keys=False, default_flow_style=False)
-
-                curated_path = SWEEP_DIR / f"{name_unique}_sweep.yml"
-                gen_path = GEN_DIR / f"{name_unique}_sweep.yml"
-
-                if curated_path.exists():
-                    existing = curated_path.read_text()
-                    if existing.strip() == yaml_text.strip():
-                        skipped += 1
-                        continue
-                    gen_path.write_text(yaml_text)
-                    print(f"🔄 Updated stub → {gen_path.relative_to(ROOT)} (diff vs curated)")
-                    if args.show_diff:
-                        print("---")
-                        diff(existing, yaml_text, curated_path, gen_path)
-                    updated += 1
-                else:
-                    gen_path.write_text(yaml_text)
-                    print(f"✅ Generated stub → {gen_path.relative_to(ROOT)}")
-                    created += 1
+                gen_path.write_text(yaml_text)
+                print(f"🔄 Updated stub → {gen_path.relative_to(ROOT)} (diff vs curated)")
+                if args.show_diff:
+                    print("---")
+                    diff(existing, yaml_text, curated_path, gen_path)
+                updated += 1
+            else:
+                gen_path.write_text(yaml_text)
+                print(f"✅ Generated stub → {gen_path.relative_to(ROOT)}")
+                created += 1
 
     except Exception as exc:
         print(f"⚠️  Could not fetch from API ({exc}) – aborting scaffold (no local import fallback).")
         return
 
+    _save_unchanged(UNCHANGED_CACHE, unchanged)
     print("\nSummary:", f"{created} new, {updated} diffs, {skipped} unchanged.")
 
 
@@ -17,9 +17,12 @@ from __future__ import annotations
 import asyncio
 import os
 import random
+import re
+import socket
 import subprocess
 import sys
 import textwrap
+import time
 from pathlib import Path
 from typing import List
 
@@ -45,24 +48,32 @@ ERROR_INDICATORS = [
     "Skipping",
     "Error",
 ]
+CSS_INDICATORS = [i for i in ERROR_INDICATORS if i.startswith(".")]
+TEXT_INDICATORS = [i for i in ERROR_INDICATORS if not i.startswith(".")]
+# Longest first so the alternation prefers the most specific indicator at a position
+_TEXT_INDICATOR_RE = re.compile("|".join(map(re.escape, sorted(TEXT_INDICATORS, key=len, reverse=True))))
+
+
+# Body text plus the trimmed, non-empty texts of every CSS_INDICATORS match, in one CDP call
+_COLLECT_JS = """(sels) => [
+    document.body.innerText,
+    sels.map(s => Array.from(document.querySelectorAll(s), e => e.innerText.trim()).filter(Boolean)),
+]"""
 
 
 async def assert_no_exceptions(page) -> List[str]:
     """Return list of error strings found in the current DOM."""
     errors: List[str] = []
-    body_txt = await page.inner_text("body")
-
-    for indicator in ERROR_INDICATORS:
-        if indicator.startswith("."):  # CSS selector
-            exc_elems = await page.query_selector_all(indicator)
-    for elem in exc_elems:
-        text = (await elem.inner_text()).strip()
-        if text:
-                    errors.append(f"Found element '{indicator}': {text[:200]}")
-        else:  # Text search
-            if indicator in body_txt:
-                errors.append(f"Found error string: '{indicator}'")
-    
+    body_txt, css_texts = await page.evaluate(_COLLECT_JS, CSS_INDICATORS)
+
+    for indicator, texts in zip(CSS_INDICATORS, css_texts):
+        for text in texts:
+            errors.append(f"Found element '{indicator}': {text[:200]}")
+
+    # One pass over the page text for every text indicator
+    for found in {m.group(0) for m in _TEXT_INDICATOR_RE.finditer(body_txt)}:
+        errors.append(f"Found error string: '{found}'")
+
     # Remove duplicates
     return sorted(list(set(errors)))
 
@@ -96,6 +107,19 @@ async def run_smoke(base_url: str) -> None:
         await browser.close()
 
 
+def wait_port(port: int, timeout: float = 30.0, proc: subprocess.Popen | None = None) -> None:
+    """Block until something accepts TCP connections on *port* (or raise TimeoutError)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        if proc is not None and proc.poll() is not None:
+            raise RuntimeError(f"Streamlit exited early (code {proc.returncode})")
+        time.sleep(0.05)
+    raise TimeoutError(f"Nothing listening on port {port} after {timeout:.0f} s")
+
+
 def main() -> None:
     port = random.randint(9100, 9200)
     env = os.environ.copy()
@@ -114,8 +138,8 @@ def main() -> None:
     proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env)
 
     try:
-        # Small delay to allow server start
-        asyncio.run(asyncio.sleep(4))
+        # Proceed as soon as Streamlit binds the port
+        wait_port(port, proc=proc)
         base_url = f"http://localhost:{port}"
         asyncio.run(run_smoke(base_url))
     finally:
@@ -1,34 +1,46 @@
 from __future__ import annotations
 
-"""utils.candles_cache – Simple Parquet disk cache for Hummingbot candle fetches
+"""utils.candles_cache – Simple Arrow/Parquet disk cache for Hummingbot candle fetches
 
 This module monkey-patches ``hummingbot.data_feed.candles_feed.candles_factory.CandlesFactory``
-so that repeated calls to ``get_candles_df`` are first served from a local Parquet file
-on disk.  It significantly reduces API rate-limit errors when running large back-testing
+so that repeated calls to ``get_candles_df`` are first served from a local file on
+disk (Arrow IPC/Feather when pyarrow is available, Parquet otherwise).  It
+significantly reduces API rate-limit errors when running large back-testing
 sweeps.
 
 The patch is **idempotent** – importing this module multiple times is safe.
 """
 
-from functools import wraps
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 import pandas as pd
 import asyncio
 
+try:
+    from pyarrow import feather as _feather  # type: ignore
+except ImportError:  # pragma: no cover
+    _feather = None  # type: ignore
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
 _CACHE_DIR = Path("data/candles_cache")
 _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Arrow IPC skips Parquet's footer/statistics work and decodes small frames faster
+_CACHE_SUFFIX = ".arrow" if _feather is not None else ".parquet"
 
 
 # ---------------------------------------------------------------------------
 # Helper utilities
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def _safe_filename(text: str) -> str:
     """Make *text* safe to use as part of a filename (very naive)."""
     for ch in "/\\ ":
@@ -40,29 +52,130 @@ def _safe_filename(text: str) -> str:
 # Main patching logic
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def _build_cache_key(connector: str, trading_pair: str, interval: str) -> Path:
-    """Return the Parquet cache filepath for the given parameters."""
-    stem = f"{_safe_filename(connector)}__{_safe_filename(trading_pair)}__{interval}.parquet"
+    """Return the cache filepath for the given parameters (memoised – few distinct keys per sweep)."""
+    stem = f"{_safe_filename(connector)}__{_safe_filename(trading_pair)}__{interval}{_CACHE_SUFFIX}"
     return _CACHE_DIR / stem
 
 
+def _read_frame(path: Path | str) -> pd.DataFrame:
+    if str(path).endswith(".arrow"):
+        return _feather.read_feather(str(path))  # index restored from pandas metadata
+    return pd.read_parquet(path)
+
+
+def _write_frame(df: pd.DataFrame, path: Path) -> None:
+    if path.suffix == ".arrow":
+        _feather.write_feather(df, str(path), compression="zstd")
+        return
+    try:
+        df.to_parquet(path, compression="zstd")  # pyarrow backend preferred
+    except Exception:
+        # Fallback to default engine/compression
+        df.to_parquet(path)
+
+
+def _migrate_legacy_parquet(path: Path) -> None:
+    """One-shot: rewrite a pre-existing ``.parquet`` cache file as *path* (``.arrow``)."""
+    legacy = path.with_suffix(".parquet")
+    if path.suffix != ".arrow" or path.exists() or not legacy.exists():
+        return
+    try:
+        _write_frame(pd.read_parquet(legacy), path)
+        legacy.unlink(missing_ok=True)
+    except Exception:
+        path.unlink(missing_ok=True)  # leave the legacy file for a later attempt
+
+
 def _merge_and_save(df_existing: pd.DataFrame, df_new: pd.DataFrame, path: Path) -> None:
     """Merge *df_new* into *df_existing*, de-duplicate, sort, and write back to *path*."""
     df_combined = (
         pd.concat([df_existing, df_new]) if not df_existing.empty else df_new
     )
-    # De-duplicate by index (timestamp) then sort
-    df_combined = df_combined[~df_combined.index.duplicated(keep="last")].sort_index()
+    # Fast path (live candles): *df_new* is ordered, unique and strictly later than
+    # the cached frame (kept unique & sorted), so the plain append is already ordered.
+    appended_in_order = (
+        df_new.index.is_monotonic_increasing and df_new.index.is_unique
+        and (df_existing.empty or df_new.empty or df_new.index[0] > df_existing.index[-1])
+    )
+    if not appended_in_order:
+        # De-duplicate by index (timestamp) then sort
+        if not df_combined.index.is_unique:
+            df_combined = df_combined[~df_combined.index.duplicated(keep="last")]
+        df_combined = df_combined.sort_index()
     # Persist (use fast compression if available)
     try:
-        df_combined.to_parquet(path, compression="zstd")  # pyarrow backend preferred
+        _write_frame(df_combined, path)
     except Exception:
-        try:
-            # Fallback to default engine/compression
-            df_combined.to_parquet(path)
-        except Exception:
-            # No Parquet engine available – skip persistence (cache miss still fine)
-            return
+        # No Arrow/Parquet engine available – skip persistence (cache miss still fine)
+        return
+
+
+@lru_cache(maxsize=128)
+def _read_cached_frame(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse + de-duplicate + sort one cache file; memoised per file version."""
+    df = _read_frame(path)
+    return df[~df.index.duplicated(keep="last")].sort_index()
+
+
+def _load_cached_frame(path: Path) -> Optional[pd.DataFrame]:
+    """Return the cached candles at *path* (shared – do not mutate), or ``None``.
+
+    Repeat reads of an unchanged file are served from memory; a rewrite by
+    ``_merge_and_save`` bumps the mtime and forces a fresh read.  Corrupt
+    files are removed.
+    """
+    _migrate_legacy_parquet(path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    try:
+        return _read_cached_frame(str(path), st.st_mtime_ns, st.st_size)
+    except Exception:
+        path.unlink(missing_ok=True)
+        return None
+
+
+# cache path -> lock held while one caller fetches + merges that key; concurrent
+# callers for the same key wait and then read what it wrote.  Re-entrant because
+# the patched BacktestingDataProvider may call the patched CandlesFactory.
+_key_locks: Dict[Path, threading.RLock] = {}
+_key_locks_mutex = threading.Lock()
+
+
+def _key_lock(path: Path) -> threading.RLock:
+    with _key_locks_mutex:
+        lock = _key_locks.get(path)
+        if lock is None:
+            lock = _key_locks[path] = threading.RLock()
+        return lock
+
+
+def _serves(df_cached: Optional[pd.DataFrame], max_records: Optional[int]) -> bool:
+    """True if *df_cached* alone satisfies a request for *max_records* rows."""
+    return df_cached is not None and not df_cached.empty and (
+        max_records is None or len(df_cached) >= max_records
+    )
+
+
+def _run_sync(result: Any) -> Any:
+    """Resolve *result* if a sync call handed back a coroutine.
+
+    With no loop running in this thread ``asyncio.run`` drives it.  Inside a
+    running loop that loop cannot be re-entered (``run_until_complete`` raises
+    and ``asyncio.run`` refuses), so the coroutine runs on a private loop in a
+    worker thread while this caller waits.
+    """
+    if not asyncio.iscoroutine(result):
+        return result
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(result)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        return ex.submit(asyncio.run, result).result()
 
 
 # noinspection PyProtectedMember
@@ -86,12 +199,9 @@ def _patch_candles_factory() -> None:
 
     original_fn: Callable[..., Any] = CandlesFactory.get_candles_df  # type: ignore[attr-defined]
 
-    @wraps(original_fn)
-    def cached_get_candles_df(self, *args: Any, **kwargs: Any):  # type: ignore[override]
-        """Wrapper that adds a disk cache layer around the original method."""
-        # -------------------------------------------------------------------
-        # 1. Introspect args / kwargs – be tolerant to positional or keyword use
-        # -------------------------------------------------------------------
+    def _request(args: Any, kwargs: Any):
+        """Return ``(cache_path, max_records)`` for a call, or ``None`` to bypass the cache."""
+        # Introspect args / kwargs – be tolerant to positional or keyword use
         connector: Optional[str] = kwargs.get("connector_name") or (
             args[0] if len(args) > 0 else None  # type: ignore[assignment]
         )
@@ -101,59 +211,17 @@ def _patch_candles_factory() -> None:
         interval: Optional[str] = kwargs.get("interval") or (
             args[2] if len(args) > 2 else None  # type: ignore[assignment]
         )
-        max_records: Optional[int] = kwargs.get("max_records")
-
         # Guard – if any of the essentials are missing, skip cache layer
         if connector is None or trading_pair is None or interval is None:
-            return original_fn(self, *args, **kwargs)
-
-        cache_path = _build_cache_key(connector, trading_pair, interval)
-
-        # -------------------------------------------------------------------
-        # 2. Try to serve request fully from cache
-        # -------------------------------------------------------------------
-        df_cached: Optional[pd.DataFrame] = None
-        if cache_path.exists():
-            try:
-                df_cached = pd.read_parquet(cache_path)
-                # Ensure index is unique & sorted
-                df_cached = (
-                    df_cached[~df_cached.index.duplicated(keep="last")].sort_index()
-                )
-            except Exception:
-                # Corrupt cache – remove and ignore
-                cache_path.unlink(missing_ok=True)
-                df_cached = None
-        if df_cached is not None and not df_cached.empty:
-            # If caller only needs *max_records* and we have enough rows, shortcut
-            if max_records is None or len(df_cached) >= max_records:
-                return (
-                    df_cached.iloc[-max_records:] if max_records else df_cached.copy()
-                )
-
-        # -------------------------------------------------------------------
-        # 4. Fallback to network / original function (with safety net)
-        # -------------------------------------------------------------------
-        try:
-            df_live = original_fn(self, *args, **kwargs)
-            if asyncio.iscoroutine(df_live):
-                try:
-                    loop = asyncio.get_running_loop()
-                    df_live = loop.run_until_complete(df_live)  # type: ignore[misc]
-                except RuntimeError:
-                    df_live = asyncio.run(df_live)  # type: ignore[func-returns-value]
-        except Exception:
-            # Network or provider error – fallback to cache if we have anything
-            if df_cached is not None and not df_cached.empty:
-                return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
-            raise
+            return None
+        return _build_cache_key(connector, trading_pair, interval), kwargs.get("max_records")
 
+    def _finish(df_cached: Optional[pd.DataFrame], df_live: Any, cache_path: Path, max_records: Optional[int]):
         # If provider returned None, but we have cache, serve it instead
         if df_live is None:
             if df_cached is not None and not df_cached.empty:
                 return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
             return df_live  # propagate None if absolutely nothing available
-
         try:
             if df_cached is None:
                 _merge_and_save(pd.DataFrame(), df_live, cache_path)
@@ -163,6 +231,62 @@ def _patch_candles_factory() -> None:
             pass
         return df_live
 
+    if inspect.iscoroutinefunction(original_fn):
+        @wraps(original_fn)
+        async def cached_get_candles_df(self, *args: Any, **kwargs: Any):  # type: ignore[override]
+            """Async variant: awaits the original directly, no sync/async bridge."""
+            req = _request(args, kwargs)
+            if req is None:
+                return await original_fn(self, *args, **kwargs)
+            cache_path, max_records = req
+            df_cached = _load_cached_frame(cache_path)
+            if _serves(df_cached, max_records):
+                return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
+            try:
+                df_live = await original_fn(self, *args, **kwargs)
+            except Exception:
+                if df_cached is not None and not df_cached.empty:
+                    return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
+                raise
+            return _finish(df_cached, df_live, cache_path, max_records)
+    else:
+        @wraps(original_fn)
+        def cached_get_candles_df(self, *args: Any, **kwargs: Any):  # type: ignore[override]
+            """Wrapper that adds a disk cache layer around the original method."""
+            req = _request(args, kwargs)
+            if req is None:
+                return original_fn(self, *args, **kwargs)
+            cache_path, max_records = req
+
+            # ---------------------------------------------------------------
+            # 1. Try to serve request fully from cache
+            # ---------------------------------------------------------------
+            df_cached = _load_cached_frame(cache_path)  # unique, sorted index
+            # If caller only needs *max_records* and we have enough rows, shortcut
+            if _serves(df_cached, max_records):
+                return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
+
+            # ---------------------------------------------------------------
+            # 2. Cold/short cache – one caller per key fetches; the others wait
+            #    and are then usually served by what it just wrote
+            # ---------------------------------------------------------------
+            with _key_lock(cache_path):
+                df_cached = _load_cached_frame(cache_path)
+                if _serves(df_cached, max_records):
+                    return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
+
+                # -----------------------------------------------------------
+                # 3. Fallback to network / original function (with safety net)
+                # -----------------------------------------------------------
+                try:
+                    df_live = _run_sync(original_fn(self, *args, **kwargs))
+                except Exception:
+                    # Network or provider error – fallback to cache if we have anything
+                    if df_cached is not None and not df_cached.empty:
+                        return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
+                    raise
+                return _finish(df_cached, df_live, cache_path, max_records)
+
     # Inject the patched method
     CandlesFactory.get_candles_df = cached_get_candles_df  # type: ignore[assignment]
     CandlesFactory._hb_cached = True  # type: ignore[attr-defined]
@@ -201,32 +325,29 @@ def _patch_backtesting_data_provider() -> None:
             return original_fn(self, *args, **kwargs)
 
         cache_path = _build_cache_key(connector, trading_pair, interval)
-        df_cached: Optional[pd.DataFrame] = None
-        if cache_path.exists():
-            try:
-                df_cached = pd.read_parquet(cache_path)
-                df_cached = df_cached[~df_cached.index.duplicated(keep="last")].sort_index()
-            except Exception:
-                cache_path.unlink(missing_ok=True)
-                df_cached = None
+        df_cached = _load_cached_frame(cache_path)
 
-        if df_cached is not None and not df_cached.empty and (
-            max_records is None or len(df_cached) >= max_records
-        ):
+        if _serves(df_cached, max_records):
             return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
 
-        # Fallback to network / original function
-        df_live = original_fn(self, *args, **kwargs)
-        if df_live is None:
+        with _key_lock(cache_path):
+            # Another caller may have populated the cache while we waited
+            df_cached = _load_cached_frame(cache_path)
+            if _serves(df_cached, max_records):
+                return df_cached.iloc[-max_records:] if max_records else df_cached.copy()
+
+            # Fallback to network / original function
+            df_live = original_fn(self, *args, **kwargs)
+            if df_live is None:
+                return df_live
+            try:
+                if df_cached is None:
+                    _merge_and_save(pd.DataFrame(), df_live, cache_path)
+                else:
+                    _merge_and_save(df_cached, df_live, cache_path)
+            except Exception:
+                pass
             return df_live
-        try:
-            if df_cached is None:
-                _merge_and_save(pd.DataFrame(), df_live, cache_path)
-            else:
-                _merge_and_save(df_cached, df_live, cache_path)
-        except Exception:
-            pass
-        return df_live
 
     BacktestingDataProvider.get_candles_df = cached_get_candles_df  # type: ignore[assignment]
     # Ensure the wrapper is treated as a regular function, not coroutine
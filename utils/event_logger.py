@@ -7,39 +7,125 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, List
 import json
+import threading
 
 import pandas as pd
 
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+    pacsv = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+# Placeholder for "row had no such key" in padded columns (distinct from a real None)
+_ABSENT = object()
+
+
+def _write_csv(columns: Dict[str, List[Any]], out_csv: Path) -> None:
+    """Write *columns* as CSV, via pyarrow's C writer when the columns convert cleanly."""
+    if pacsv is not None:
+        try:
+            table = pa.table(columns)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None  # mixed-type column – let pandas stringify it
+        if table is not None:
+            pacsv.write_csv(table, str(out_csv))
+            return
+    pd.DataFrame(columns).to_csv(out_csv, index=False, float_format='%.8f')
+
+
+def _write_json(rows: List[Dict[str, Any]], out_json: Path) -> None:
+    if orjson is not None:
+        out_json.write_bytes(orjson.dumps(
+            rows, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ))
+        return
+    with out_json.open("w") as fp:
+        json.dump(rows, fp, indent=2, default=str)
+
+
+class _EventBuffer(threading.local):
+    """Per-thread event columns (one list per field, all the same length)."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.columns: Dict[str, List[Any]] = {}
+        self.nrows = 0
+        self.sparse: set[str] = set()  # columns holding _ABSENT padding
+
 
 class BTEventLogger:
     """Thread-local store for event rows (so concurrent back-tests don't mix logs)."""
 
-    _events: list[Dict[str, Any]] | None = None
+    # Column-oriented so dump() can hand the lists straight to Arrow/pandas
+    # instead of re-hashing every row dict; one buffer per thread.
+    _buf = _EventBuffer()
 
     # ---------------------------------------------------------------------
     # Public helpers
     # ---------------------------------------------------------------------
     @classmethod
     def add(cls, **row: Any):
-        if cls._events is None:
-            cls._events = []
-        cls._events.append(row)
+        cls.add_many([row])
+
+    @classmethod
+    def add_many(cls, rows: List[Dict[str, Any]]):
+        """Append pre-built event rows in one call."""
+        buf = cls._buf
+        cols = buf.columns
+        n = buf.nrows
+        for row in rows:
+            for k, v in row.items():
+                col = cols.get(k)
+                if col is None:
+                    col = cols[k] = [_ABSENT] * n
+                    if n:
+                        buf.sparse.add(k)
+                col.append(v)
+            n += 1
+            if len(row) != len(cols):
+                for k, col in cols.items():
+                    if len(col) < n:
+                        col.append(_ABSENT)
+                        buf.sparse.add(k)
+        buf.nrows = n
+
+    @classmethod
+    def columns(cls) -> Dict[str, List[Any]]:
+        """Events as ``{field: values}``; fields a row did not set read as None."""
+        buf = cls._buf
+        return {
+            k: [None if v is _ABSENT else v for v in col] if k in buf.sparse else col
+            for k, col in buf.columns.items()
+        }
 
     @classmethod
     def rows(cls) -> List[Dict[str, Any]]:
-        return cls._events or []
+        buf = cls._buf
+        cols = buf.columns
+        return [
+            {k: col[i] for k, col in cols.items() if col[i] is not _ABSENT}
+            for i in range(buf.nrows)
+        ]
 
     @classmethod
     def clear(cls):
-        cls._events = []
+        cls._buf.reset()
 
     @classmethod
     def dump(cls, out_csv: Path):
-        if not cls.rows():
+        if not cls._buf.nrows:
             return None
         out_csv.parent.mkdir(parents=True, exist_ok=True)
-        df = pd.DataFrame(cls.rows())
-        df.to_csv(out_csv, index=False, float_format='%.8f')
-        with out_csv.with_suffix(".json").open("w") as fp:
-            json.dump(cls.rows(), fp, indent=2, default=str)
-        return out_csv 
\ No newline at end of file
+        _write_csv(cls.columns(), out_csv)
+        _write_json(cls.rows(), out_csv.with_suffix(".json"))
+        return out_csv
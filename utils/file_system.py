@@ -5,15 +5,16 @@ import os
 import shutil
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
-import yaml
 from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import DirectionalTradingControllerConfigBase
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 
+from utils import yaml_fast
+
 
 class FileSystemUtil:
     """
@@ -21,6 +22,10 @@ class FileSystemUtil:
     as well as dynamic loading of script configurations.
     """
     base_path: str = "bots"  # Default base path
+    # dir path -> (dir mtime_ns, file names); adding/removing entries bumps the dir mtime
+    _listing_cache: Dict[str, Tuple[int, List[str]]] = {}
+    # module name -> source mtime_ns when it was last (re)imported by the config-class loaders
+    _module_mtimes: Dict[str, int] = {}
 
     def __init__(self, base_path: Optional[str] = None):
         """
@@ -38,7 +43,14 @@ class FileSystemUtil:
         """
         excluded_files = ["__init__.py", "__pycache__", ".DS_Store", ".dockerignore", ".gitignore"]
         dir_path = os.path.join(self.base_path, directory)
-        return [f for f in os.listdir(dir_path) if os.path.isfile(os.path.join(dir_path, f)) and f not in excluded_files]
+        mtime = os.stat(dir_path).st_mtime_ns
+        hit = self._listing_cache.get(dir_path)
+        if hit is not None and hit[0] == mtime:
+            return list(hit[1])
+        with os.scandir(dir_path) as it:
+            files = [e.name for e in it if e.is_file() and e.name not in excluded_files]
+        self._listing_cache[dir_path] = (mtime, files)
+        return list(files)
 
     def list_folders(self, directory: str) -> List[str]:
         """
@@ -125,6 +137,22 @@ class FileSystemUtil:
         with open(file_path, 'w') as file:
             file.write(content)
 
+    def add_file_from_stream(self, directory: str, file_name: str, stream: BinaryIO, override: bool = False):
+        """
+        Adds a file to a specified directory by copying a binary stream in 1 MiB chunks.
+        :param directory: The directory to add the file to.
+        :param file_name: The name of the file to be added.
+        :param stream: Readable binary file object (e.g. an UploadFile's ``.file``).
+        :param override: If True, override the file if it exists.
+        """
+        file_path = os.path.join(self.base_path, directory, file_name)
+        try:
+            # "x" (O_EXCL) makes the existence check and the create a single atomic step
+            with open(file_path, 'wb' if override else 'xb') as file:
+                shutil.copyfileobj(stream, file, length=1 << 20)
+        except FileExistsError:
+            raise FileExistsError(f"File '{file_name}' already exists in '{directory}'.")
+
     def append_to_file(self, directory: str, file_name: str, content: str):
         """
         Appends content to a specified file.
@@ -144,7 +172,7 @@ class FileSystemUtil:
         :param filename: The file to dump the dictionary into.
         """
         with open(filename, 'w') as file:
-            yaml.dump(data_dict, file)
+            yaml_fast.safe_dump(data_dict, file)
 
     @staticmethod
     def read_yaml_file(file_path):
@@ -154,7 +182,7 @@ class FileSystemUtil:
         :return: Dictionary containing the YAML file data.
         """
         with open(file_path, 'r') as file:
-            data = yaml.safe_load(file)
+            data = yaml_fast.safe_load(file)
         return data
 
     @staticmethod
@@ -167,10 +195,7 @@ class FileSystemUtil:
         try:
             # Assuming scripts are in a package named 'scripts'
             module_name = f"bots.scripts.{script_name.replace('.py', '')}"
-            if module_name not in sys.modules:
-                script_module = importlib.import_module(module_name)
-            else:
-                script_module = importlib.reload(sys.modules[module_name])
+            script_module = FileSystemUtil._import_fresh(module_name, importlib.import_module)
 
             # Find the subclass of BaseClientModel in the module
             for _, cls in inspect.getmembers(script_module, inspect.isclass):
@@ -180,6 +205,29 @@ class FileSystemUtil:
             print(f"Error loading script class: {e}")  # Handle or log the error appropriately
         return None
 
+    @staticmethod
+    def _import_fresh(module_name: str, importer):
+        """Return *module_name*, importing it via *importer* on first use and reloading it
+        only when its source file changed since the last (re)import."""
+        def _mtime(module) -> Optional[int]:
+            try:
+                return os.stat(module.__file__).st_mtime_ns
+            except (AttributeError, TypeError, OSError):
+                return None
+
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importer(module_name)
+        else:
+            mtime = _mtime(module)
+            if mtime is not None and mtime == FileSystemUtil._module_mtimes.get(module_name):
+                return module
+            module = importlib.reload(module)
+        mtime = _mtime(module)
+        if mtime is not None:
+            FileSystemUtil._module_mtimes[module_name] = mtime
+        return module
+
     @staticmethod
     def _create_stub(name: str):
         """Create an empty stub module and register it (recursively) in sys.modules."""
@@ -231,10 +279,7 @@ class FileSystemUtil:
             except Exception:
                 pass
 
-            if module_name not in sys.modules:
-                script_module = FileSystemUtil._import_with_stubs(module_name)
-            else:
-                script_module = importlib.reload(sys.modules[module_name])
+            script_module = FileSystemUtil._import_fresh(module_name, FileSystemUtil._import_with_stubs)
 
             candidates = []
             for _, cls in inspect.getmembers(script_module, inspect.isclass):
@@ -0,0 +1,139 @@
+"""utils.yaml_cache – memoised YAML loading for sweep files
+
+Sweep runs parse the same handful of ``*_sweep.yml`` files over and over
+(``C_multi_yml_to_backtests`` per run, ``A_yml_to_json`` per CLI call).
+``load_yaml`` keeps parsed documents in a small in-process LRU keyed by
+``(path, mtime, size)`` and, across processes, in a JSON sidecar under
+``data/yaml_cache`` so a cold start only re-parses files that changed.
+
+The sidecar is plain JSON so reading it can never execute code.  Dates are
+the one thing ``yaml.safe_load`` returns for sweep files that JSON cannot hold
+(``start: 2024-03-11`` → ``datetime.date``); they are stored as
+``{"__date__": "2024-03-11"}``.  Documents with anything else JSON cannot
+round-trip (non-string keys, binary, …) simply get no sidecar.
+
+In-process, each document is held as a pickled blob that this process wrote
+itself: every hit hands out a fresh ``pickle.loads`` copy, which is several
+times cheaper than ``copy.deepcopy``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+from datetime import date, datetime
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Tuple
+
+from utils.yaml_fast import safe_load
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+MAX_ENTRIES = 100
+SIDECAR_DIR = Path("data/yaml_cache")
+
+_CACHE: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Helper utilities
+# ---------------------------------------------------------------------------
+
+def _sidecar_path(key: str) -> Path:
+    """Return the sidecar file for the resolved path *key*."""
+    return SIDECAR_DIR / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+
+
+def _tag(obj: Any) -> Any:
+    """Return *obj* as plain JSON data, tagging dates; ``TypeError`` if it cannot round-trip."""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, datetime):
+        raise TypeError("datetime values are not cached")
+    if isinstance(obj, date):
+        return {"__date__": obj.isoformat()}
+    if isinstance(obj, list):
+        return [_tag(v) for v in obj]
+    if isinstance(obj, dict):
+        if not all(isinstance(k, str) for k in obj):
+            raise TypeError("non-string mapping key")
+        if "__date__" in obj:
+            raise TypeError("reserved key __date__")
+        return {k: _tag(v) for k, v in obj.items()}
+    raise TypeError(f"unsupported type {type(obj).__name__}")
+
+
+def _untag(obj: dict) -> Any:
+    """``json.loads`` object hook reversing :func:`_tag`."""
+    if len(obj) == 1 and "__date__" in obj:
+        return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+def _read_sidecar(key: str, mtime_ns: int, size: int) -> Tuple[bool, Any]:
+    """Return ``(True, document)`` when a sidecar for *key* matches *mtime_ns*/*size*, else ``(False, None)``."""
+    try:
+        entry = json.loads(_sidecar_path(key).read_bytes(), object_hook=_untag)
+        if (entry["key"], entry["mtime_ns"], entry["size"]) == (key, mtime_ns, size):
+            return True, entry["doc"]
+    except Exception:
+        pass
+    return False, None
+
+
+def _write_sidecar(key: str, mtime_ns: int, size: int, data: Any) -> None:
+    """Best-effort write of the sidecar for *key* (never fatal)."""
+    try:
+        text = json.dumps({"key": key, "mtime_ns": mtime_ns, "size": size, "doc": _tag(data)})
+        SIDECAR_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _sidecar_path(key).with_suffix(".tmp")
+        tmp.write_text(text)
+        tmp.replace(_sidecar_path(key))
+    except Exception:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def load_yaml(path: Path | str) -> Any:
+    """``yaml.safe_load(path.read_text())`` memoised on the file's mtime + size.
+
+    Callers receive a private copy, so mutating the result (as sweep expansion
+    does with ``base``/``meta``) never leaks into later loads.
+    """
+    path = Path(path)
+    key = str(path.resolve())
+    st = path.stat()
+    mtime_ns, size = st.st_mtime_ns, st.st_size
+
+    with _LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None and hit[0] == mtime_ns and hit[1] == size:
+            _CACHE.move_to_end(key)
+            return pickle.loads(hit[2])
+
+    found, data = _read_sidecar(key, mtime_ns, size)
+    if not found:
+        data = safe_load(path.read_text())
+        _write_sidecar(key, mtime_ns, size, data)
+    blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    with _LOCK:
+        _CACHE[key] = (mtime_ns, size, blob)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    return pickle.loads(blob)
+
+
+def clear() -> None:
+    """Drop the in-process cache (sidecars are left on disk)."""
+    with _LOCK:
+        _CACHE.clear()
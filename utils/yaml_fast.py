@@ -0,0 +1,28 @@
+"""utils.yaml_fast – libyaml-backed drop-ins for ``yaml.safe_load`` / ``yaml.safe_dump``
+
+PyYAML's default loaders/dumpers are pure Python.  When PyYAML is built with
+libyaml, ``CSafeLoader`` / ``CSafeDumper`` have the same safe semantics at a
+fraction of the cost; otherwise these helpers fall back to the Python classes.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    SafeLoader = yaml.CSafeLoader
+    SafeDumper = yaml.CSafeDumper
+except AttributeError:  # pragma: no cover – PyYAML built without libyaml
+    SafeLoader = yaml.SafeLoader  # type: ignore[misc]
+    SafeDumper = yaml.SafeDumper  # type: ignore[misc]
+
+
+def safe_load(stream: Any) -> Any:
+    """``yaml.safe_load`` using the C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """``yaml.safe_dump`` using the C dumper when available (same keyword arguments)."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)